@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 10:05
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 一维装箱问题的arc-flow模型(Valério de Carvalho)，图中节点为可达的装载量
+# 适用于容量较小的实例，整个模型作为一个MIP求解
+from collections import Counter, defaultdict
+import time
+
+import numpy as np
+
+from lpBackend import get_backend, EQUAL, GREATER_EQUAL, INTEGER
+from solution import Solution
+from uti import Status
+
+
+class ArcFlow:
+    def __init__(self, instance, verbose=True, **kwargs):
+        self.instance = instance
+        self.verbose = verbose
+        self.backend = get_backend(kwargs.get('backend', None))  # LP后端，见lpBackend.BACKENDS
+        self.time_limit = kwargs.get('time_limit', None)
+        self.compress = kwargs.get('compress', True)  # 是否压缩图
+        self.incumbent = Solution()
+
+        # types = [(width, demand),...] 按尺寸降序排列的物品类型
+        self.types = sorted(Counter(item.width for item in instance.items).items(), reverse=True)
+        self.source, self.sink = 0, instance.capacity
+        self.nodes, self.arcs = None, None  # arcs = {(u, v, t)}, t为物品类型的索引，t = -1表示loss arc
+        self.model = None
+        self.lb = self.ub = None
+
+    def build_graph(self):
+        """
+        按尺寸降序依次添加物品类型，类型t的弧只从由不小于w_t的物品到达的节点出发，
+        且每条路径上类型t的物品数目不超过其需求b_t
+        """
+        capacity = self.instance.capacity
+        nodes, arcs = {self.source}, set()
+        for t, (w, b) in enumerate(self.types):
+            heads = set()
+            for u in nodes:
+                v = u
+                for _ in range(b):
+                    if v + w > capacity:
+                        break
+                    arcs.add((v, v + w, t))
+                    heads.add(v + w)
+                    v += w
+            nodes |= heads
+        nodes.add(self.sink)
+        self.nodes, self.arcs = nodes, arcs
+
+    def compress_graph(self):
+        """
+        将每个节点u重新标记为phi(u) = min{phi(v) - w_t: (u, v, t)}，phi(sink) = capacity，
+        即u之后的物品仍能装入的最大装载量，标记相同的节点被合并
+        每条弧满足phi(v) - phi(u) >= w_t，因此压缩后的每条路径仍是可行的pattern
+        """
+        out = defaultdict(list)
+        for u, v, t in self.arcs:
+            out[u].append((v, t))
+        phi = {}
+        for u in sorted(self.nodes, reverse=True):
+            phi[u] = min((phi[v] - self.types[t][0] for v, t in out[u]), default=self.sink)
+        self.source = phi[self.source]
+        self.nodes = set(phi.values())
+        self.arcs = {(phi[u], phi[v], t) for u, v, t in self.arcs}
+
+    def add_loss_arcs(self):
+        # 相邻节点之间添加loss arc
+        nodes = sorted(self.nodes)
+        for u, v in zip(nodes, nodes[1:]):
+            self.arcs.add((u, v, -1))
+
+    def build_model(self):
+        model = self.backend("arc-flow", time_limit=self.time_limit)
+        for u in sorted(self.nodes):
+            model.add_row(f"flow[{u}]", EQUAL, 0)  # 流入 - 流出 = 0
+        for t, (w, b) in enumerate(self.types):
+            model.add_row(f"demand[{w}]", GREATER_EQUAL, b)
+
+        # z为从source流出(流入sink)的总流量，即所用的箱子数
+        model.add_col("z", obj=1, coeffs={f"flow[{self.source}]": 1, f"flow[{self.sink}]": -1}, vtype=INTEGER)
+        for u, v, t in sorted(self.arcs):
+            coeffs = {f"flow[{u}]": -1, f"flow[{v}]": 1}
+            if t >= 0:
+                w, b = self.types[t]
+                coeffs[f"demand[{w}]"] = 1
+                model.add_col(f"f[{u},{v},{w}]", coeffs=coeffs, vtype=INTEGER, ub=b)
+            else:
+                model.add_col(f"f[{u},{v},loss]", coeffs=coeffs, vtype=INTEGER)
+        self.model = model
+
+    def decode(self, x):
+        """
+        将整数流分解为从source到sink的路径，每条路径对应一个箱子，并删除超出需求的物品
+        :param x: {col_name: value}
+        :return: [[item_id,...],...]
+        """
+        out = defaultdict(list)  # {u: [[v, t, flow],...]}
+        for u, v, t in self.arcs:
+            w = self.types[t][0] if t >= 0 else "loss"
+            flow = round(x[f"f[{u},{v},{w}]"])
+            if flow > 0:
+                out[u].append([v, t, flow])
+
+        pool = defaultdict(list)  # {width: [item_id,...]}
+        for item in self.instance.items:
+            pool[item.width].append(item.id)
+
+        bins = []
+        for _ in range(round(x["z"])):
+            u, packed = self.source, []
+            while u != self.sink:
+                arc = next(a for a in out[u] if a[2] > 0)
+                arc[2] -= 1
+                u, t = arc[0], arc[1]
+                if t >= 0 and pool[self.types[t][0]]:
+                    packed.append(pool[self.types[t][0]].pop())
+            if packed:
+                bins.append(packed)
+        return bins
+
+    def get_solution(self, bins):
+        """
+        使用与SearchTree相同的输出格式，即每个箱子对应一列x[k]及其中的item id
+        """
+        columns = [f"x[{k}]" for k in range(1, len(bins) + 1)]
+        solutions = {name: 1.0 for name in columns}
+        return Solution(len(bins), solutions, [np.array(b, dtype=np.int64) for b in bins], columns)
+
+    def solve(self):
+        start_time = time.time()
+        self.build_graph()
+        if self.verbose:
+            print(f"arc-flow graph: {len(self.nodes)} nodes and {len(self.arcs)} arcs")
+        if self.compress:
+            self.compress_graph()
+            if self.verbose:
+                print(f"compressed graph: {len(self.nodes)} nodes and {len(self.arcs)} arcs")
+        self.add_loss_arcs()
+        self.build_model()
+        self.model.optimize()
+
+        x = self.model.get_primals()
+        if x is not None:
+            self.incumbent = self.get_solution(self.decode(x))
+            self.ub = self.incumbent.value
+            if self.model.get_status() == Status.OPTIMAL:
+                self.lb = self.ub
+        end_time = time.time()
+        if self.verbose:
+            print(f"\nSolved arc-flow model in {end_time - start_time}s\n"
+                  f"objective value = {self.incumbent.value}")
+
+
+if __name__ == '__main__':
+    pass
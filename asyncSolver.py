@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 21:10
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# asyncio接口：SearchTree.solve在线程池中运行，求解过程中的事件(node、bound、incumbent等，字段与trace相同)
+# 通过asyncio.Queue传回事件循环，incumbent事件中附带原实例中的箱子，可以在证明最优性之前使用
+# 取消solve()所在的task或调用cancel()后，搜索在下一个节点或列生成迭代之前停止
+# 多个求解并发运行时建议使用backend='highs'，gurobipy的默认环境不能在线程之间同时使用
+#
+# solver = AsyncSolver(instance, backend='highs', time_limit=60)
+# task = asyncio.create_task(solver.solve())
+# async for event in solver.events():
+#     if event['event'] == 'incumbent':
+#         print(event['value'], event['bins'])
+# tree = await task
+import asyncio
+import threading
+
+from searchTree import SearchTree
+
+_DONE = object()  # 事件队列的结束标记
+
+
+class AsyncSolver:
+    def __init__(self, instance, executor=None, **kwargs):
+        """
+        :param instance: Instance
+        :param executor: concurrent.futures.Executor，默认为事件循环的默认线程池
+        :param kwargs: 传给SearchTree的其他参数，不能包含callback和cancel
+        """
+        self.instance = instance
+        self.executor = executor
+        self.kwargs = kwargs
+        self.cancel_event = threading.Event()
+        self.queue = asyncio.Queue()
+        self.loop = None
+        self.tree = None
+
+    def on_event(self, record):
+        # 在求解线程中调用
+        if record['event'] == 'incumbent':
+            record['bins'] = self.tree.restored_bins()
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, record)
+
+    def run(self):
+        self.tree = SearchTree(self.instance, verbose=False, callback=self.on_event, cancel=self.cancel_event,
+                               **self.kwargs)
+        self.tree.solve()
+        return self.tree
+
+    async def solve(self):
+        """
+        :return: 求解结束(或被cancel()停止)后的SearchTree
+        """
+        if self.loop is not None:
+            raise RuntimeError("AsyncSolver.solve() can only be called once")
+        self.loop = asyncio.get_running_loop()
+        future = self.loop.run_in_executor(self.executor, self.run)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # 线程无法被强制停止，通知搜索停止并等待其返回
+            self.cancel_event.set()
+            await asyncio.wait([future])
+            raise
+        finally:
+            self.queue.put_nowait(_DONE)
+
+    def cancel(self):
+        """
+        停止搜索，solve()正常返回当前的最佳可行解
+        """
+        self.cancel_event.set()
+
+    async def events(self):
+        """
+        :return: async generator of events，solve()结束后停止
+        """
+        while True:
+            record = await self.queue.get()
+            if record is _DONE:
+                self.queue.put_nowait(_DONE)  # 其他消费者同样可以结束
+                return
+            yield record
+
+    def __aiter__(self):
+        return self.events()
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 23:00
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 根据实例特征选择求解配置(SearchTree的参数)
+# 特征: 物品数、不同尺寸数、尺寸与容量之比的统计量、大物品(> C/2)的比例、每个箱子的平均物品数，
+#      以及first-fit decreasing与L2下界之差
+# 没有模型文件时使用内置规则；模型文件由calibrate.py根据基准测试结果生成，按k近邻选择平均时间最短的配置
+import json
+
+import numpy as np
+
+from heuristic import first_fit_decreasing
+from lowerBound import lower_bound
+
+FEATURES = ['n', 'distinct', 'ratio_mean', 'ratio_std', 'ratio_min', 'ratio_max', 'large_share',
+            'items_per_bin', 'gap']
+
+
+def features(instance):
+    """
+    :return: {name: float}，名字见FEATURES
+    """
+    widths, capacity = instance.widths, instance.capacity
+    if len(widths) == 0:
+        return dict.fromkeys(FEATURES, 0.0)
+    ratios = widths / capacity
+    lb = lower_bound(widths, capacity)
+    ub = len(first_fit_decreasing(widths.tolist(), capacity, instance.order.tolist()))
+    return {
+        'n': float(len(widths)),
+        'distinct': float(len(np.unique(widths))),
+        'ratio_mean': float(ratios.mean()),
+        'ratio_std': float(ratios.std()),
+        'ratio_min': float(ratios.min()),
+        'ratio_max': float(ratios.max()),
+        'large_share': float(np.mean(widths * 2 > capacity)),
+        'items_per_bin': float(len(widths) / lb),
+        'gap': float(ub - lb),
+    }
+
+
+def default_config(f):
+    """
+    内置规则
+    :param f: features()的结果
+    """
+    config = {}
+    if f['gap'] == 0:  # 启发式已经最优，不需要任何额外的设置
+        return config
+    if f['gap'] >= 2:
+        config['strategy'] = 'best'
+    return config
+
+
+def load_model(file_name):
+    """
+    :return: calibrate.py生成的模型，file_name为None时返回None
+    """
+    if file_name is None:
+        return None
+    with open(file_name) as file:
+        return json.load(file)
+
+
+def select_config(instance, model=None):
+    """
+    :param instance: Instance
+    :param model: load_model()的结果，None表示使用内置规则
+    :return: SearchTree的参数
+    """
+    f = features(instance)
+    if model is None or not model['samples']:
+        return default_config(f)
+    x = np.array([f[name] for name in model['features']])
+    scale = np.array(model['scale'])
+    samples = np.array([s['features'] for s in model['samples']])
+    distance = np.linalg.norm((samples - x) / scale, axis=1)
+    neighbors = np.argsort(distance, kind='stable')[:model.get('k', 3)]
+    scores = {}
+    for name in model['configs']:
+        times = [model['samples'][k]['times'].get(name) for k in neighbors]
+        scores[name] = np.mean([t if t is not None else model['penalty'] for t in times])
+    best = min(scores, key=scores.get)
+    return dict(model['configs'][best])
+
+
+if __name__ == '__main__':
+    pass
@@ -17,6 +17,8 @@ from copy import copy
 import re
 import math
 
+from lowerBound import DualFeasibleFunction
+
 Item = namedtuple("Item", "id width height processing_time")
 EPS = 1e-6
 
@@ -295,66 +297,6 @@ class BinPacking(BasicModel):
         return m
 
 
-class DualFeasibleFunction:
-    def __init__(self):
-        pass
-
-    @ staticmethod
-    def u1(x):
-        assert 0 <= x <= 1, "超出边界"
-        if abs(x-0.5) <= EPS:
-            return 0.5
-        elif x < 0.5:
-            return 0
-        elif x > 0.5:
-            return 1
-
-    @staticmethod
-    def U(rho, x):
-        assert 0 <= x <= 1, "超出边界"
-        assert 0 < rho <= 0.5, "超出边界"
-        if x > 1 - rho:
-            return 1
-        elif x < rho:
-            return 0
-        else:
-            return x
-
-    @staticmethod
-    def phi(rho, x):
-        assert 0 <= x <= 1, "超出边界"
-        assert 0 < rho <= 0.5, "超出边界"
-        if x > 1 - rho:
-            return 1 - math.floor((1 - x) / rho) / math.floor(1 / rho)
-        elif x < rho:
-            return 0
-        else:
-            return 1 / math.floor(1 / rho)
-
-    def omega(self, index, p, w, h, q=None):
-        assert index in (1, 2, 3, 4, 5, 6, 7), "超出边界"
-        assert 0 < p <= 0.5, "p应在(0, 0.5]"
-        assert 0 < w <= 1, "w应在(0, 1]"
-        assert 0 < h <= 1, "h应在(0, 1]"
-
-        if index == 1:
-            return self.u1(w) * self.U(p, h)
-        elif index == 2:
-            return self.U(p, w) * self.u1(h)
-        elif index == 3:
-            return self.u1(w) * self.phi(p, h)
-        elif index == 4:
-            return self.phi(p, w) * self.u1(h)
-        elif index == 5:
-            return w * self.U(p, h)
-        elif index == 6:
-            return self.U(p, w) * h
-        elif index == 7:
-            assert q is not None, "q尚未赋值"
-            assert 0 < q <= 0.5, "q应在(0, 0.5]"
-            return self.phi(p, w) * self.phi(q, h)
-
-
 class BinPacking2(BinPacking, Orthogonal):
     """
     two-dimensional bin packing
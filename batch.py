@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 16:00
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 批量求解：在进程池中并行求解大量实例，每个实例完成后立即以JSONL格式输出结果
+# 用法: python batch.py "instances/*.txt" --processes 8 --time-limit 10 --out results.jsonl
+#       python batch.py orders.jsonl  (每行 {"name": ..., "capacity": ..., "widths": [...]})
+import argparse
+import json
+import sys
+import time
+from multiprocessing import Pool
+
+from instance import Instance
+from lpBackend import get_backend, GurobiBackend, start_gurobi_env
+import benchmark
+import reader
+from solutionCache import SolutionCache
+
+_config, _time_limit, _cache = None, None, None  # 工作进程内的求解配置
+
+
+def iter_jobs(source):
+    """
+    :param source: 实例文件、目录、glob模式(格式见reader)、JSONL文件('-'表示标准输入)或由job组成的可迭代对象
+    :return: generator of jobs, {'name': ..., 'file': ...} 或 {'name': ..., 'capacity': ..., 'widths': [...]}
+    """
+    if not isinstance(source, str):
+        yield from source
+    elif source == '-' or source.endswith('.jsonl'):
+        file = sys.stdin if source == '-' else open(source)
+        try:
+            for k, line in enumerate(file):
+                if line.strip():
+                    job = json.loads(line)
+                    job.setdefault('name', str(k))
+                    yield job
+        finally:
+            if file is not sys.stdin:
+                file.close()
+    else:
+        for name, capacity, widths in reader.read_all(source):
+            yield {'name': name, 'capacity': capacity, 'widths': [int(w) for w in widths]}
+
+
+def load_job(job):
+    if 'file' in job:
+        return Instance(job['file'])
+    return Instance(widths=job['widths'], capacity=job['capacity'], name=job['name'])
+
+
+def init_worker(config, time_limit, cache_file=None):
+    """
+    每个工作进程只初始化一次：保存配置，打开最优解缓存，并为Gurobi后端创建共享的环境
+    """
+    global _config, _time_limit, _cache
+    _config, _time_limit = config, time_limit
+    _cache = SolutionCache(cache_file) if cache_file is not None else None
+    if get_backend(config.get('backend', None)) is GurobiBackend:
+        start_gurobi_env()
+
+
+def solve_job(job):
+    start = time.time()
+    result = {'name': job['name']}
+    try:
+        result.update(benchmark.solve(load_job(job), _config, _time_limit, _cache))
+    except Exception as e:  # 单个实例出错不影响其他实例
+        result.update({'error': repr(e), 'time': time.time() - start})
+    return result
+
+
+def solve_batch(source, processes=None, time_limit=None, config=None, chunksize=1, cache_file=None):
+    """
+    :param source: 见iter_jobs
+    :param processes: 进程数，默认为CPU核数
+    :param time_limit: 每个实例的求解时间限制(s)，在节点之间检查
+    :param config: 求解配置，见benchmark.CONFIGS
+    :param chunksize: 每次分配给工作进程的实例数，实例较小时可适当增大
+    :param cache_file: 最优解缓存文件，见solutionCache，None表示不使用缓存
+    :return: generator of results in the order they finish
+    """
+    config = config if config is not None else benchmark.CONFIGS['default']
+    with Pool(processes, initializer=init_worker, initargs=(config, time_limit, cache_file)) as pool:
+        yield from pool.imap_unordered(solve_job, iter_jobs(source), chunksize)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many 1D-BPP instances in parallel")
+    parser.add_argument('source',
+                        help="instance file or archive, directory, glob pattern, JSONL file or '-' for JSONL on stdin")
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--time-limit', type=float, default=None)
+    parser.add_argument('--config', default='default',
+                        help=f"a name in {sorted(benchmark.CONFIGS)} or a JSON object of solver kwargs")
+    parser.add_argument('--chunksize', type=int, default=1)
+    parser.add_argument('--out', default=None, help="JSONL output file, default stdout")
+    parser.add_argument('--solution-cache', default=None, help="SQLite file caching optimal solutions across runs")
+    args = parser.parse_args(argv)
+
+    config = benchmark.CONFIGS[args.config] if args.config in benchmark.CONFIGS else json.loads(args.config)
+    out = open(args.out, 'w') if args.out is not None else sys.stdout
+    try:
+        for result in solve_batch(args.source, args.processes, args.time_limit, config, args.chunksize,
+                                  args.solution_cache):
+            out.write(json.dumps(result) + '\n')
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 14:10
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 基准测试：标准实例类的生成器(固定随机种子)以及按配置求解实例矩阵的回归测试
+# 用法: python benchmark.py --classes falkenauer_u schwerin --seeds 0 1 2 --configs default arcflow
+#       --out results.json --baseline baseline.json
+import argparse
+import cProfile
+import csv
+import json
+import random
+import sys
+import time
+
+from instance import Instance
+from searchTree import SearchTree
+from arcFlow import ArcFlow
+import autoConfig
+
+
+def make_instance(widths, capacity):
+    return Instance(widths=widths, capacity=capacity)
+
+
+def falkenauer_u(seed, n=120):
+    # Falkenauer uniform: C = 150, w ~ U[20, 100]
+    rnd = random.Random(seed)
+    return make_instance([rnd.randint(20, 100) for _ in range(n)], 150)
+
+
+def falkenauer_t(seed, n=60):
+    # Falkenauer triplet: C = 1000, 每个箱子恰好装入3个尺寸在[250, 500)内的物品，最优值为n / 3
+    rnd = random.Random(seed)
+    capacity, widths = 1000, []
+    for _ in range(n // 3):
+        a = rnd.randint(380, 490)
+        b = rnd.randint(250, (capacity - a) // 2)
+        widths += [a, b, capacity - a - b]
+    rnd.shuffle(widths)
+    return make_instance(widths, capacity)
+
+
+def scholl_1(seed, n=50, capacity=100, low=1, high=100):
+    # Scholl class 1: C in {100, 120, 150}, w ~ U[1, 100], U[20, 100] or U[30, 100]
+    rnd = random.Random(seed)
+    return make_instance([rnd.randint(low, high) for _ in range(n)], capacity)
+
+
+def scholl_2(seed, n=50, b=3, delta=0.2):
+    # Scholl class 2: C = 1000, 平均尺寸为C / b (b in {3, 5, 7, 9})，偏差delta in {0.2, 0.5, 0.9}
+    rnd = random.Random(seed)
+    capacity = 1000
+    avg = capacity / b
+    low, high = max(1, round(avg * (1 - delta))), round(avg * (1 + delta))
+    return make_instance([rnd.randint(low, high) for _ in range(n)], capacity)
+
+
+def scholl_3(seed, n=200):
+    # Scholl class 3 (hard): C = 100000, w ~ U[20000, 35000]
+    rnd = random.Random(seed)
+    return make_instance([rnd.randint(20000, 35000) for _ in range(n)], 100000)
+
+
+def schwerin(seed, n=100):
+    # Schwerin and Wascher: C = 1000, w ~ U[150, 200]
+    rnd = random.Random(seed)
+    return make_instance([rnd.randint(150, 200) for _ in range(n)], 1000)
+
+
+def hard28(seed, n=None):
+    # 模仿hard28的结构(hard28本身为固定的实例库)：C = 1000, n in [160, 200]，
+    # 大部分物品尺寸在[C/4, C/2]之间，其余物品尺寸分布较分散
+    rnd = random.Random(seed)
+    capacity = 1000
+    n = n if n is not None else rnd.randint(160, 200)
+    widths = [rnd.randint(capacity // 4, capacity // 2) if rnd.random() < 0.7 else rnd.randint(1, 800)
+              for _ in range(n)]
+    return make_instance(widths, capacity)
+
+
+CLASSES = {
+    'falkenauer_u': falkenauer_u,
+    'falkenauer_t': falkenauer_t,
+    'scholl_1': scholl_1,
+    'scholl_2': scholl_2,
+    'scholl_3': scholl_3,
+    'schwerin': schwerin,
+    'hard28': hard28,
+}
+
+# 求解配置 {name: kwargs}，engine为'bp'(SearchTree)、'auto'(按autoConfig选择参数的SearchTree，
+# model为calibrate.py生成的模型文件)或'arcflow'(ArcFlow)，其余参数传给求解器
+CONFIGS = {
+    'default': {'engine': 'bp'},
+    'auto': {'engine': 'auto'},
+    'highs': {'engine': 'bp', 'backend': 'highs'},
+    'no_reduce': {'engine': 'bp', 'reduce': False},
+    'arcflow': {'engine': 'arcflow'},
+}
+
+FIELDS = ['class', 'seed', 'config', 'n', 'capacity', 'value', 'lb', 'ub', 'gap', 'time', 'nodes',
+          'cg_iterations', 'pricing_time', 'cached']
+
+
+def solve(instance, config, time_limit=None, cache=None):
+    """
+    :param cache: solutionCache.SolutionCache，只用于分支定价
+    :return: {field: value} 求解结果，字段见FIELDS
+    """
+    kwargs = {key: value for key, value in config.items() if key not in ('engine', 'model')}
+    start = time.time()
+    if config.get('engine', 'bp') == 'auto':
+        kwargs = {**autoConfig.select_config(instance, autoConfig.load_model(config.get('model'))), **kwargs}
+    if config.get('engine', 'bp') == 'arcflow':
+        solver = ArcFlow(instance, verbose=False, time_limit=time_limit, **kwargs)
+        solver.solve()
+        nodes, iterations, pricing_time = 0, 0, 0
+    elif cache is not None:
+        solution, solver = cache.solve(instance, time_limit=time_limit, **kwargs)
+        if solver is None:  # 命中缓存
+            return {'n': instance.n, 'capacity': instance.capacity, 'value': solution.value, 'lb': solution.value,
+                    'ub': solution.value, 'gap': 0.0, 'time': time.time() - start, 'nodes': 0, 'cg_iterations': 0,
+                    'pricing_time': 0, 'cached': True}
+        nodes, iterations = solver.n_nodes, solver.stats.counters['cg_iterations']
+        pricing_time = sum(value for key, value in solver.stats.timers.items() if key.startswith('pricing.'))
+    else:
+        solver = SearchTree(instance, verbose=False, time_limit=time_limit, **kwargs)
+        solver.solve()
+        nodes, iterations = solver.n_nodes, solver.stats.counters['cg_iterations']
+        pricing_time = sum(value for key, value in solver.stats.timers.items() if key.startswith('pricing.'))
+    elapsed = time.time() - start
+
+    lb, ub = solver.lb, solver.ub
+    gap = (ub - lb) / ub if lb is not None and ub else None
+    return {'n': instance.n, 'capacity': instance.capacity, 'value': solver.incumbent.value, 'lb': lb, 'ub': ub,
+            'gap': gap, 'time': elapsed, 'nodes': nodes, 'cg_iterations': iterations,
+            'pricing_time': pricing_time, 'cached': False}
+
+
+def run(classes, seeds, configs, time_limit=None, n=None, verbose=True):
+    results = []
+    for class_name in classes:
+        for seed in seeds:
+            instance = CLASSES[class_name](seed) if n is None else CLASSES[class_name](seed, n=n)
+            for config_name, config in configs.items():
+                result = {'class': class_name, 'seed': seed, 'config': config_name}
+                result.update(solve(instance, config, time_limit))
+                results.append(result)
+                if verbose:
+                    print(f"{class_name}\tseed={seed}\t{config_name}\tvalue={result['value']}\t"
+                          f"gap={result['gap']}\ttime={result['time']:.3f}s\tnodes={result['nodes']}")
+    return results
+
+
+def write_results(results, file_name):
+    if file_name.endswith('.csv'):
+        with open(file_name, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        with open(file_name, 'w') as file:
+            json.dump(results, file, indent=1)
+
+
+def compare(results, baseline, tolerance=0.2, min_time=0.5):
+    """
+    与基准结果比较，返回所有回归：目标值变差，或求解时间超过基准时间的(1 + tolerance)倍
+    时间均小于min_time秒的实例不比较时间
+    :return: [str,...]
+    """
+    reference = {(r['class'], r['seed'], r['config']): r for r in baseline}
+    regressions = []
+    for r in results:
+        key = (r['class'], r['seed'], r['config'])
+        if key not in reference:
+            continue
+        b = reference[key]
+        if b['value'] is not None and (r['value'] is None or r['value'] > b['value']):
+            regressions.append(f"{key}: value {b['value']} -> {r['value']}")
+        if max(r['time'], b['time']) >= min_time and r['time'] > b['time'] * (1 + tolerance):
+            regressions.append(f"{key}: time {b['time']:.3f}s -> {r['time']:.3f}s")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the 1D-BPP solvers on generated instance classes")
+    parser.add_argument('--classes', nargs='+', default=['falkenauer_u'], choices=sorted(CLASSES))
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0])
+    parser.add_argument('--configs', nargs='+', default=['default'],
+                        help=f"names in {sorted(CONFIGS)} or a JSON file {{name: kwargs}}")
+    parser.add_argument('--n', type=int, default=None, help="number of items, default depends on the class")
+    parser.add_argument('--time-limit', type=float, default=None)
+    parser.add_argument('--out', default=None, help="write results to a .json or .csv file")
+    parser.add_argument('--baseline', default=None, help="JSON results to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--profile', action='store_true', help="profile the run with cProfile")
+    args = parser.parse_args(argv)
+
+    configs = {}
+    for name in args.configs:
+        if name.endswith('.json'):
+            with open(name) as file:
+                configs.update(json.load(file))
+        else:
+            configs[name] = CONFIGS[name]
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        results = profiler.runcall(run, args.classes, args.seeds, configs, args.time_limit, args.n)
+        profiler.print_stats(sort='cumulative')
+    else:
+        results = run(args.classes, args.seeds, configs, args.time_limit, args.n)
+
+    if args.out is not None:
+        write_results(results, args.out)
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
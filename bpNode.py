@@ -17,10 +17,11 @@ class Node:
         # q = {(id1, id2): {1, 2,},...}存储所有仅包含这两个items其中之一的列序号
         self.p, self.q = kwargs.get("p", {}), kwargs.get("q", {})
         self.solution = kwargs.get("solution", None)
+        self.decisions = kwargs.get("decisions", [])  # [(id1, id2, value),...] 从根节点到该节点的分支决策
 
     def __copy__(self):
         return Node(copy.copy(self.rmp), p=copy.deepcopy(self.p), q=copy.deepcopy(self.q),
-                    solution=self.solution)
+                    solution=self.solution, decisions=list(self.decisions))
 
     def get_solution(self):
         if self.solution is None:
@@ -34,15 +35,17 @@ class Node:
             self.update_pq(c, var_num)
 
     def update_pq(self, coe, var_num):
-        items = self.rmp.data.items
-        for i, item in enumerate(items):
-            for j, _item in enumerate(items):
-                if i < j:
-                    if coe[i] == 1 and coe[j] == 1:
-                        self.p.setdefault((item.id, _item.id), set()).add(var_num)
-
-                    elif coe[i] + coe[j] == 1:
-                        self.q.setdefault((item.id, _item.id), set()).add(var_num)
+        ids = self.rmp.data.ids.tolist()
+        # 只遍历列中包含的物品，键中两个item id按在items中的顺序排列
+        packed = [i for i in range(len(ids)) if coe[i] == 1]
+        packed_set = set(packed)
+        for a, i in enumerate(packed):
+            for j in packed[a + 1:]:
+                self.p.setdefault((ids[i], ids[j]), set()).add(var_num)
+            for j in range(len(ids)):
+                if j not in packed_set:
+                    key = (ids[i], ids[j]) if i < j else (ids[j], ids[i])
+                    self.q.setdefault(key, set()).add(var_num)
 
     def __le__(self, other):
         return self.solution.value <= other.solution.value + ComparisonEpsilon
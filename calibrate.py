@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 23:20
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 由基准测试学习autoConfig的配置选择模型：对每个实例计算特征，并以每个候选配置求解，
+# 记录求解时间(未在时间限制内证明最优性时记为None，选择时按penalty计)，结果写入JSON模型文件
+# 用法: python calibrate.py --classes falkenauer_u scholl_2 schwerin --seeds 0 1 2 --n 40
+#       --time-limit 30 --out autoconfig.json
+import argparse
+import json
+import sys
+
+import numpy as np
+
+import autoConfig
+import benchmark
+import race
+
+PENALTY_FACTOR = 10  # 未求解实例的时间记为时间限制的PENALTY_FACTOR倍(PAR10)
+
+
+def calibrate(classes, seeds, configs, time_limit, n=None, k=3, verbose=True):
+    """
+    :param configs: {name: SearchTree的参数}
+    :return: 模型，见autoConfig.select_config
+    """
+    samples = []
+    for class_name in classes:
+        for seed in seeds:
+            instance = benchmark.CLASSES[class_name](seed) if n is None else benchmark.CLASSES[class_name](seed, n=n)
+            f = autoConfig.features(instance)
+            times = {}
+            for name, config in configs.items():
+                result = benchmark.solve(instance, {'engine': 'bp', **config}, time_limit)
+                solved = result['lb'] is not None and result['ub'] is not None and result['lb'] >= result['ub']
+                times[name] = result['time'] if solved else None
+                if verbose:
+                    print(f"{class_name}\tseed={seed}\t{name}\ttime={result['time']:.3f}s\tsolved={solved}")
+            samples.append({'class': class_name, 'seed': seed,
+                            'features': [f[name] for name in autoConfig.FEATURES], 'times': times})
+    x = np.array([s['features'] for s in samples])
+    scale = x.std(axis=0) if len(samples) > 1 else np.ones(len(autoConfig.FEATURES))
+    return {'features': autoConfig.FEATURES, 'scale': np.where(scale > 0, scale, 1.0).tolist(), 'k': k,
+            'penalty': PENALTY_FACTOR * time_limit, 'configs': configs, 'samples': samples}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Learn the instance-feature to configuration mapping of autoConfig")
+    parser.add_argument('--classes', nargs='+', default=['falkenauer_u'], choices=sorted(benchmark.CLASSES))
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0, 1, 2])
+    parser.add_argument('--configs', nargs='+', default=list(race.PORTFOLIO),
+                        help=f"names in {sorted(race.PORTFOLIO)} or a JSON file {{name: kwargs}}")
+    parser.add_argument('--n', type=int, default=None, help="number of items, default depends on the class")
+    parser.add_argument('--time-limit', type=float, default=60)
+    parser.add_argument('--k', type=int, default=3, help="number of neighbours used by the selector")
+    parser.add_argument('--backend', default=None, help="LP backend shared by all configurations")
+    parser.add_argument('--out', default='autoconfig.json')
+    args = parser.parse_args(argv)
+
+    configs = {}
+    for name in args.configs:
+        if name.endswith('.json'):
+            with open(name) as file:
+                configs.update(json.load(file))
+        else:
+            configs[name] = dict(race.PORTFOLIO[name])
+    if args.backend is not None:
+        configs = {name: {'backend': args.backend, **config} for name, config in configs.items()}
+
+    model = calibrate(args.classes, args.seeds, configs, args.time_limit, args.n, args.k)
+    with open(args.out, 'w') as file:
+        json.dump(model, file, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 18:30
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 分支定价的断点文件(gzip压缩的JSON)，内容由SearchTree.checkpoint_state生成：
+# instance  原实例的容量、尺寸与item id
+# queue     未求解的节点，每个节点保存为从根节点开始的分支决策序列 [[id1, id2, value],...]
+# pool      列池，每列为约简后实例中的item id列表，恢复时加入根节点的RMP
+# incumbent 最佳可行解的目标值与箱子，以及lb、ub、n_nodes和统计信息
+# 恢复求解见searchTree.resume
+import gzip
+import json
+import os
+
+VERSION = 1
+
+
+def write(state, file_name):
+    """
+    先写临时文件再重命名，写入过程中被中断时原有的断点文件保持完整
+    """
+    tmp = f"{file_name}.{os.getpid()}.tmp"
+    with gzip.open(tmp, 'wt') as file:
+        json.dump(state, file, separators=(',', ':'))
+    os.replace(tmp, file_name)
+
+
+def read(file_name):
+    with gzip.open(file_name, 'rt') as file:
+        state = json.load(file)
+    if state.get('version') != VERSION:
+        raise ValueError(f"Unsupported checkpoint version {state.get('version')!r}, expected {VERSION}")
+    return state
+
+
+if __name__ == '__main__':
+    pass
@@ -7,20 +7,33 @@
 from uti import ReducedEpsilon
 from uti import Status
 from solution import Solution
+from solverStats import NullStats
+import time
 
 
 class ColumnGeneration:
-    def __init__(self, node):
+    def __init__(self, node, stats=None, cancel=None, trace=None, deadline=None):
         self.node = node
         self.rmp = node.rmp
+        self.stats = stats if stats is not None else NullStats()  # solverStats.Stats
+        self.cancel = cancel  # threading.Event，被设置后在下一次迭代前停止并返回None
+        self.trace = trace  # pricingTrace.TraceWriter，记录每次定价问题的输入与结果
+        self.deadline = deadline  # time.time()的截止时间，超过后与cancel相同，在下一次迭代前停止并返回None
+        self.interrupted = False
+        self.iterations = 0  # 列生成迭代次数
+        self.pricing_time = 0  # 求解定价问题的累计时间
 
     def solve(self):
-        # iterations = 0
         while True:
-            # iterations += 1
-            self.rmp.optimize()   # 单纯形法求解该模型
-            # self.rmp.model.write(f'iteration-{iterations}.lp')
-            # print(f"In {iterations} iteration the value is {self.rmp.get_objVal()}")
+            if (self.cancel is not None and self.cancel.is_set()) or \
+                    (self.deadline is not None and time.time() >= self.deadline):
+                self.interrupted = True
+                return None
+            self.iterations += 1
+            with self.stats.timer('rmp'):
+                self.rmp.optimize()   # 单纯形法求解该模型
+            # self.rmp.model.write(f'iteration-{self.iterations}.lp')
+            # print(f"In {self.iterations} iteration the value is {self.rmp.get_objVal()}")
 
             assert self.rmp.get_status() != Status.INFEASIBLE
 
@@ -29,21 +42,32 @@ class ColumnGeneration:
             ex_dual, sr_dual = self.rmp.get_dual()
 
             # 2.求解对应的定价问题
+            start = time.perf_counter()
             self.rmp.optimize_pricing(ex_dual, sr_dual)
+            elapsed = time.perf_counter() - start
+            self.pricing_time += elapsed
+            if self.trace is not None:
+                self.trace.record(self.rmp, ex_dual, sr_dual, elapsed)
+            if self.stats.enabled:
+                self.stats.timers[f'pricing.{self.rmp.pricing.engine}'] += elapsed
+                for key, value in self.rmp.pricing.get_counters().items():
+                    self.stats.add(key, value)
             # 3.获取reduced cost并判断
             reduced_cost = self.rmp.get_reduced_cost()
             # print(f"{reduced_cost=}")
             if reduced_cost + ReducedEpsilon >= 0:  # reduced cost为正
+                self.stats.add('cg_iterations', self.iterations)
+                self.stats.append('cg_iterations_per_node', self.iterations)
                 assert self.node.rmp is self.rmp
-                solution = {v.varName: v.x for v in self.rmp.getVars()}
-                self.rmp.model.update()
-                return Solution(self.rmp.get_objVal(), solution, self.rmp.model.copy())  # 返回此时的RMP最优解
+                solution = self.rmp.get_primals()
+                return Solution(self.rmp.get_objVal(), solution)  # 返回此时的RMP最优解，整数解的箱子由SearchTree解码
 
             # 4.此时存在reduced cost < 0的列，返回并在rmp中添加该列
             coe = self.rmp.get_pricing_coe()  # [[], []]
 
             self.node.update_param(coe)
             self.rmp.add_col(coe)
+            self.stats.add('columns_added', len(coe))
 
 
 if __name__ == '__main__':
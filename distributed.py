@@ -0,0 +1,365 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 21:40
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 多机分布式分支定价：一个coordinator保存未分配的节点与全局的界，多个worker各自维护本地的SearchTree
+# 节点以紧凑形式(从根节点开始的分支决策、父节点的LP值与RMP中的列，见SearchTree.encode_node)在进程之间传递，
+# 每个worker由相同的实例与约简得到相同的根节点，收到节点后从根节点重建
+# 通信使用multiprocessing.connection(TCP，authkey认证，密钥由--authkey或环境变量BPP_AUTHKEY给定，没有内置的默认值)，消息为JSON:
+# worker -> coordinator                     coordinator -> worker
+# hello                                     instance  实例与SearchTree参数
+# ready   初始可行解与组合下界               work      分配的节点 / wait 稍后重试 / stop 结束
+# idle    本地队列为空，请求节点             同上
+# status  每求解一个节点后汇报本地下界，      continue  全局ub，有空闲worker时要求转交donate个节点
+#         以及新的可行解
+# donate  转交的节点                         continue
+#
+# 用法: export BPP_AUTHKEY=...  (所有机器相同)
+#       python distributed.py coordinator data.txt --host 0.0.0.0 --port 5000 --local-workers 0  (默认只监听127.0.0.1)
+#       python distributed.py worker 10.0.0.1:5000      (每台机器上运行若干个)
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from multiprocessing.connection import Listener, Client
+
+from instance import Instance
+from searchTree import SearchTree
+from solution import Solution
+from uti import ComparisonEpsilon
+
+import numpy as np
+
+POLL_INTERVAL = 0.05  # 没有可分配的节点时worker再次请求的间隔(s)
+ROOT = {'decisions': [], 'value': None, 'columns': []}
+
+
+def send(conn, message):
+    conn.send_bytes(json.dumps(message, separators=(',', ':')).encode())
+
+
+def recv(conn):
+    return json.loads(conn.recv_bytes())
+
+
+def get_authkey(authkey=None):
+    """
+    :param authkey: str或bytes，None时使用环境变量BPP_AUTHKEY
+    :return: bytes，两者均未给定时抛出ValueError
+    """
+    authkey = authkey if authkey is not None else os.environ.get('BPP_AUTHKEY')
+    if not authkey:
+        raise ValueError("No authentication key: set BPP_AUTHKEY or pass --authkey")
+    return authkey.encode() if isinstance(authkey, str) else authkey
+
+
+def parse_address(address):
+    """
+    :param address: "host:port" 或 (host, port)
+    """
+    if isinstance(address, str):
+        host, port = address.rsplit(':', 1)
+        return host, int(port)
+    return tuple(address)
+
+
+class Coordinator:
+    def __init__(self, instance, address=('127.0.0.1', 0), authkey=None, time_limit=None, verbose=True,
+                 **kwargs):
+        """
+        :param instance: Instance
+        :param address: 监听地址，端口为0时由系统分配，见self.address
+        :param authkey: 共享密钥，见get_authkey
+        :param time_limit: 求解时间限制(s)
+        :param kwargs: 传给每个worker中SearchTree的参数，例如backend、strategy
+        """
+        self.instance = instance
+        self.listener = Listener(parse_address(address), authkey=get_authkey(authkey))
+        self.address = self.listener.address
+        self.time_limit = time_limit
+        self.verbose = verbose
+        self.kwargs = kwargs
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        self.queue = [dict(ROOT)]  # 未分配的节点
+        # {worker_id: {'busy': bool, 'lb': 本地未求解节点的最小LP值, 'assigned': 分配给该worker的节点}}
+        self.workers = {}
+        self.n_fixed, self.root_lb = 0, None
+        self.lb, self.ub, self.bins = None, None, None
+        self.n_nodes, self.n_donated = 0, 0
+        self.start_time = None
+
+    def solve(self):
+        """
+        接受worker连接直到搜索结束或达到时间限制
+        :return: Solution，bins为原实例中的箱子
+        """
+        self.start_time = time.time()
+        threading.Thread(target=self.accept, daemon=True).start()
+        while not self.done.wait(0.1):
+            if self.time_limit is not None and time.time() - self.start_time > self.time_limit:
+                if self.verbose:
+                    print(f"\nTime limit {self.time_limit}s reached")
+                break
+        with self.lock:
+            self.done.set()
+            self.lb = self.lower_bound()
+        self.listener.close()
+        if self.verbose:
+            print(f"\nSolved {self.n_nodes} node(s) in {time.time() - self.start_time}s with "
+                  f"{self.n_donated} node(s) stolen\nobjective value = {self.ub}, lower bound = {self.lb}")
+        bins = [np.array(b, dtype=np.int64) for b in self.bins] if self.bins is not None else None
+        return Solution(self.ub, {}, bins, [None] * len(bins) if bins is not None else None)
+
+    def accept(self):
+        worker_id = 0
+        while not self.done.is_set():
+            try:
+                conn = self.listener.accept()
+            except OSError:  # listener已关闭
+                return
+            worker_id += 1
+            threading.Thread(target=self.serve, args=(conn, worker_id), daemon=True).start()
+
+    def serve(self, conn, worker_id):
+        with self.lock:
+            self.workers[worker_id] = {'busy': False, 'lb': None, 'assigned': []}
+        try:
+            while True:
+                message = recv(conn)
+                with self.lock:
+                    reply = self.handle(worker_id, message)
+                send(conn, reply)
+                if reply['type'] == 'stop':
+                    break
+        except (EOFError, OSError):
+            pass
+        finally:
+            conn.close()
+            with self.lock:
+                worker = self.workers.pop(worker_id)
+                if worker['busy'] and not self.done.is_set():
+                    # worker异常退出，重新分配其节点(已转交的子节点会被重复求解，不影响正确性)
+                    self.queue += worker['assigned']
+
+    def handle(self, worker_id, message):
+        worker, kind = self.workers[worker_id], message['type']
+        if kind == 'hello':
+            instance = self.instance
+            return {'type': 'instance', 'kwargs': self.kwargs,
+                    'instance': {'name': instance.name, 'capacity': instance.capacity,
+                                 'widths': instance.widths.tolist(), 'ids': instance.ids.tolist()}}
+        if 'incumbent' in message:
+            self.update_incumbent(message['incumbent']['value'], message['incumbent']['bins'])
+        if kind == 'ready':
+            self.n_fixed = message['n_fixed']
+            self.root_lb = message['lb'] if self.root_lb is None else max(self.root_lb, message['lb'])
+            return self.assign(worker)
+        if kind == 'idle':
+            self.n_nodes += message['nodes']
+            worker.update(busy=False, lb=None, assigned=[])
+            return self.assign(worker)
+        if kind == 'status':
+            self.n_nodes += message['nodes']
+            worker['lb'] = message['lb']
+            reply = self.broadcast()
+            if reply['type'] == 'continue' and message['open'] >= 2 and not self.queue and \
+                    any(not w['busy'] for w in self.workers.values()):
+                reply['donate'] = message['open'] // 2  # 空闲的worker窃取一半的节点
+            return reply
+        if kind == 'donate':
+            self.queue += message['nodes']
+            self.n_donated += len(message['nodes'])
+            return self.broadcast()
+        raise ValueError(f"Unknown message type {kind!r}")
+
+    def update_incumbent(self, value, bins):
+        if self.ub is None or value < self.ub:
+            self.ub, self.bins = value, bins
+            if self.verbose:
+                print(f"incumbent = {self.ub}, lower bound = {self.lower_bound()}, "
+                      f"elapsed = {time.time() - self.start_time:.2f}s")
+
+    def lower_bound(self):
+        """
+        全局下界：未分配节点与各worker本地未求解节点的LP值的最小值，根节点未求解时为组合下界
+        :return: 尚未收到组合下界且根节点未求解时为None
+        """
+        values = [e['value'] if e['value'] is not None else -math.inf for e in self.queue]
+        values += [w['lb'] for w in self.workers.values() if w['busy'] and w['lb'] is not None]
+        if not values:
+            return self.ub
+        if min(values) == -math.inf:
+            return self.root_lb
+        lb = math.ceil(min(values) - ComparisonEpsilon) + self.n_fixed
+        return lb if self.root_lb is None else max(self.root_lb, lb)
+
+    def finished(self):
+        if self.done.is_set():
+            return True
+        lb = self.lower_bound()
+        if self.ub is not None and lb is not None and lb >= self.ub:
+            self.done.set()
+        return self.done.is_set()
+
+    def broadcast(self):
+        if self.finished():
+            return {'type': 'stop'}
+        return {'type': 'continue', 'ub': self.ub}
+
+    def assign(self, worker):
+        if self.finished():
+            return {'type': 'stop'}
+        if not self.queue:
+            if not any(w['busy'] for w in self.workers.values()):  # 所有节点均已求解
+                self.done.set()
+                return {'type': 'stop'}
+            return {'type': 'wait', 'ub': self.ub}
+        # 优先分配LP值最小的节点(根节点的值为None)
+        k = min(range(len(self.queue)),
+                key=lambda i: self.queue[i]['value'] if self.queue[i]['value'] is not None else -math.inf)
+        entry = self.queue.pop(k)
+        worker.update(busy=True, lb=entry['value'] if entry['value'] is not None else -math.inf,
+                      assigned=[entry])
+        return {'type': 'work', 'nodes': [entry], 'ub': self.ub}
+
+
+class Worker:
+    def __init__(self, address, authkey=None):
+        self.address = parse_address(address)
+        self.authkey = get_authkey(authkey)
+        self.tree = None
+        self.conn = None
+        self.reported = None  # 已汇报的最佳可行解目标值(约简后的实例)
+        self.n_nodes = 0  # 已求解但尚未汇报的节点数
+
+    def request(self, message):
+        send(self.conn, message)
+        return recv(self.conn)
+
+    def incumbent(self, message):
+        tree = self.tree
+        if self.reported is None or tree.ub < self.reported:
+            message['incumbent'] = {'value': tree.ub + tree.n_fixed, 'bins': tree.restored_bins()}
+            self.reported = tree.ub
+        return message
+
+    def sync(self, reply):
+        # 其他worker找到的更好的可行解只用于剪枝，箱子保存在coordinator中
+        tree = self.tree
+        ub = reply.get('ub')
+        if ub is not None and ub - tree.n_fixed < tree.ub:
+            tree.ub = self.reported = ub - tree.n_fixed
+            tree.incumbent = Solution(tree.ub, {}, None, None)
+
+    def run(self):
+        self.conn = Client(self.address, authkey=self.authkey)
+        try:
+            reply = self.request({'type': 'hello'})
+            data = reply['instance']
+            instance = Instance(widths=data['widths'], capacity=data['capacity'], name=data['name'])
+            instance.set_widths(data['widths'], data['ids'])
+            tree = self.tree = SearchTree(instance, verbose=False, **reply['kwargs'])
+            start_time = time.time()
+            tree.setup(push_root=False)
+            reply = self.request(self.incumbent({'type': 'ready', 'n_fixed': tree.n_fixed,
+                                                 'lb': tree.lb + tree.n_fixed}))
+            while reply['type'] != 'stop':
+                self.sync(reply)
+                if reply['type'] == 'work':
+                    for entry in reply['nodes']:
+                        tree.queue.push(tree.decode_node(entry))
+                elif reply['type'] == 'wait':
+                    time.sleep(POLL_INTERVAL)
+                elif reply.get('donate'):
+                    reply = self.request({'type': 'donate', 'nodes': tree.queue.take(reply['donate'])})
+                    continue
+
+                if tree.queue.empty():
+                    reply = self.request(self.incumbent({'type': 'idle', 'nodes': self.n_nodes}))
+                    self.n_nodes = 0
+                    continue
+                tree.process(tree.queue.pop(), start_time)
+                self.n_nodes += 1
+                reply = self.request(self.incumbent({'type': 'status', 'nodes': self.n_nodes, 'open': len(tree.queue),
+                                                     'lb': tree.queue.lower_bound()}))
+                self.n_nodes = 0
+        except (EOFError, OSError):  # coordinator已关闭
+            pass
+        finally:
+            self.conn.close()
+            if self.tree is not None:
+                self.tree.queue.close()
+
+
+def run_worker(address, authkey=None):
+    Worker(address, authkey).run()
+
+
+def solve_local(instance, n_workers=2, time_limit=None, verbose=False, **kwargs):
+    """
+    在本机启动coordinator与n_workers个worker进程，用于测试
+    :return: Coordinator，结果见coordinator.ub、coordinator.lb与coordinator.bins
+    """
+    authkey = os.urandom(16)  # 只在本机使用的随机密钥
+    coordinator = Coordinator(instance, authkey=authkey, time_limit=time_limit, verbose=verbose, **kwargs)
+    workers = [multiprocessing.Process(target=run_worker, args=(coordinator.address, authkey))
+               for _ in range(n_workers)]
+    for process in workers:
+        process.start()
+    coordinator.solution = coordinator.solve()
+    for process in workers:
+        process.join(5)
+        if process.is_alive():  # 达到时间限制时worker可能仍在求解节点
+            process.terminate()
+    return coordinator
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Distributed branch-and-price for 1D-BPP")
+    sub = parser.add_subparsers(dest='role', required=True)
+    c = sub.add_parser('coordinator')
+    c.add_argument('file', help="instance file, see reader")
+    c.add_argument('--host', default='127.0.0.1', help="listening address, e.g. 0.0.0.0 for all interfaces")
+    c.add_argument('--authkey', default=None, help="shared secret, default $BPP_AUTHKEY")
+    c.add_argument('--port', type=int, default=5000)
+    c.add_argument('--local-workers', type=int, default=0, help="worker processes started on this host")
+    c.add_argument('--time-limit', type=float, default=None)
+    c.add_argument('--config', default='{}', help="JSON object of SearchTree kwargs for the workers")
+    w = sub.add_parser('worker')
+    w.add_argument('address', help="host:port of the coordinator")
+    w.add_argument('--authkey', default=None, help="shared secret, default $BPP_AUTHKEY")
+    args = parser.parse_args(argv)
+
+    try:
+        authkey = get_authkey(args.authkey)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.role == 'worker':
+        run_worker(args.address, authkey)
+        return 0
+    coordinator = Coordinator(Instance(args.file), (args.host, args.port), authkey, time_limit=args.time_limit,
+                              **json.loads(args.config))
+    print(f"coordinator listening on {coordinator.address[0]}:{coordinator.address[1]}")
+    local = [multiprocessing.Process(target=run_worker, args=(('127.0.0.1', coordinator.address[1]), authkey))
+             for _ in range(args.local_workers)]
+    for process in local:
+        process.start()
+    solution = coordinator.solve()
+    for process in local:
+        process.join(5)
+        if process.is_alive():
+            process.terminate()
+    for b in solution.bins or []:
+        print(b.tolist())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 20:40
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 根节点对偶间隙较小时，以列枚举加集合划分模型代替分支
+# 由reduced cost固定的结论(见reducedCostFixing)，改进当前最佳可行解ub的解只使用 rc <= ub - 1 - LP 的列，
+# 用label setting枚举所有这样的列，列数不超过上限时直接求解集合划分MIP：
+# MIP的最优解优于ub时即为最优解，否则(包括不可行)ub即为最优解
+import numpy as np
+
+from labelSetting import LabelSetting
+from lpBackend import EQUAL, BINARY
+from uti import Status, ComparisonEpsilon
+
+
+def enumerate_columns(rmp, gap, limit=None):
+    """
+    :param rmp: 列生成已收敛的MasterModel
+    :param gap: reduced cost的上限
+    :param limit: 列数上限
+    :return: [Label,...]，超过上限时为None
+    """
+    exact, sr = rmp.get_dual()
+    return LabelSetting(rmp.data, rmp.s, exact, sr, rmp.graph).enumerate(gap, limit)
+
+
+def set_partitioning(rmp, labels, time_limit=None):
+    """
+    :param labels: 枚举得到的列
+    :param time_limit: MIP的时间限制(s)
+    :return: (status, bins)，bins为每个箱子中原实例的item id数组，未找到最优解时为None
+    """
+    data = rmp.data
+    ids = data.ids.tolist()
+    model = rmp.backend("set-partitioning", time_limit=time_limit)
+    for item_id in ids:
+        model.add_row(f"exact[{item_id}]", EQUAL, 1)
+    for k, label in enumerate(labels):
+        model.add_col(f"x[{k}]", obj=1, coeffs={f"exact[{ids[i]}]": 1 for i in label.v}, vtype=BINARY)
+    model.optimize()
+    status = model.get_status()
+    if status != Status.OPTIMAL:
+        return status, None
+    primals = model.get_primals()
+    bins = [np.array([i for j in labels[k].v for i in data.members(j)], dtype=np.int64)
+            for k in range(len(labels)) if primals[f"x[{k}]"] > 0.5]
+    return status, bins
+
+
+def solve_by_enumeration(node, ub, limit=None, time_limit=None):
+    """
+    :param node: 列生成已收敛的根节点
+    :param ub: 当前最佳可行解的目标值
+    :param limit: 枚举列数上限
+    :param time_limit: MIP的时间限制(s)
+    :return: (solved, n_columns, bins)，solved为False表示需要回到分支，
+             bins为优于ub的最优解，ub已是最优解时为None
+    """
+    gap = ub - 1 - node.solution.value
+    if gap < -ComparisonEpsilon:  # 下界已经等于ub
+        return True, 0, None
+    labels = enumerate_columns(node.rmp, gap, limit)
+    if labels is None:
+        return False, limit, None
+    status, bins = set_partitioning(node.rmp, labels, time_limit)
+    if status == Status.INFEASIBLE:
+        return True, len(labels), None
+    if status != Status.OPTIMAL:
+        return False, len(labels), None
+    return True, len(labels), bins if len(bins) < ub else None
+
+
+if __name__ == '__main__':
+    pass
@@ -4,17 +4,30 @@
 # Author: Zheng Shaoxiang
 # @Email : zhengsx95@163.com
 # Description:
+from uti import iter_bits
+
 
 class Graph:
     """
     定义一个无向图 undirected graph
+    节点为item id，每个节点的邻居以整数位集合(mask)的形式存储，第k位对应items中索引为k的物品
+    节点顺序与Instance.ids保持一致，合并物品时两者同步更新
     """
-    def __init__(self):
-        self.nodes = set()  # 存储节点编号
-        self.edges = {}  # {node_number: set(1, 2)}
+    def __init__(self, ids=None):
+        self.ids = list(ids) if ids is not None else []  # 索引 -> item id
+        self.index = {i: k for k, i in enumerate(self.ids)}  # item id -> 索引
+        self.masks = [0] * len(self.ids)  # 每个节点的邻居位集合
+
+    def __copy__(self):
+        other = Graph.__new__(Graph)
+        other.ids, other.index, other.masks = list(self.ids), dict(self.index), list(self.masks)
+        return other
 
     def add_node(self, node):
-        self.nodes.add(node)
+        if node not in self.index:
+            self.index[node] = len(self.ids)
+            self.ids.append(node)
+            self.masks.append(0)
 
     def add_nodes_from(self, nodes):
         for node in nodes:
@@ -23,51 +36,80 @@ class Graph:
     def add_edge(self, u, v):
         if u == v:  # 禁止添加连接同个节点的边
             return
-        if u in self.edges:
-            if v not in self.edges[u]:  # 防止添加重复边
-                self.edges[u].add(v)
-        else:
-            self.edges[u] = {v}
-
-        if v in self.edges:
-            if u not in self.edges[v]:  # 防止添加重复边
-                self.edges[v].add(u)
-        else:
-            self.edges[v] = {u}
+        self.add_node(u)
+        self.add_node(v)
+        ku, kv = self.index[u], self.index[v]
+        self.masks[ku] |= 1 << kv
+        self.masks[kv] |= 1 << ku
 
     def add_edges_from(self, edges):
         for edge in edges:
             self.add_edge(*edge)
 
+    def add_edges_mask(self, k, mask):
+        """
+        添加物品k与位集合mask中所有物品之间的边
+        :param k: 物品索引
+        """
+        mask &= ~(1 << k)
+        self.masks[k] |= mask
+        for h in iter_bits(mask):
+            self.masks[h] |= 1 << k
+
     def has_node(self):
-        if self.nodes:
-            return True
-        return False
+        # 是否存在边
+        return any(self.masks)
 
     def has_edge(self, u, v):
-        if u not in self.edges or v not in self.edges:
+        if u not in self.index or v not in self.index:
             return False
-        if v in self.edges[u]:
-            return True
-        return False
+        return bool(self.masks[self.index[u]] >> self.index[v] & 1)
+
+    def mask(self, k):
+        """
+        :param k: 物品索引
+        :return: 与物品k冲突的物品索引构成的位集合
+        """
+        return self.masks[k]
 
     def neighbors(self, node):
-        if node not in self.edges:
+        if node not in self.index:
             return []
-        return self.edges[node]
+        return {self.ids[k] for k in iter_bits(self.masks[self.index[node]])}
 
     def remove_node(self, node):
-        for nei in self.neighbors(node):
-            self.edges[nei].remove(node)
-        if node in self.edges:
-            self.edges.pop(node)
+        """
+        删除节点以及连接的所有边，其后节点的索引均减1
+        """
+        if node not in self.index:
+            return
+        k = self.index.pop(node)
+        low = (1 << k) - 1
+        self.ids.pop(k)
+        self.masks.pop(k)
+        self.masks = [(m & low) | (m >> (k + 1) << k) for m in self.masks]
+        for i in self.ids[k:]:
+            self.index[i] -= 1
+
+    def merge(self, u, v):
+        """
+        将节点v合并到节点u：所有连接到v的边转移到u，再删除v，与Instance.merge对应
+        """
+        if v not in self.index:
+            return
+        self.add_node(u)
+        ku, kv = self.index[u], self.index[v]
+        mask = self.masks[kv] & ~(1 << ku)  # u与v之间的边不转移，否则u会与自身冲突
+        self.masks[ku] |= mask
+        for k in iter_bits(mask):
+            self.masks[k] |= 1 << ku
+        self.remove_node(v)
 
     def get_all_edges(self):
         # 返回所有无重复的边
-        for origin, to_edges in self.edges.items():
-            for to_edge in to_edges:
-                if origin < to_edge:
-                    yield origin, to_edge
+        for k, m in enumerate(self.masks):
+            for h in iter_bits(m >> (k + 1) << (k + 1)):
+                yield self.ids[k], self.ids[h]
 
 
 if __name__ == '__main__':
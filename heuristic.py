@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 11:40
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 一维装箱问题的构造启发式算法，用于获得初始上界与初始列
+from bisect import bisect_left, insort
+
+
+def first_fit_decreasing(widths, capacity, order=None):
+    """
+    :param widths: [int,...] 物品尺寸
+    :param capacity:
+    :param order: 按尺寸递减排列的物品索引，默认重新排序，见Instance.order
+    :return: [[index,...],...] 每个箱子中物品在widths中的索引
+    """
+    if order is None:
+        order = sorted(range(len(widths)), key=widths.__getitem__, reverse=True)
+    bins, loads = [], []
+    for i in order:
+        for k, load in enumerate(loads):
+            if load + widths[i] <= capacity:
+                bins[k].append(i)
+                loads[k] += widths[i]
+                break
+        else:
+            bins.append([i])
+            loads.append(widths[i])
+    return bins
+
+
+def best_fit_decreasing(widths, capacity):
+    """
+    按尺寸递减的顺序将物品装入剩余空间最小且能装下的箱子，以有序的剩余空间二分查找，复杂度O(n log n)
+    :return: [[index,...],...] 每个箱子中物品在widths中的索引
+    """
+    order = sorted(range(len(widths)), key=widths.__getitem__, reverse=True)
+    bins, residuals = [], []  # residuals = [(剩余空间, 箱子序号),...] 升序
+    for i in order:
+        pos = bisect_left(residuals, (widths[i], -1))
+        if pos == len(residuals):
+            bins.append([i])
+            k, residual = len(bins) - 1, capacity - widths[i]
+        else:
+            residual, k = residuals.pop(pos)
+            bins[k].append(i)
+            residual -= widths[i]
+        insort(residuals, (residual, k))
+    return bins
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 00:10
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 增量求解：实例求解后增加、删除或修改少量物品时，以上一次的结果热启动，而不是从头求解
+# 1.上一次根节点RMP中reduced cost(按根节点对偶值)较小的列删除已删除的物品后，检查容量，作为根节点的初始列
+# 2.上一次的最优解删除已删除的物品，新物品按best-fit decreasing装入剩余空间，作为初始可行解(上界)
+# 3.新物品对应的行由MasterModel按新实例建立，修复后的箱子也作为初始列加入根节点
+# item id在多次修改之间保持不变
+# 用法:
+#     solver = IncrementalSolver(instance, backend='highs')
+#     solver.solve()
+#     solver.update(added={101: 37, 102: 55}, removed=[3, 17])
+from bisect import bisect_left
+
+from instance import Instance
+from searchTree import SearchTree
+
+
+def repair_columns(columns, widths, capacity):
+    """
+    删除列中已不存在的物品，跳过超过容量(物品尺寸被修改)与空的列，并去除重复的列
+    :param columns: [[item_id,...],...]
+    :param widths: {item_id: width} 当前实例的物品
+    :return: [[item_id,...],...]
+    """
+    repaired = {}
+    for column in columns:
+        column = tuple(sorted(i for i in column if i in widths))
+        if column and sum(widths[i] for i in column) <= capacity:
+            repaired[column] = None
+    return [list(c) for c in repaired]
+
+
+def repair_bins(bins, widths, capacity):
+    """
+    修复可行解：删除已不存在的物品，超过容量的箱子中依次取出最小的物品，
+    取出的物品与新物品按尺寸递减的顺序装入剩余空间最小且能装下的箱子(best fit)，装不下时新开箱子
+    :param bins: [[item_id,...],...] 修改前的解
+    :param widths: {item_id: width} 当前实例的物品
+    :return: [[item_id,...],...] 当前实例的可行解
+    """
+    packed, pending = [], []
+    for b in bins:
+        b = sorted((i for i in b if i in widths), key=widths.get, reverse=True)
+        while sum(widths[i] for i in b) > capacity:
+            pending.append(b.pop())
+        if b:
+            packed.append(b)
+    assigned = {i for b in packed for i in b}
+    pending += [i for i in widths if i not in assigned and i not in pending]
+
+    residuals = sorted((capacity - sum(widths[i] for i in b), k) for k, b in enumerate(packed))
+    for i in sorted(pending, key=widths.get, reverse=True):
+        pos = bisect_left(residuals, (widths[i], -1))
+        if pos == len(residuals):
+            packed.append([i])
+            k, residual = len(packed) - 1, capacity - widths[i]
+        else:
+            residual, k = residuals.pop(pos)
+            packed[k].append(i)
+            residual -= widths[i]
+        residuals.insert(bisect_left(residuals, (residual, k)), (residual, k))
+    return packed
+
+
+class IncrementalSolver:
+    def __init__(self, instance, verbose=False, pool_gap=0.1, **kwargs):
+        """
+        :param instance: Instance
+        :param pool_gap: 保留上一次根节点RMP中reduced cost不超过pool_gap的列
+        :param kwargs: 传给SearchTree的参数
+        """
+        self.name = instance.name
+        self.capacity = instance.capacity
+        self.widths = dict(zip(instance.ids.tolist(), instance.widths.tolist()))  # {item_id: width}
+        self.verbose = verbose
+        self.pool_gap = pool_gap
+        self.kwargs = kwargs
+        # 上一次求解的结果，item id均为原实例中的编号
+        self.columns = []  # 根节点的列 [[item_id,...],...]
+        self.bins = None  # 最佳可行解 [[item_id,...],...]
+        self.tree = None
+
+    def instance(self):
+        """
+        :return: 当前物品构成的Instance，item id保持不变
+        """
+        instance = Instance(widths=list(self.widths.values()), capacity=self.capacity, name=self.name)
+        instance.set_widths(list(self.widths.values()), list(self.widths))
+        return instance
+
+    def solve(self):
+        """
+        求解当前实例，已有上一次的结果时以修复后的列与可行解热启动
+        :return: Solution，bins为原实例中的item id
+        """
+        kwargs = dict(self.kwargs)
+        if self.bins is not None:
+            bins = repair_bins(self.bins, self.widths, self.capacity)
+            kwargs.update(initial_bins=bins,
+                          warm_columns=repair_columns(self.columns, self.widths, self.capacity) + bins)
+        tree = self.tree = SearchTree(self.instance(), verbose=self.verbose, **kwargs)
+        tree.solve()
+        if tree.incumbent.bins is not None:
+            self.bins = [b.tolist() for b in tree.incumbent.bins]
+        if tree.root_duals is not None:
+            self.columns = tree.root_columns(self.pool_gap)
+        return tree.incumbent
+
+    def update(self, added=None, removed=()):
+        """
+        修改物品后重新求解
+        :param added: {item_id: width} 新物品，item id已存在时表示修改该物品的尺寸
+        :param removed: [item_id,...] 删除的物品
+        :return: Solution
+        """
+        added = added or {}
+        for i in removed:
+            if i not in self.widths:
+                raise KeyError(f"Item {i} is not in the instance")
+            del self.widths[i]
+        for i, w in added.items():
+            if w > self.capacity:
+                raise ValueError(f"Item {i} of width {w} exceeds the capacity {self.capacity}")
+            if i in self.widths and self.widths[i] != w and self.bins is not None:
+                # 尺寸变化的物品从原来的箱子中取出，由repair_bins重新装入
+                self.bins = [[j for j in b if j != i] for b in self.bins]
+            self.widths[i] = w
+        return self.solve()
+
+
+if __name__ == '__main__':
+    pass
@@ -4,18 +4,37 @@
 # Author: Zheng Shaoxiang
 # @Email : zhengsx95@163.com
 # Description:
+from bisect import bisect_right
 from collections import namedtuple
 import random
+
+import numpy as np
+
+import reader
 Item = namedtuple("Item", "id width")
 
 
 class Instance:
-    def __init__(self, file_name=None, seed=0):
+    def __init__(self, file_name=None, seed=0, items=None, capacity=None, widths=None, name=None, cache=False):
+        """
+        :param widths: 物品尺寸(列表或数组)，item id依次为1..n，Item列表在首次访问items时才生成
+        :param cache: 读取文件时是否使用reader的二进制缓存
+        """
+        self.name = name
         self.capacity = None
         self.n = None
-        self.items = None
-        if file_name is not None:
-            self.load_file(file_name)
+        self._items = None
+        self._members = None  # 每个物品包含的原物品id，只在合并物品后生成
+        # 连续存储的物品尺寸与编号(int64)，合并物品时原地更新
+        self.widths, self.ids = None, None
+        self._order, self._index, self._fit = None, None, None  # 缓存，物品变化时清空
+        if items is not None:  # 直接给定物品与容量
+            self.capacity, self.items = capacity, list(items)
+        elif widths is not None:
+            self.capacity = capacity
+            self.set_widths(widths)
+        elif file_name is not None:
+            self.load_file(file_name, cache)
         else:
             random.seed(seed)
             self.capacity = 10
@@ -24,24 +43,112 @@ class Instance:
                           for i in range(self.n)]
             pass
 
-    def load_file(self, file_name):
-        self.items = []
-        with open(file_name, 'r') as file:
-            for i in range(2):
-                line = file.readline()
+    def set_widths(self, widths, ids=None):
+        # 复制一份，从而可以原地修改(读取缓存时widths为只读的内存映射数组)
+        self.widths = np.array(widths, dtype=np.int64)
+        self.ids = np.arange(1, len(self.widths) + 1, dtype=np.int64) if ids is None else \
+            np.array(ids, dtype=np.int64)
+        self.n = len(self.widths)
+        self._items, self._members = None, None
+        self.clear_cache()
+
+    def clear_cache(self):
+        self._order, self._index, self._fit = None, None, None
+
+    @property
+    def items(self):
+        if self._items is None and self.widths is not None:
+            self._items = [Item(id=i, width=w) for i, w in zip(self.ids.tolist(), self.widths.tolist())]
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        self.set_widths([item.width for item in items], [item.id for item in items])
+        self._items = items
+
+    @property
+    def order(self):
+        """
+        :return: 按尺寸递减排列的物品索引(稳定排序)
+        """
+        if self._order is None:
+            self._order = np.argsort(-self.widths, kind='stable')
+        return self._order
 
-            self.capacity, self.n = list(int(i) for i in line.strip().split('\t'))
+    def fit_mask(self, residual):
+        """
+        :return: 尺寸不超过residual的物品索引构成的位集合(python整数)
+        """
+        if self._fit is None:
+            ascending = self.order[::-1].tolist()
+            masks = [0]
+            for k in ascending:
+                masks.append(masks[-1] | 1 << k)
+            self._fit = self.widths[ascending].tolist(), masks
+        widths, masks = self._fit
+        return masks[bisect_right(widths, residual)]
 
-            for i in range(2):
-                file.readline()
+    def index(self, item_id):
+        """
+        :return: item id对应的物品索引
+        """
+        if self._index is None:
+            self._index = {i: k for k, i in enumerate(self.ids.tolist())}
+        return self._index[item_id]
 
-            for i in range(1, self.n + 1):
-                w = int(file.readline().strip())
-                self.items.append(Item(id=i, width=w))
+    def get_item(self, k):
+        return Item(id=int(self.ids[k]), width=int(self.widths[k]))
+
+    def members(self, k):
+        """
+        :return: 物品k包含的原物品id，未合并的物品只包含自身
+        """
+        if self._members is None:
+            return [int(self.ids[k])]
+        return self._members[k]
+
+    def merge(self, id1, id2):
+        """
+        将物品id2合并到物品id1中，id1的尺寸增加，id2被删除，其余物品的相对顺序不变
+        """
+        k1, k2 = self.index(id1), self.index(id2)
+        if self._members is None:
+            self._members = [[i] for i in self.ids.tolist()]
+        self._members[k1] = self._members[k1] + self._members.pop(k2)
+        self.widths[k1] += self.widths[k2]
+        self.widths, self.ids = np.delete(self.widths, k2), np.delete(self.ids, k2)
+        self.n -= 1
+        self._items = None
+        self.clear_cache()
+
+    def load_file(self, file_name, cache=False):
+        """
+        读取文件中的第一个实例，支持的格式见reader
+        """
+        name, self.capacity, widths = reader.read_file(file_name, cache)[0]
+        self.name = self.name if self.name is not None else name
+        self.set_widths(widths)
+
+    def __copy__(self):
+        other = Instance.__new__(Instance)
+        other.__dict__.update(self.__dict__)
+        other.widths, other.ids = self.widths.copy(), self.ids.copy()
+        if self._members is not None:
+            other._members = list(self._members)
+        return other
 
     def __repr__(self):
         return f"capacity={self.capacity}\nitems={self.items}"
 
 
+def load_instances(source, cache=False, cache_dir=None):
+    """
+    :param source: 文件、目录或glob模式，见reader.read_all
+    :return: generator of Instance
+    """
+    for name, capacity, widths in reader.read_all(source, cache, cache_dir):
+        yield Instance(widths=widths, capacity=capacity, name=name)
+
+
 if __name__ == '__main__':
     pass
@@ -4,28 +4,31 @@
 # Author: Zheng Shaoxiang
 # @Email: zhengsx95@163.com
 # Description:
-from uti import ComparisonEpsilon
+from uti import ComparisonEpsilon, iter_bits
 import heapq
-from gurobipy import *
 
 
 class Label:
-    def __init__(self, data, s, miu, lamb, o=None, j=-1, w=0, c=1.0, v=None,  r=None, z=None):
+    def __init__(self, data, s, miu, lamb, o=None, j=-1, w=0, c=1.0, v=None,  r=None, z=None, widths=None, ids=None):
         self.data = data
-        self.n = len(self.data.items)
+        self.n = self.data.n
+        # 从data的数组中一次性取出的尺寸与编号列表，所有label共享
+        self.widths = widths if widths is not None else self.data.widths.tolist()
+        self.ids = ids if ids is not None else self.data.ids.tolist()
         self.s = s  # ((1, 2, 3),...)
         self.j = j  # 部分解中最后一个被考虑的物品的索引
         self.w = w  # 部分解的物品总尺寸
         self.c = c  # 部分解的reduced cost
         self.miu, self.lamb = miu, lamb  # miu: list[int] lamb: {(1, 2, 3): float}
         self.v = v if v is not None else []  # 部分解中包含的item索引
-        self.o = o if o is not None else list(range(self.n))  # 剩下{j+1, j+2,...,n - 1}中尺寸可以放得下的item索引
+        # 剩下{j+1, j+2,...,n - 1}中尺寸可以放得下的item索引，以位集合表示，第k位对应索引k
+        self.o = o if o is not None else (1 << self.n) - 1
         self.r = r if r is not None else {i: 0 for i in s}  # binary source {(1, 2, 3): 0}
         self.z = z if z is not None else [0] * len(lamb)  # sr inequality的系数
 
     def __repr__(self):
         return f"Label(j={self.j}, w={self.w}, c={self.c}, V={self.v}, " \
-               f"O={self.o}, R={self.r}), z={self.z}"
+               f"O={list(iter_bits(self.o))}, R={self.r}), z={self.z}"
 
     def __eq__(self, other):
         return abs(self.c - other.c) <= ComparisonEpsilon
@@ -49,7 +52,7 @@ class Label:
         if self.j != other.j:
             return False
         if self.c - sum(self.lamb[s] for s in self.r if self.r[s] == 1 and other.r[s] == 0) > \
-                other.c - sum(self.miu[i] for i in other.o if i not in self.o) + ComparisonEpsilon:
+                other.c - sum(self.miu[i] for i in iter_bits(other.o & ~self.o) if self.miu[i] > 0) + ComparisonEpsilon:
             return False
         return True
 
@@ -70,9 +73,12 @@ class Label:
         #     return True
         # return False
 
-        # we derive a simple bound as follows:
-        lower = -sum(self.miu[i] for i in self.o)
-        return self.c + lower + ComparisonEpsilon >= 0
+        return self.bound() + ComparisonEpsilon >= 0
+
+    def bound(self):
+        # we derive a simple bound as follows (对偶值为负的物品不会降低reduced cost):
+        lower = -sum(self.miu[i] for i in iter_bits(self.o) if self.miu[i] > 0)
+        return self.c + lower
 
     def extend(self, i, graph, v=1):
         """
@@ -82,10 +88,11 @@ class Label:
         :return:
         """
         if v == 0:
-            return Label(self.data, self.s, self.miu, self.lamb,
-                         j=i, w=self.w, c=self.c, v=self.v, o=self.o[1:], r=self.r, z=self.z)
+            return Label(self.data, self.s, self.miu, self.lamb, j=i, w=self.w, c=self.c, v=self.v,
+                         o=self.o & (self.o - 1), r=self.r, z=self.z, widths=self.widths, ids=self.ids)
         else:
-            items, capacity = self.data.items, self.data.capacity
+            widths, ids, capacity = self.widths, self.ids, self.data.capacity
+            item_id, w = ids[i], self.w + widths[i]
             z = [0] * len(self.lamb)
             c = self.c - self.miu[i]
             r = {}
@@ -93,7 +100,7 @@ class Label:
             k = -1
             for s, b in self.r.items():
                 k += 1
-                if items[i].id not in s:
+                if item_id not in s:
                     r[s] = b
                 else:
                     if b == 1:
@@ -102,21 +109,22 @@ class Label:
                     r[s] = (b + 1) % 2
 
             c -= sum_lamb
-            o = [h for h in self.o[1:] if self.w + items[i].width + items[h].width <= capacity and
-                 items[h].id not in graph.neighbors(items[i].id)]
+            # 删除o中最小的索引i，再与尺寸放得下的物品和不与i冲突的物品的位集合求交
+            o = self.o & (self.o - 1) & self.data.fit_mask(capacity - w) & ~graph.mask(i)
 
-            return Label(self.data, self.s, self.miu, self.lamb, j=i,
-                         w=self.w + items[i].width, c=c, v=self.v + [i], o=o, r=r, z=z)
+            return Label(self.data, self.s, self.miu, self.lamb, j=i, w=w, c=c, v=self.v + [i], o=o, r=r, z=z,
+                         widths=widths, ids=ids)
 
 
 class LabelSetting:
-    def __init__(self, data, s, miu, lamb, graph, verbose=False):
+    def __init__(self, data, s, miu, lamb, graph, verbose=False, delta=5):
         """
         :param data:
         :param s: # [(1, 2, 3),...]
         :param miu: list[]
         :param lamb: list[]
         :param graph: Graph()
+        :param delta: 每次定价最多返回的列数
         """
         self.data = data
         self.s = s if s is not None else []  # se inequalities index
@@ -125,6 +133,8 @@ class LabelSetting:
         self.graph = graph
         self.labels = []  # all completed labels
         self.verbose = verbose
+        self.delta = delta
+        self.n_created, self.n_dominated, self.n_fathomed = 0, 0, 0  # number of labels
 
     @ staticmethod
     def update(labels):
@@ -144,7 +154,7 @@ class LabelSetting:
         self.labels = heapq.nsmallest(delta, self.labels)
 
     def solve(self):
-        n = len(self.data.items)
+        n = self.data.n
         label = Label(self.data, self.s, self.miu, self.lamb)   # 初始化label
 
         labels = {i: [] for i in range(-1, n)}  # {i: [Label()]} all labels with last considered item being index i
@@ -153,7 +163,9 @@ class LabelSetting:
             if self.verbose:
                 print(f"\n{j=}")
                 print(f"before dominated there are {len(labels[j])} labels")
+            n_labels = len(labels[j])
             labels[j] = self.update(labels[j])  # filter the set by dominance rule
+            self.n_dominated += n_labels - len(labels[j])
             if self.verbose:
                 print(f"after dominated there are {len(labels[j])} labels")
             for label in labels[j]:
@@ -162,27 +174,60 @@ class LabelSetting:
                         print(f"The label is completed: {label}")
                     heapq.heappush(self.labels, label)
                 else:
-                    i = label.o[0]  # 下一个待考虑item index
+                    i = (label.o & -label.o).bit_length() - 1  # 下一个待考虑item index
                     if self.verbose:
-                        print(f"item index = {i} item id = {self.data.items[i].id} is considered")
+                        print(f"item index = {i} item id = {label.ids[i]} is considered")
 
                     for v in [1, 0]:
-                        if v == 1 and label.w + self.data.items[i].width > self.data.capacity:
+                        if v == 1 and label.w + label.widths[i] > self.data.capacity:
                             continue
 
                         if self.verbose:
-                            print(f"item id = {self.data.items[i].id} is " + ('packed' if v == 1 else 'discarded'))
+                            print(f"item id = {label.ids[i]} is " + ('packed' if v == 1 else 'discarded'))
                         new_label = label.extend(i, self.graph, v=v)
+                        self.n_created += 1
                         if self.verbose:
                             print(f"The new label is {new_label}")
                         if not new_label.should_be_fathomed():
                             labels[i].append(new_label)
-                        elif self.verbose:
-                            print("The label if fathomed")
+                        else:
+                            self.n_fathomed += 1
+                            if self.verbose:
+                                print("The label if fathomed")
 
-        self.filter()
+        self.filter(self.delta)
         return self.labels
 
+    def enumerate(self, gap, limit=None):
+        """
+        深度优先枚举reduced cost不超过gap的所有列(非空子集)，不使用dominance规则
+        :param gap: reduced cost的上限
+        :param limit: 列数上限，超过时停止枚举并返回None
+        :return: [Label,...]
+        """
+        stack = [Label(self.data, self.s, self.miu, self.lamb)]
+        columns = []
+        while stack:
+            label = stack.pop()
+            if not label.o:
+                if label.v and label.c <= gap + ComparisonEpsilon:
+                    columns.append(label)
+                    if limit is not None and len(columns) > limit:
+                        return None
+                continue
+            i = (label.o & -label.o).bit_length() - 1
+            for v in [0, 1]:
+                if v == 1 and label.w + label.widths[i] > self.data.capacity:
+                    continue
+                new_label = label.extend(i, self.graph, v=v)
+                self.n_created += 1
+                if new_label.bound() > gap + ComparisonEpsilon:
+                    self.n_fathomed += 1
+                else:
+                    stack.append(new_label)
+        self.labels = columns
+        return columns
+
 
 if __name__ == '__main__':
     pass
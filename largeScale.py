@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 00:40
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 大规模实例(10^4-10^5个物品)的分解求解，每个物品一行的RMP与物品对上的Node.p/q无法直接处理这一规模
+# 1.按尺寸递减的蛇形顺序将物品分配到各个块，各块的尺寸分布相近，在进程池中以分支定价(带时间限制)并行求解各块
+# 2.局部搜索：每轮取若干组互不相交的邻域，每组由装载量最小的若干箱子(空余容量之和不小于C)与随机选取的其他箱子组成，
+#   以分支定价重新求解邻域内的物品，箱子数减少，或箱子数相同而装载量的平方和增加(空余集中到少数箱子)时接受
+# 分块求解的结果不如全局的best-fit decreasing时，从后者开始局部搜索
+# 3.以全局的组合下界(L1、L2、L_DFF)计算gap
+# 总时间限制以截止时间传给工作进程，开始时已超过截止时间的块以best-fit decreasing装箱，剩余时间不足chunk_time时不再开始新一轮局部搜索，
+# SearchTree在列生成的迭代之间同样检查时间限制
+# 用法: python largeScale.py orders.txt --chunk-size 50 --processes 8 --time-limit 300
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+from heuristic import best_fit_decreasing
+from instance import Instance
+from lowerBound import lower_bound
+from lpBackend import get_backend, GurobiBackend, start_gurobi_env
+from searchTree import SearchTree
+
+
+def partition(ids, widths, chunk_size):
+    """
+    :return: [[(item_id, width),...],...] 物品数不超过chunk_size且尺寸分布相近的块
+    """
+    items = sorted(zip(ids, widths), key=lambda item: item[1], reverse=True)
+    k = max(1, -(-len(items) // chunk_size))
+    chunks = [[] for _ in range(k)]
+    for pos, item in enumerate(items):
+        r, j = divmod(pos, k)
+        chunks[j if r % 2 == 0 else k - 1 - j].append(item)
+    return chunks
+
+
+def init_worker(backend):
+    if get_backend(backend) is GurobiBackend:
+        start_gurobi_env()
+
+
+def solve_items(args):
+    """
+    工作进程：以分支定价求解一组物品
+    :param args: (capacity, [(item_id, width),...], time_limit, deadline, SearchTree的参数)，deadline为time.time()的截止时间
+    :return: [[item_id,...],...]
+    """
+    capacity, items, time_limit, deadline, kwargs = args
+    time_limit = min(time_limit, deadline - time.time())
+    if time_limit <= 0:  # 排队等待期间已超过截止时间
+        return [[items[k][0] for k in b] for b in best_fit_decreasing([w for _, w in items], capacity)]
+    instance = Instance(widths=[w for _, w in items], capacity=capacity)
+    instance.set_widths([w for _, w in items], [i for i, _ in items])
+    tree = SearchTree(instance, verbose=False, time_limit=time_limit, **kwargs)
+    tree.solve()
+    return [b.tolist() for b in tree.incumbent.bins]
+
+
+class LargeScaleSolver:
+    def __init__(self, instance, chunk_size=50, processes=None, time_limit=300, chunk_time=30,
+                 neighborhood=100, max_stall=5, seed=0, verbose=True, **kwargs):
+        """
+        :param chunk_size: 每块的物品数
+        :param processes: 进程数，默认为CPU核数
+        :param time_limit: 总时间限制(s)，包括分块求解，剩余时间用于局部搜索
+        :param chunk_time: 每块与每个邻域的分支定价时间限制(s)
+        :param neighborhood: 邻域的物品数
+        :param max_stall: 连续若干轮没有改进时停止局部搜索
+        :param kwargs: 传给SearchTree的参数，例如backend
+        """
+        self.instance = instance
+        self.capacity = instance.capacity
+        self.width = dict(zip(instance.ids.tolist(), instance.widths.tolist()))
+        self.chunk_size = chunk_size
+        self.processes = processes
+        self.time_limit = time_limit
+        self.chunk_time = chunk_time
+        self.neighborhood = neighborhood
+        self.max_stall = max_stall
+        self.random = random.Random(seed)
+        self.verbose = verbose
+        self.kwargs = kwargs
+
+        self.lb = None
+        self.bins = None  # [[item_id,...],...]
+        self.n_rounds, self.n_improvements = 0, 0
+
+    def load(self, b):
+        return sum(self.width[i] for i in b)
+
+    def neighborhoods(self, k):
+        """
+        :return: 至多k组互不相交的邻域(箱子的索引)，每组依次加入装载量最小的箱子，直至空余容量之和不小于C
+                 (箱子数才可能减少)或达到邻域的物品数，再随机加入其他箱子
+        """
+        order = sorted(range(len(self.bins)), key=lambda j: self.load(self.bins[j]))
+        per_bin = max(1.0, len(self.width) / len(self.bins))
+        size = max(2, int(self.neighborhood / per_bin))  # 每组的箱子数
+        groups, pos = [], 0
+        for _ in range(k):
+            group, slack = [], 0
+            while pos < len(order) and len(group) < size and slack < self.capacity:
+                group.append(order[pos])
+                slack += self.capacity - self.load(self.bins[order[pos]])
+                pos += 1
+            groups.append(group)
+        rest = order[pos:]
+        self.random.shuffle(rest)
+        for group in groups:
+            while len(group) < size and rest:
+                group.append(rest.pop())
+        return [group for group in groups if len(group) > 1]
+
+    def improves(self, old, new):
+        if len(new) != len(old):
+            return len(new) < len(old)
+        return sum(self.load(b) ** 2 for b in new) > sum(self.load(b) ** 2 for b in old)
+
+    def solve(self):
+        """
+        :return: {'value', 'lb', 'gap', 'bins', 'time', 'chunks', 'rounds', 'improvements'}
+        """
+        start = time.time()
+        deadline = start + self.time_limit
+        self.lb = lower_bound(list(self.width.values()), self.capacity)
+        chunks = partition(list(self.width), list(self.width.values()), self.chunk_size)
+        with Pool(self.processes, initializer=init_worker, initargs=(self.kwargs.get('backend', None),)) as pool:
+            # 1.分块求解
+            jobs = [(self.capacity, chunk, self.chunk_time, deadline, self.kwargs) for chunk in chunks]
+            self.bins = [b for bins in pool.imap_unordered(solve_items, jobs) for b in bins]
+            # 每块的箱子数向上取整，块数较多时可能不如全局的best-fit decreasing，取较好者开始局部搜索
+            ids = list(self.width)
+            bfd = [[ids[k] for k in b] for b in best_fit_decreasing(list(self.width.values()), self.capacity)]
+            if self.verbose:
+                print(f"{len(chunks)} chunk(s) solved: {len(self.bins)} bins, best fit decreasing: {len(bfd)} bins, "
+                      f"lower bound = {self.lb}, elapsed = {time.time() - start:.2f}s")
+            if len(bfd) < len(self.bins):
+                self.bins = bfd
+            # 2.局部搜索
+            stall = 0
+            n_groups = self.processes or os.cpu_count()
+            while len(self.bins) > self.lb and stall < self.max_stall and deadline - time.time() >= self.chunk_time:
+                groups = self.neighborhoods(n_groups)
+                # 不以原来的箱子作为初始可行解，箱子数相同时分支定价得到的装箱方案通常与原来不同
+                jobs = [(self.capacity, [(i, self.width[i]) for j in group for i in self.bins[j]], self.chunk_time,
+                         deadline, self.kwargs) for group in groups]
+                improved, removed, added = False, set(), []
+                for group, bins in zip(groups, pool.map(solve_items, jobs)):
+                    old = [self.bins[j] for j in group]
+                    if self.improves(old, bins):
+                        improved = improved or len(bins) < len(old)
+                        removed.update(group)
+                        added += bins
+                        self.n_improvements += 1
+                self.bins = [b for j, b in enumerate(self.bins) if j not in removed] + added
+                self.n_rounds += 1
+                stall = 0 if improved else stall + 1
+                if self.verbose:
+                    print(f"round {self.n_rounds}: {len(self.bins)} bins, elapsed = {time.time() - start:.2f}s")
+        value = len(self.bins)
+        return {'value': value, 'lb': self.lb, 'gap': (value - self.lb) / self.lb if self.lb else 0.0,
+                'bins': self.bins, 'time': time.time() - start, 'chunks': len(chunks), 'rounds': self.n_rounds,
+                'improvements': self.n_improvements}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Decomposition heuristic for very large 1D-BPP instances")
+    parser.add_argument('file', help="instance file, see reader")
+    parser.add_argument('--chunk-size', type=int, default=50)
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--time-limit', type=float, default=300)
+    parser.add_argument('--chunk-time', type=float, default=30, help="time limit of each chunk or neighbourhood")
+    parser.add_argument('--neighborhood', type=int, default=100, help="number of items per neighbourhood")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--backend', default=None, help="LP backend, see lpBackend.BACKENDS")
+    parser.add_argument('--out', default=None, help="JSON file for the bins")
+    args = parser.parse_args(argv)
+
+    solver = LargeScaleSolver(Instance(args.file), args.chunk_size, args.processes, args.time_limit, args.chunk_time,
+                              args.neighborhood, seed=args.seed, backend=args.backend)
+    result = solver.solve()
+    print(f"value = {result['value']}, lower bound = {result['lb']}, gap = {result['gap']:.4%}, "
+          f"time = {result['time']:.2f}s")
+    if args.out is not None:
+        with open(args.out, 'w') as file:
+            json.dump(result, file)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 11:02
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 一维装箱问题的组合下界：L1(连续下界)、Martello-Toth L2/L3以及基于
+# dual feasible function(DFF)的下界
+# 所有下界均基于升序排列的尺寸以及前缀和计算，不需要LP求解器
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+import math
+
+from uti import IntegerEpsilon
+from reduction import mtrp
+
+
+class DualFeasibleFunction:
+    def __init__(self):
+        pass
+
+    @ staticmethod
+    def u1(x):
+        assert 0 <= x <= 1, "超出边界"
+        if abs(x-0.5) <= IntegerEpsilon:
+            return 0.5
+        elif x < 0.5:
+            return 0
+        elif x > 0.5:
+            return 1
+
+    @staticmethod
+    def U(rho, x):
+        assert 0 <= x <= 1, "超出边界"
+        assert 0 < rho <= 0.5, "超出边界"
+        if x > 1 - rho:
+            return 1
+        elif x < rho:
+            return 0
+        else:
+            return x
+
+    @staticmethod
+    def phi(rho, x):
+        assert 0 <= x <= 1, "超出边界"
+        assert 0 < rho <= 0.5, "超出边界"
+        if x > 1 - rho:
+            return 1 - math.floor((1 - x) / rho) / math.floor(1 / rho)
+        elif x < rho:
+            return 0
+        else:
+            return 1 / math.floor(1 / rho)
+
+    def omega(self, index, p, w, h, q=None):
+        assert index in (1, 2, 3, 4, 5, 6, 7), "超出边界"
+        assert 0 < p <= 0.5, "p应在(0, 0.5]"
+        assert 0 < w <= 1, "w应在(0, 1]"
+        assert 0 < h <= 1, "h应在(0, 1]"
+
+        if index == 1:
+            return self.u1(w) * self.U(p, h)
+        elif index == 2:
+            return self.U(p, w) * self.u1(h)
+        elif index == 3:
+            return self.u1(w) * self.phi(p, h)
+        elif index == 4:
+            return self.phi(p, w) * self.u1(h)
+        elif index == 5:
+            return w * self.U(p, h)
+        elif index == 6:
+            return self.U(p, w) * h
+        elif index == 7:
+            assert q is not None, "q尚未赋值"
+            assert 0 < q <= 0.5, "q应在(0, 0.5]"
+            return self.phi(p, w) * self.phi(q, h)
+
+
+def ceil_div(a, b):
+    return -(-a // b)
+
+
+class SortedWidths:
+    """
+    升序排列的尺寸及其前缀和，用于在O(log n)时间内计算区间内物品的数目与总尺寸
+    """
+    def __init__(self, widths):
+        self.a = sorted(widths)
+        self.prefix = [0] + list(accumulate(self.a))
+        self.n = len(self.a)
+
+    def count(self, lo, hi):
+        # lo <= w <= hi 的物品数目
+        return max(0, bisect_right(self.a, hi) - bisect_left(self.a, lo))
+
+    def total(self, lo, hi):
+        # lo <= w <= hi 的物品总尺寸
+        i, j = bisect_left(self.a, lo), bisect_right(self.a, hi)
+        return self.prefix[j] - self.prefix[i] if j > i else 0
+
+
+def l1(widths, capacity):
+    return ceil_div(sum(widths), capacity)
+
+
+def l2(widths, capacity, sw=None):
+    """
+    Martello-Toth L2, 对K = 0以及所有不超过capacity/2的尺寸取最大值
+    J1 = {w > C - K}, J2 = {C/2 < w <= C - K}, J3 = {K <= w <= C/2}
+    L(K) = |J1| + |J2| + max(0, ceil((sum(J3) - (|J2|C - sum(J2))) / C))
+    """
+    sw = sw if sw is not None else SortedWidths(widths)
+    half = capacity // 2  # 整数尺寸下 w <= C/2 等价于 w <= C // 2
+    best = 0
+    for k in [0] + sorted(set(w for w in sw.a if w <= half)):
+        n1 = sw.count(capacity - k + 1, capacity)
+        n2 = sw.count(half + 1, capacity - k)
+        residual = sw.total(k, half) - (n2 * capacity - sw.total(half + 1, capacity - k))
+        best = max(best, n1 + n2 + max(0, ceil_div(residual, capacity)))
+    return best
+
+
+def l_dff(widths, capacity, sw=None):
+    """
+    基于DualFeasibleFunction中U与phi的下界，rho = K / C，K取所有不超过capacity/2的尺寸
+    为避免浮点误差，函数值均乘以C(U)或floor(C/K)(phi)后以整数计算：
+    U:   w > C - K -> C,  K <= w <= C - K -> w,  w < K -> 0
+    phi: w > C - K -> m - floor((C - w) / K),  K <= w <= C - K -> 1,  w < K -> 0, 其中m = floor(C / K)
+    w > C - K时C - w < K，phi(w) = m
+    """
+    sw = sw if sw is not None else SortedWidths(widths)
+    best = 0
+    for k in sorted(set(w for w in sw.a if 2 * w <= capacity)):
+        n_large = sw.count(capacity - k + 1, capacity)
+        u = n_large * capacity + sw.total(k, capacity - k)
+        best = max(best, ceil_div(u, capacity))
+
+        m = capacity // k
+        f = sw.count(k, capacity - k) + m * n_large
+        best = max(best, ceil_div(f, m))
+    return best
+
+
+def l3(widths, capacity):
+    """
+    Martello-Toth L3: 反复固定支配的箱子(见reduction.mtrp)并计算剩余物品的L2，
+    之后删除最小的物品(松弛)，直至没有剩余物品
+    """
+    free = sorted(widths)
+    fixed, best = 0, 0
+    while free:
+        bins, rest = mtrp(free, capacity, subset_sum=False)
+        fixed += len(bins)
+        free = [free[i] for i in rest]  # 升序
+        best = max(best, fixed + l2(free, capacity))
+        if free:
+            free.pop(0)
+    return max(best, fixed)
+
+
+def lower_bound(widths, capacity, use_l3=False):
+    """
+    :param widths: 物品尺寸(任意顺序)
+    :param capacity:
+    :param use_l3: L3的复杂度较高，仅在根节点使用
+    :return: max(L1, L2, L_DFF[, L3])
+    """
+    if len(widths) == 0:
+        return 0
+    sw = SortedWidths(widths)
+    bound = max(l1(widths, capacity), l2(widths, capacity, sw), l_dff(widths, capacity, sw))
+    if use_l3:
+        bound = max(bound, l3(widths, capacity))
+    return bound
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 9:12
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# LP后端接口，限制主问题(RMP)和定价模型只通过该接口访问求解器
+# 行和列均通过名字访问，例如 "exact[1]" 和 "x[1]"
+import math
+import time
+
+from uti import Status
+
+try:
+    import gurobipy as gp
+    from gurobipy import GRB
+except ImportError:  # 使用HiGHS后端时不需要gurobipy
+    gp = GRB = None
+
+try:
+    import numpy as np
+    from scipy import sparse
+    from scipy.optimize import linprog, milp, LinearConstraint, Bounds
+except ImportError:  # 使用Gurobi后端时不需要scipy
+    np = sparse = linprog = milp = LinearConstraint = Bounds = None
+
+# 变量类型和约束方向，取值与gurobipy中的GRB常量一致
+CONTINUOUS, BINARY, INTEGER = 'C', 'B', 'I'
+LESS_EQUAL, EQUAL, GREATER_EQUAL = '<', '=', '>'
+
+
+class LPBackend:
+    """
+    LP后端基类，在python侧保存所有行和列，子类负责与具体求解器同步
+    """
+    name = None
+
+    def __init__(self, model_name="model", time_limit=None):
+        self.model_name = model_name
+        self.time_limit = time_limit  # 单次求解时间限制(s)
+        self.rows = {}  # {row_name: [sense, rhs]}
+        self.cols = {}  # {col_name: [obj, {row_name: value}, vtype, ub]}
+        self.maximize = False
+        self.status = Status.LOADED
+        self.obj_val = None
+        self.n_calls = 0  # optimize的调用次数
+        self.runtime = 0  # optimize的累计时间
+
+    def _copy_to(self, other):
+        # 列的系数字典在添加后不再修改，因此可以共享
+        other.time_limit = self.time_limit
+        other.rows = {name: list(row) for name, row in self.rows.items()}
+        other.cols = {name: list(col) for name, col in self.cols.items()}
+        other.maximize = self.maximize
+        return other
+
+    def add_row(self, name, sense, rhs):
+        self.rows[name] = [sense, rhs]
+
+    def add_col(self, name, obj=0.0, coeffs=None, vtype=CONTINUOUS, ub=math.inf):
+        """
+        :param name: column name
+        :param obj: objective coefficient
+        :param coeffs: {row_name: value}, the rows must exist
+        :param vtype: CONTINUOUS, BINARY or INTEGER
+        :param ub: upper bound of the variable, the lower bound is always 0
+        :return:
+        """
+        self.cols[name] = [obj, dict(coeffs) if coeffs is not None else {}, vtype, ub]
+
+    def remove_row(self, name):
+        self.rows.pop(name)
+
+    def remove_col(self, name):
+        self.cols.pop(name)
+
+    def has_col(self, name):
+        return name in self.cols
+
+    def row_names(self):
+        return list(self.rows)
+
+    def col_names(self):
+        return list(self.cols)
+
+    def get_col(self, name):
+        # 已删除的行不会从列的系数字典中删除，在此过滤
+        return {row: v for row, v in self.cols[name][1].items() if row in self.rows}
+
+    def set_obj(self, name, obj):
+        self.cols[name][0] = obj
+
+    def set_vtype(self, name, vtype):
+        self.cols[name][2] = vtype
+
+    def set_sense(self, maximize):
+        self.maximize = maximize
+
+    def binary_copy(self):
+        """
+        返回所有变量均为0-1变量的模型副本
+        """
+        model = self.__copy__()
+        for name in model.col_names():
+            model.set_vtype(name, BINARY)
+        return model
+
+    def optimize(self):
+        start = time.perf_counter()
+        self._optimize()
+        self.runtime += time.perf_counter() - start
+        self.n_calls += 1
+
+    def _optimize(self):
+        raise NotImplementedError
+
+    def get_status(self):
+        return self.status
+
+    def get_objVal(self):
+        return self.obj_val
+
+    def get_duals(self):
+        """
+        :return: {row_name: dual value}
+        """
+        raise NotImplementedError
+
+    def get_primals(self):
+        """
+        :return: {col_name: value}
+        """
+        raise NotImplementedError
+
+    def __copy__(self):
+        raise NotImplementedError
+
+
+class GurobiBackend(LPBackend):
+    name = 'gurobi'
+    default_env = None  # 进程内共享的gurobipy.Env，避免每个模型重复创建环境
+
+    def __init__(self, model_name="model", time_limit=None, env=None, model=None):
+        super().__init__(model_name, time_limit)
+        if gp is None:
+            raise ImportError("The Gurobi backend requires gurobipy")
+        self.env = env if env is not None else GurobiBackend.default_env
+        self.model = model if model is not None else gp.Model(model_name, env=self.env)
+        self.model.Params.OutputFlag = False
+        self.constrs, self.vars = {}, {}  # {name: Constr}, {name: Var}
+
+    def __copy__(self):
+        self.model.update()
+        other = self._copy_to(GurobiBackend(self.model_name, env=self.env, model=self.model.copy()))
+        # copy()后变量与约束的顺序保持不变
+        other.constrs = dict(zip(self.constrs, other.model.getConstrs()))
+        other.vars = dict(zip(self.vars, other.model.getVars()))
+        return other
+
+    def add_row(self, name, sense, rhs):
+        super().add_row(name, sense, rhs)
+        self.constrs[name] = self.model.addLConstr(gp.LinExpr(), sense, rhs, name=name)
+
+    def add_col(self, name, obj=0.0, coeffs=None, vtype=CONTINUOUS, ub=math.inf):
+        super().add_col(name, obj, coeffs, vtype, ub)
+        coeffs = coeffs if coeffs is not None else {}
+        column = gp.Column(list(coeffs.values()), [self.constrs[row] for row in coeffs])
+        self.vars[name] = self.model.addVar(ub=ub if ub != math.inf else GRB.INFINITY, obj=obj, vtype=vtype,
+                                            column=column, name=name)
+
+    def remove_row(self, name):
+        super().remove_row(name)
+        self.model.remove(self.constrs.pop(name))
+
+    def remove_col(self, name):
+        super().remove_col(name)
+        self.model.remove(self.vars.pop(name))
+
+    def set_obj(self, name, obj):
+        super().set_obj(name, obj)
+        self.vars[name].Obj = obj
+
+    def set_vtype(self, name, vtype):
+        super().set_vtype(name, vtype)
+        self.vars[name].VType = vtype
+
+    def set_sense(self, maximize):
+        super().set_sense(maximize)
+        self.model.ModelSense = GRB.MAXIMIZE if maximize else GRB.MINIMIZE
+
+    def _optimize(self):
+        if self.time_limit is not None:
+            self.model.Params.TimeLimit = self.time_limit
+        self.model.optimize()
+        self.status = Status(self.model.Status)
+        self.obj_val = self.model.ObjVal if self.model.SolCount > 0 else None
+
+    def get_duals(self):
+        # 一次性读取所有对偶值，避免逐个约束调用getAttr
+        return dict(zip(self.constrs, self.model.getAttr(GRB.Attr.Pi, list(self.constrs.values()))))
+
+    def get_primals(self):
+        return dict(zip(self.vars, self.model.getAttr(GRB.Attr.X, list(self.vars.values()))))
+
+
+class HighsBackend(LPBackend):
+    """
+    通过scipy调用进程内的HiGHS求解器，不需要license
+    每次optimize根据python侧保存的行和列重新构造稀疏矩阵
+    """
+    name = 'highs'
+
+    def __init__(self, model_name="model", time_limit=None):
+        super().__init__(model_name, time_limit)
+        if linprog is None:
+            raise ImportError("The HiGHS backend requires numpy and scipy")
+        self.duals, self.primals = None, None
+
+    def __copy__(self):
+        return self._copy_to(HighsBackend(self.model_name))
+
+    def _matrix(self):
+        rows, cols = list(self.rows), list(self.cols)
+        index = {row: k for k, row in enumerate(rows)}
+        data, row_ind, col_ind = [], [], []
+        for k, name in enumerate(cols):
+            for row, v in self.cols[name][1].items():
+                if row in index:
+                    data.append(v)
+                    row_ind.append(index[row])
+                    col_ind.append(k)
+        a = sparse.csr_matrix((data, (row_ind, col_ind)), shape=(len(rows), len(cols)))
+        return rows, cols, a
+
+    def _optimize(self):
+        rows, cols, a = self._matrix()
+        sign = -1 if self.maximize else 1
+        c = np.array([sign * self.cols[name][0] for name in cols], dtype=float)
+        ub = np.array([self.cols[name][3] for name in cols], dtype=float)
+        options = {'time_limit': self.time_limit} if self.time_limit is not None else {}
+
+        if any(self.cols[name][2] != CONTINUOUS for name in cols):
+            rhs = np.array([self.rows[row][1] for row in rows], dtype=float)
+            sense = [self.rows[row][0] for row in rows]
+            lb = np.where([s == LESS_EQUAL for s in sense], -np.inf, rhs)
+            rb = np.where([s == GREATER_EQUAL for s in sense], np.inf, rhs)
+            integrality = np.array([int(self.cols[name][2] != CONTINUOUS) for name in cols])
+            ub = np.where([self.cols[name][2] == BINARY for name in cols], np.minimum(ub, 1), ub)
+            constraints = [LinearConstraint(a, lb, rb)] if rows else []
+            res = milp(c, constraints=constraints, integrality=integrality, bounds=Bounds(0, ub), options=options)
+            self.duals = None
+        else:
+            eq = [k for k, row in enumerate(rows) if self.rows[row][0] == EQUAL]
+            le = [k for k, row in enumerate(rows) if self.rows[row][0] == LESS_EQUAL]
+            ge = [k for k, row in enumerate(rows) if self.rows[row][0] == GREATER_EQUAL]
+            rhs = np.array([self.rows[row][1] for row in rows], dtype=float)
+            a_ub = sparse.vstack([a[le], -a[ge]]) if le or ge else None
+            b_ub = np.concatenate([rhs[le], -rhs[ge]]) if le or ge else None
+            res = linprog(c, A_ub=a_ub, b_ub=b_ub, A_eq=a[eq] if eq else None, b_eq=rhs[eq] if eq else None,
+                          bounds=np.column_stack([np.zeros(len(cols)), ub]), method='highs', options=options)
+            self.duals = None
+            if res.status == 0:
+                pi = np.zeros(len(rows))
+                if eq:
+                    pi[eq] = res.eqlin.marginals
+                if le or ge:
+                    pi[le] = res.ineqlin.marginals[:len(le)]
+                    pi[ge] = -res.ineqlin.marginals[len(le):]
+                self.duals = dict(zip(rows, (sign * pi).tolist()))
+
+        self.status = {0: Status.OPTIMAL, 1: Status.ITERATION_LIMIT, 2: Status.INFEASIBLE,
+                       3: Status.UNBOUNDED}.get(res.status, Status.NUMERIC)
+        if res.x is not None:
+            self.primals = dict(zip(cols, res.x.tolist()))
+            self.obj_val = sign * res.fun
+        else:
+            self.primals, self.obj_val = None, None
+
+    def get_duals(self):
+        return self.duals
+
+    def get_primals(self):
+        return self.primals
+
+
+def start_gurobi_env():
+    """
+    创建一个不输出日志的gurobipy.Env并作为GurobiBackend.default_env，每个进程只需调用一次
+    """
+    if GurobiBackend.default_env is None:
+        env = gp.Env(empty=True)
+        env.setParam('OutputFlag', 0)
+        env.start()
+        GurobiBackend.default_env = env
+    return GurobiBackend.default_env
+
+
+BACKENDS = {GurobiBackend.name: GurobiBackend, HighsBackend.name: HighsBackend}
+
+
+def get_backend(backend=None):
+    """
+    :param backend: None, a name in BACKENDS or a subclass of LPBackend
+    :return: the LPBackend subclass, gurobi is preferred when backend is None and gurobipy is installed
+    """
+    if backend is None:
+        backend = GurobiBackend.name if gp is not None else HighsBackend.name
+    if isinstance(backend, type) and issubclass(backend, LPBackend):
+        return backend
+    if backend not in BACKENDS:
+        raise ValueError("The optional parameter 'backend' should "
+                         f"be one of {', '.join(repr(name) for name in BACKENDS)}!")
+    return BACKENDS[backend]
+
+
+if __name__ == '__main__':
+    pass
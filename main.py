@@ -7,7 +7,6 @@
 # 一维装箱问题(One-dimensional bin packing problem, 1D-BPP)问题的
 # 分支定价算法(Branch and Price, BP)
 from instance import Instance
-import basicmodel
 from searchTree import SearchTree
 import cProfile
 
@@ -25,11 +24,7 @@ if __name__ == '__main__':
     tree = SearchTree(instance, verbose=True)  # 初始化搜索树
     tree.solve()
 
-    rmp = tree.incumbent.model
-    rmp.update()
-    for name, v in tree.incumbent.solutions.items():
-        if v > 0.9:
-            print(name, v)
-            column = [rmp.getCoeff(constr, rmp.getVarByName(name)) for constr in rmp.getConstrs()]
-            print(column)
+    # 每个箱子对应的列(约简阶段固定的箱子为None)以及箱子中的item id
+    for name, packed in zip(tree.incumbent.columns, tree.incumbent.bins):
+        print(name, packed.tolist())
     # cProfile.run('tree.solve()', sort=1)
@@ -4,13 +4,15 @@
 # Author: Zheng Shaoxiang
 # @Email : zhengsx95@163.com
 # Description:
-from gurobipy import *
 import itertools
 import random
 from pricing import Pricing as Pr
 from graph import Graph
+from lpBackend import get_backend, EQUAL, LESS_EQUAL
 import copy
 
+import numpy as np
+
 
 class Enumeration:
     def __init__(self, lst):
@@ -55,24 +57,33 @@ class SeparateEnumerate(Enumeration):
                 ans = []
 
 
+# 生成sr不等式所用物品三元组的方式，RandomEnumerate需要额外的参数，不在其中
+ENUMERATIONS = {'separate': SeparateEnumerate, 'complete': CompleteEnumerate}
+
+
 class MasterModel:
     def __init__(self, data, add_cuts=True, **kwargs):
-        self.model = kwargs.get('model', None)  # restricted master problem
+        self.model = kwargs.get('model', None)  # restricted master problem, LPBackend
+        self.backend = get_backend(kwargs.get('backend', None))  # LPBackend class
         self.data = data
         self.add_cuts = add_cuts  # add inequalities or not
         self.pricing = kwargs.get('pricing', None)  # Pricing class
-        self.x = kwargs.get('x', None)  # x variables
+        self.use_model = kwargs.get('use_model', False)  # 定价问题使用模型求解，否则使用label setting
+        self.label_delta = kwargs.get('label_delta', 5)  # label setting每次最多返回的列数
         self.var_num = kwargs.get("var_num", None)  # number of variables
+        # constraints = {item_id: row_name}  sr = {(1, 2, 3): row_name}
         self.constraints, self.sr = \
             kwargs.get('constraints', None), kwargs.get('sr', None)  # constraints
         self.s = kwargs.get('s', None)  # sr inequality index ((1, 2, 3), (4, 5, 6),...)
-        self.graph = kwargs.get('graph', Graph())  # 初始化无向图定义不相容的边
         self.init_columns = kwargs.get("init_columns", None)
-        self.item_id = [item.id for item in self.data.items]  # item_id
+        self.item_id = self.data.ids.tolist()  # item_id
+        self.graph = kwargs.get('graph', None)  # 无向图定义不相容的边，节点顺序与data中的物品一致
+        if self.graph is None:
+            self.graph = Graph(self.item_id)
         if add_cuts and self.s is None:
-            self.initialize_param()
+            self.initialize_param(kwargs.get('enumeration', SeparateEnumerate))
         if self.model is None:
-            self.model = Model("1D-BPP")
+            self.model = self.backend("1D-BPP")
             self.initialize_model()
         if self.pricing is None:
             self.pricing = self.get_pricing_instance()
@@ -82,73 +93,61 @@ class MasterModel:
         when copy.copy is invoked
         :return:
         """
-        data = copy.deepcopy(self.data)
-        assert data.items is not self.data.items
+        data = copy.copy(self.data)  # 复制物品数组，子节点中合并物品不影响父节点
+        assert data.widths is not self.data.widths
 
-        self.model.update()
-        model = self.model.copy()
+        model = copy.copy(self.model)
 
         pricing = self.pricing
 
-        x = copy.copy(self.x)
         constraints, sr = copy.copy(self.constraints), copy.copy(self.sr)
         s = self.s
-        graph = copy.deepcopy(self.graph)
+        graph = copy.copy(self.graph)
 
-        return MasterModel(data=data, add_cuts=self.add_cuts, model=model, pricing=pricing, x=x,
+        return MasterModel(data=data, add_cuts=self.add_cuts, model=model, backend=self.backend, pricing=pricing,
                            constraints=constraints, sr=sr, s=s, graph=graph, var_num=self.var_num)
 
     def initialize_param(self, enu_class=SeparateEnumerate):
         enu = enu_class(self.item_id)
         self.s = tuple(enu.sr_inequality())
 
-    def setObjective(self, expr, sense):
-        self.model.setObjective(expr, sense)
-
     def add_col(self, coe):
         """
 
         :param coe: [[], []]
         :return:
         """
+        rows = list(self.constraints.values()) + (list(self.sr.values()) if self.sr is not None else [])
         for c in coe:
-            col = Column(c, self.model.getConstrs())
             self.var_num += 1
-            self.model.addVar(vtype=GRB.CONTINUOUS, obj=1, column=col, name=f"x[{self.var_num}]")
+            self.model.add_col(f"x[{self.var_num}]", obj=1, coeffs={row: v for row, v in zip(rows, c) if v != 0})
+
+    def get_column_coe(self, exact_coe):
+        """
+        :param exact_coe: [0, 1, ...] coefficients of the exact constraints
+        :return: exact_coe + coefficients of the sr inequalities
+        """
+        if not self.add_cuts:
+            return list(exact_coe)
+        index = {item_id: i for i, item_id in enumerate(self.data.ids.tolist())}  # 合并物品后item_id已过时
+        sr_coe = [int(sum(exact_coe[index[i]] for i in s if i in index) >= 2) for s in self.s]
+        return list(exact_coe) + sr_coe
 
     def initialize_model(self):
-        if self.init_columns is None:
-            x_index = tuple(range(1, self.data.n + 1))
-            self.x = self.model.addVars(x_index, vtype=GRB.CONTINUOUS, name="x")
-            self.constraints = self.model.addConstrs(
-                (self.x[i] == 1 for i in x_index), name="exact")
-
-            self.setObjective(self.x.sum(), GRB.MINIMIZE)
-            if self.add_cuts:
-                self.sr = self.model.addConstrs((0 <= 1 for _ in self.s), name="sr")
-                for c in self.sr.values():
-                    c.setAttr("RHS", 1)
+        self.constraints = {item_id: f"exact[{item_id}]" for item_id in self.item_id}
+        for row in self.constraints.values():
+            self.model.add_row(row, EQUAL, 1)
+        if self.add_cuts:
+            self.sr = {s: "sr[{},{},{}]".format(*s) for s in self.s}
+            for row in self.sr.values():
+                self.model.add_row(row, LESS_EQUAL, 1)
+
+        if self.init_columns is None:  # 每个item单独装箱
+            init_columns = [[int(i == j) for j in range(self.data.n)] for i in range(self.data.n)]
         else:
-            x_index = tuple(range(1, len(self.init_columns) + 1))
-            self.x = self.model.addVars(x_index, vtype=GRB.CONTINUOUS, name="x")
-            self.constraints = self.model.addConstrs((
-                quicksum(self.x[i] * self.init_columns[i - 1][j - 1] for i in x_index) == 1
-                for j in range(1, self.data.n + 1)
-            ), name="exact")
-            self.setObjective(self.x.sum(), GRB.MINIMIZE)
-
-            if self.add_cuts:
-                self.sr = self.model.addConstrs((quicksum(
-                    self.x[i] * int(self.init_columns[i - 1][p - 1] +
-                                    self.init_columns[i - 1][q - 1] +
-                                    self.init_columns[i - 1][r - 1] >= 2)
-                    for i in x_index) <= 1 for p, q, r in self.s), name="sr")
-        self.var_num = len(x_index)
-        self.model.update()
-        self.set_parameters()
-
-    def set_parameters(self):
-        self.model.Params.OutputFlag = False
+            init_columns = self.init_columns
+        self.var_num = 0
+        self.add_col([self.get_column_coe(c) for c in init_columns])
 
     def optimize(self):
         self.model.optimize()
@@ -157,42 +156,52 @@ class MasterModel:
         return self.pricing.get_reduced_cost()
 
     def get_status(self):
-        return self.model.status
+        return self.model.get_status()
 
     def get_objVal(self):
-        return self.model.objVal
+        return self.model.get_objVal()
 
-    def getVars(self):
-        return self.model.getVars()
+    def get_primals(self):
+        return self.model.get_primals()
 
     def optimize_pricing(self, ex_dual, sr_dual):
         self.pricing.solve(ex_dual, sr_dual, self.data, self.graph)
 
     def get_pricing_instance(self):
-        return Pr(self.s)
+        return Pr(self.s, use_model=self.use_model, backend=self.backend, delta=self.label_delta)
 
     def get_dual(self):
-        exact, sr = [], []
-        for c in self.constraints.values():
-            exact.append(c.getAttr(GRB.Attr.Pi))
-
-        if self.sr is not None:
-            for c in self.sr.values():
-                sr.append(c.getAttr(GRB.Attr.Pi))
+        duals = self.model.get_duals()
+        exact = [duals[row] for row in self.constraints.values()]
+        sr = [duals[row] for row in self.sr.values()] if self.sr is not None else []
         return exact, sr
 
+    def get_bins(self, solutions):
+        """
+        :param solutions: {col_name: value} 整数解
+        :return: columns = [col_name,...]，bins = [np.ndarray,...] 每个箱子中的item id，合并的物品被展开
+        """
+        data = self.data
+        index = {self.constraints[item_id]: k for k, item_id in enumerate(data.ids.tolist())}
+        columns, bins = [], []
+        for name, v in solutions.items():
+            if v > 0.5:
+                rows = self.model.get_col(name)
+                columns.append(name)
+                bins.append(np.array([i for row in rows if row in index for i in data.members(index[row])],
+                                     dtype=np.int64))
+        return columns, bins
+
     def get_pricing_coe(self):
         return self.pricing.get_coe()
 
     def removeConstrById(self, constraint_id):
-        constr_name = self.constraints[constraint_id].constrName
-        self.model.remove(self.model.getConstrByName(constr_name))
-        self.constraints.pop(constraint_id)
+        self.model.remove_row(self.constraints.pop(constraint_id))
 
     def removeVarById(self, var_id):
         var_name = f"x[{var_id}]"
-        if self.model.getVarByName(var_name) is not None:
-            self.model.remove(self.model.getVarByName(var_name))
+        if self.model.has_col(var_name):
+            self.model.remove_col(var_name)
 
 
 if __name__ == '__main__':
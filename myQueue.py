@@ -41,7 +41,36 @@ class MyQueue:
                 self.aux.append(self.data.pop())
             return self.aux.pop()
         else:
-            heapq.heappop(self.data)
+            return heapq.heappop(self.data)
+
+    def pop_last(self):
+        """
+        弹出按弹出顺序排在最后的元素
+        """
+        if self.empty():
+            raise ValueError("The queue is empty!")
+
+        if self.strategy == 'depth':
+            return self.aux.pop(0) if self.aux else self.data.pop()
+        elif self.strategy == 'breadth':
+            return self.data.pop()
+        else:
+            k = max(range(len(self.data)), key=self.data.__getitem__)
+            item = self.data[k]
+            self.data[k] = self.data[-1]
+            self.data.pop()
+            heapq.heapify(self.data)
+            return item
+
+    def nodes(self):
+        """
+        :return: 按弹出顺序排列的所有节点，依次push到空队列中可以得到相同的队列
+        """
+        if self.strategy == 'depth':
+            return list(self.data) + self.aux[::-1]
+        elif self.strategy == 'breadth':
+            return list(self.data)
+        return sorted(self.data)
 
     def empty(self):
         if len(self.data) == 0 and len(self.aux) == 0:
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 01:20
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 分支后的节点预处理：在列生成之前传播分支决策的结果，能够关闭的节点不再求解LP
+# 1.合并物品(value = 1)后，合并物品的尺寸超过容量或与自身冲突(合并前两个物品之间有冲突边)时节点不可行；
+#   与合并物品尺寸之和超过容量的物品记为冲突边
+# 2.不能与任何其他物品装入同一箱子(容量或冲突边)的物品单独占用一个箱子，只计入组合下界，不从子节点的RMP中删除：
+#   包含该物品与其他物品的列已在分支时删除(或本来就超过容量)，定价问题也不会生成这样的列，RMP中只能以单独的列覆盖该行，
+#   删除该行需要在剪枝、整数解的箱子以及断点/溢出节点的重建中记录每个节点的固定箱子数，收益只是少一行
+# 3.组合下界max(L(所有物品), 单独占用箱子的物品数 + L(其余物品))不小于当前最佳可行解时剪枝
+import numpy as np
+
+from lowerBound import lower_bound
+
+OPEN, INFEASIBLE, PRUNED = 'open', 'infeasible', 'pruned'
+
+
+def forced_singles(data, graph):
+    """
+    :return: [index,...] 只能单独装箱的物品
+    """
+    singles = []
+    for k, w in enumerate(data.widths.tolist()):
+        if data.fit_mask(data.capacity - w) & ~graph.mask(k) & ~(1 << k) == 0:
+            singles.append(k)
+    return singles
+
+
+def presolve(node, ub=None):
+    """
+    :param node: 应用分支决策后尚未求解的节点
+    :param ub: 当前最佳可行解的目标值，None表示没有可行解
+    :return: (status, bound) status为OPEN、INFEASIBLE或PRUNED，bound为节点的组合下界(不可行时为None)
+    """
+    rmp = node.rmp
+    data, graph, capacity = rmp.data, rmp.graph, rmp.data.capacity
+    if node.decisions and node.decisions[-1][2] == 1:
+        k = data.index(node.decisions[-1][0])
+        w = int(data.widths[k])
+        if w > capacity or graph.mask(k) >> k & 1:
+            return INFEASIBLE, None
+        graph.add_edges_mask(k, ((1 << data.n) - 1) & ~data.fit_mask(capacity - w))
+
+    singles = forced_singles(data, graph)
+    widths = data.widths.tolist()
+    bound = lower_bound(widths, capacity)
+    if singles:
+        rest = np.delete(data.widths, singles).tolist()
+        bound = max(bound, len(singles) + lower_bound(rest, capacity))
+    if ub is not None and bound >= ub:
+        return PRUNED, bound
+    return OPEN, bound
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 19:20
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 内存受限的节点存储：包装MyQueue，队列中存放Handle，
+# 驻留节点的估计大小之和超过预算时，将最晚被弹出的节点以紧凑形式写入磁盘，弹出时再读回
+import pickle
+import tempfile
+import zlib
+
+from myQueue import MyQueue
+
+
+class Handle:
+    """
+    队列中的元素，node为None表示节点已写入磁盘，此时由offset和length定位
+    """
+    __slots__ = ('node', 'size', 'value', 'offset', 'length')
+
+    def __init__(self, node, size):
+        self.node = node
+        self.size = size
+        self.value = node.solution.value if node.solution is not None else float('-inf')
+        self.offset, self.length = None, None
+
+    # 与Node相同，best-first时按节点的LP值排序
+    def __lt__(self, other):
+        return self.value < other.value
+
+    def __le__(self, other):
+        return self.value <= other.value
+
+
+class NodeStore:
+    def __init__(self, encode, decode, size, budget=None, strategy="depth", spill_dir=None):
+        """
+        :param encode: function(node) -> 可pickle的紧凑形式
+        :param decode: function(entry) -> node
+        :param size: function(node) -> 节点的估计大小(bytes)
+        :param budget: 驻留节点的总大小上限(bytes)，None表示不限制
+        :param strategy: 搜索策略，见MyQueue
+        :param spill_dir: 临时文件所在目录，默认为系统临时目录
+        """
+        self.queue = MyQueue(strategy)
+        self.encode, self.decode, self.size = encode, decode, size
+        self.budget = budget
+        self.spill_dir = spill_dir
+        self.file = None  # 只追加写入的临时文件，关闭后自动删除
+        self.resident = 0  # 驻留节点的估计大小之和
+        self.peak_resident = 0
+        self.n_spilled, self.n_loaded, self.spilled_bytes = 0, 0, 0
+
+    @property
+    def strategy(self):
+        return self.queue.strategy
+
+    def push(self, node):
+        handle = Handle(node, self.size(node))
+        self.queue.push(handle)
+        self.resident += handle.size
+        self.peak_resident = max(self.peak_resident, self.resident)
+        if self.budget is not None and self.resident > self.budget:
+            self.spill()
+
+    def pop(self):
+        handle = self.queue.pop()
+        if handle.node is not None:
+            self.resident -= handle.size
+            return handle.node
+        self.n_loaded += 1
+        return self.decode(self.read(handle))
+
+    def spill(self):
+        """
+        按弹出顺序从后往前写出驻留节点，直到总大小不超过预算
+        """
+        for handle in reversed(self.queue.nodes()):
+            if self.resident <= self.budget:
+                break
+            if handle.node is None:
+                continue
+            data = zlib.compress(pickle.dumps(self.encode(handle.node), pickle.HIGHEST_PROTOCOL))
+            if self.file is None:
+                self.file = tempfile.TemporaryFile(prefix="bp-nodes-", dir=self.spill_dir)
+            self.file.seek(0, 2)
+            handle.offset, handle.length = self.file.tell(), len(data)
+            self.file.write(data)
+            handle.node = None
+            self.resident -= handle.size
+            self.n_spilled += 1
+            self.spilled_bytes += len(data)
+
+    def read(self, handle):
+        self.file.seek(handle.offset)
+        return pickle.loads(zlib.decompress(self.file.read(handle.length)))
+
+    def take(self, k):
+        """
+        取出按弹出顺序排在最后的k个节点，用于转交给其他进程
+        :return: 这些节点的紧凑形式
+        """
+        entries = []
+        for _ in range(min(k, len(self.queue))):
+            handle = self.queue.pop_last()
+            if handle.node is not None:
+                self.resident -= handle.size
+                entries.append(self.encode(handle.node))
+            else:
+                entries.append(self.read(handle))
+        return entries
+
+    def lower_bound(self):
+        """
+        :return: 所有节点中父节点LP值的最小值，队列为空时为None
+        """
+        return min((h.value for h in self.queue.nodes()), default=None)
+
+    def entries(self):
+        """
+        :return: 按弹出顺序排列的所有节点的紧凑形式，不改变队列
+        """
+        return [self.encode(h.node) if h.node is not None else self.read(h) for h in self.queue.nodes()]
+
+    def get_stats(self):
+        return {'resident_bytes': self.resident, 'peak_resident_bytes': self.peak_resident,
+                'nodes_spilled': self.n_spilled, 'nodes_loaded': self.n_loaded, 'spilled_bytes': self.spilled_bytes}
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def empty(self):
+        return self.queue.empty()
+
+    def __len__(self):
+        return len(self.queue)
+
+
+if __name__ == '__main__':
+    pass
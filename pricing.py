@@ -6,80 +6,104 @@
 # Description:
 # from gurobimodel import *
 from labelSetting import LabelSetting
-from gurobipy import *
+from lpBackend import get_backend, BINARY, LESS_EQUAL
 
 
 class Pricing:
-    def __init__(self, s, use_model=False):
+    def __init__(self, s, use_model=False, backend=None, delta=5):
         self.data = None
         self.s = s  # ((1, 2, 3), (4, 5, 6),...)
         self.n = None
         self.graph = None
-        self.pricing = None  # Model()
-        self.y, self.z = None, None
+        self.pricing = None  # LPBackend
+        self.backend = get_backend(backend)  # LPBackend class
+        self.y, self.z = None, None  # {item_id: col_name}, {(1, 2, 3): col_name}
         self.use_model = use_model  # 使用模型求解
         self.lab = None  # LabelSetting类
+        self.delta = delta  # label setting每次最多返回的列数
 
     def build_model(self, data, graph):
-        self.pricing = Model("pricing")
+        self.pricing = self.backend("pricing")
 
-        item_id = [item.id for item in data.items]
-        w = {item.id: item.width for item in data.items}
-        self.y = self.pricing.addVars(item_id, vtype=GRB.BINARY, name="y")
-
-        self.pricing.addConstr(quicksum(self.y[i] * w[i] for i in item_id),
-                               GRB.LESS_EQUAL, data.capacity, name="capacity")
+        item_id = data.ids.tolist()
+        w = dict(zip(item_id, data.widths.tolist()))
+        coeffs = {i: {"capacity": w[i]} for i in item_id}  # 按列添加系数 {item_id: {row_name: value}}
+        self.pricing.add_row("capacity", LESS_EQUAL, data.capacity)
 
+        z_coeffs = {}
         if self.s is not None:
-            self.z = self.pricing.addVars(self.s, vtype=GRB.BINARY, name="z")
-
             # self.s中item id可能已经被删除，因此添加条件i in item_id and j in item_id
-            self.pricing.addConstrs((self.z[s] >= self.y[i] + self.y[j] - 1
-                                     for s in self.s for i in s for j in s if i < j and i in item_id and j in item_id),
-                                    name="sr_constr1")
-            self.pricing.addConstrs((self.z[s] <= self.y[i] + self.y[j]
-                                     for s in self.s for i in s for j in s if i < j and i in item_id and j in item_id),
-                                    name="sr_constr2")
+            # z[s] >= y[i] + y[j] - 1 以及 z[s] <= y[i] + y[j]
+            for s in self.s:
+                z_coeffs[s] = {}
+                key = ",".join(str(i) for i in s)
+                for i in s:
+                    for j in s:
+                        if i < j and i in coeffs and j in coeffs:
+                            row1, row2 = f"sr_constr1[{key},{i},{j}]", f"sr_constr2[{key},{i},{j}]"
+                            self.pricing.add_row(row1, LESS_EQUAL, 1)
+                            self.pricing.add_row(row2, LESS_EQUAL, 0)
+                            coeffs[i][row1] = coeffs[j][row1] = 1
+                            coeffs[i][row2] = coeffs[j][row2] = -1
+                            z_coeffs[s][row1], z_coeffs[s][row2] = -1, 1
         if graph.has_node():  # 图不为空
-            self.pricing.addConstrs((self.y[i] + self.y[j] <= 1
-                                     for i, j in graph.get_all_edges()), name="incompatibility")
-        self.pricing.ModelSense = GRB.MAXIMIZE
-        self.set_parameters()
-
-    def set_parameters(self):
-        self.pricing.Params.OutputFlag = False
+            for i, j in graph.get_all_edges():
+                if i not in coeffs or j not in coeffs:
+                    continue
+                row = f"incompatibility[{i},{j}]"
+                self.pricing.add_row(row, LESS_EQUAL, 1)
+                coeffs[i][row] = coeffs[j][row] = 1
+
+        self.y = {i: f"y[{i}]" for i in item_id}
+        for i in item_id:
+            self.pricing.add_col(self.y[i], coeffs=coeffs[i], vtype=BINARY)
+        if self.s is not None:
+            self.z = {s: "z[{},{},{}]".format(*s) for s in self.s}
+            for s in self.s:
+                self.pricing.add_col(self.z[s], coeffs=z_coeffs[s], vtype=BINARY)
+        self.pricing.set_sense(maximize=True)
 
     def update_objective(self, exact, sr):
-        self.pricing.update()
         for x, v in zip(self.y.values(), exact):
-            x.obj = v
+            self.pricing.set_obj(x, v)
         if self.z is not None:
             for x, v in zip(self.z.values(), sr):
-                x.obj = v
+                self.pricing.set_obj(x, v)
 
     def optimize(self):
-        self.pricing.update()
         self.pricing.optimize()
 
+    @property
+    def engine(self):
+        return 'model' if self.use_model else 'labeling'
+
+    def get_counters(self):
+        # 最近一次求解的统计量
+        if self.use_model or self.lab is None:
+            return {}
+        return {'labels_created': self.lab.n_created, 'labels_dominated': self.lab.n_dominated,
+                'labels_fathomed': self.lab.n_fathomed}
+
     def get_reduced_cost(self):
 
         if self.use_model:
-            return 1 - self.pricing.objVal
+            return 1 - self.pricing.get_objVal()
         else:
             if self.lab.labels:
                 return self.lab.labels[0].c
             return 0
 
     def getConstrs(self):
-        return self.pricing.getConstrs()
+        return self.pricing.row_names()
 
     def get_coe(self):
         sr_coe = []
         if self.use_model:
             # round() 为避免数值误差
-            exact_coe = [round(v.x) for v in self.y.values()]
+            x = self.pricing.get_primals()
+            exact_coe = [round(x[v]) for v in self.y.values()]
             if self.s is not None:
-                sr_coe = [round(v.x) for v in self.z.values()]
+                sr_coe = [round(x[v]) for v in self.z.values()]
             res = [exact_coe + sr_coe]
         else:
             res = []
@@ -104,7 +128,7 @@ class Pricing:
             self.optimize()
         else:
             self.n = data.n
-            self.lab = LabelSetting(data, self.s, ex_dual, sr_dual, graph)
+            self.lab = LabelSetting(data, self.s, ex_dual, sr_dual, graph, delta=self.delta)
             self.lab.solve()
 
 
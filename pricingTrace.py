@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 02:20
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 定价问题的输入记录与回放，在相同的对偶值上比较不同的定价方法(label setting、模型以及今后的其他方法)，排除LP求解的影响
+# 1.记录：列生成每次求解定价问题时，写入(物品, 容量, 冲突图, sr不等式的物品三元组s, ex_dual, sr_dual)
+#   以及参考结果(定价方法、reduced cost与求解时间)
+# 2.回放：以指定的定价方法重新求解记录中的每个定价问题，统计每次求解的时间、创建的label数，
+#   以及reduced cost是否与参考结果一致(均取min(rc, 0)，两者的差不超过ReducedEpsilon)
+# 文件格式(gzip压缩)：MAGIC之后为若干条记录，每条记录以一个字节的类型开始
+#   'S': sr不等式的物品三元组，int64[3 * m]，之后的'P'记录均使用该三元组，s改变时重新写入
+#   'P': 头部HEADER(n, capacity, 冲突边数, sr对偶值个数, 定价方法, reference rc, 求解时间)，之后依次为
+#        ids int64[n], widths int64[n], 冲突边(物品索引对) int32[2 * 边数], ex_dual float64[n], sr_dual float64[...]
+# 用法: python pricingTrace.py record data.txt trace.bin --backend highs
+#       python pricingTrace.py replay trace.bin --engines labeling model --backend highs
+import argparse
+import gzip
+import struct
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from graph import Graph
+from instance import Instance
+from pricing import Pricing
+from uti import ReducedEpsilon, iter_bits
+
+MAGIC = b'BPPTRACE1\n'
+HEADER = struct.Struct('<IqIIBdd')
+ENGINES = ('labeling', 'model')
+
+
+class TraceWriter:
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.file = gzip.open(file_name, 'wb')
+        self.file.write(MAGIC)
+        self.s = None  # 最近一次写入的三元组
+        self.n_records = 0
+
+    def write_s(self, s):
+        s = np.array(s if s is not None else [], dtype=np.int64).reshape(-1)
+        self.file.write(b'S' + struct.pack('<I', len(s) // 3) + s.tobytes())
+
+    def record(self, rmp, ex_dual, sr_dual, elapsed):
+        """
+        记录一次定价问题，在rmp.optimize_pricing之后调用
+        :param rmp: MasterModel，使用其物品、冲突图、s以及定价问题的结果
+        :param elapsed: 定价问题的求解时间(s)
+        """
+        if self.n_records == 0 or rmp.s is not self.s:
+            self.write_s(rmp.s)
+            self.s = rmp.s
+        data, graph = rmp.data, rmp.graph
+        edges = np.array([(k, h) for k in range(data.n) for h in iter_bits(graph.mask(k)) if h > k],
+                         dtype=np.int32).reshape(-1)
+        self.file.write(b'P' + HEADER.pack(data.n, data.capacity, len(edges) // 2, len(sr_dual),
+                                           ENGINES.index(rmp.pricing.engine), rmp.get_reduced_cost(), elapsed))
+        for array in (data.ids, data.widths, edges, np.asarray(ex_dual, dtype=np.float64),
+                      np.asarray(sr_dual, dtype=np.float64)):
+            self.file.write(np.ascontiguousarray(array).tobytes())
+        self.n_records += 1
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def read_array(file, dtype, count):
+    size = np.dtype(dtype).itemsize * count
+    buffer = file.read(size)
+    if len(buffer) != size:
+        raise ValueError("Truncated pricing trace")
+    return np.frombuffer(buffer, dtype=dtype)
+
+
+def read_trace(file_name):
+    """
+    :return: 生成器，每次定价问题为{'data': Instance, 'graph': Graph, 's', 'ex_dual', 'sr_dual', 'engine', 'rc', 'time'}
+    """
+    with gzip.open(file_name, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{file_name} is not a pricing trace")
+        s = None
+        while True:
+            kind = file.read(1)
+            if not kind:
+                return
+            if kind == b'S':
+                m, = struct.unpack('<I', file.read(4))
+                s = tuple(tuple(t) for t in read_array(file, np.int64, 3 * m).reshape(-1, 3).tolist()) if m else None
+                continue
+            if kind != b'P':
+                raise ValueError(f"Unknown record type {kind!r} in the pricing trace")
+            n, capacity, n_edges, n_sr, engine, rc, elapsed = HEADER.unpack(file.read(HEADER.size))
+            ids, widths = read_array(file, np.int64, n), read_array(file, np.int64, n)
+            edges = read_array(file, np.int32, 2 * n_edges).reshape(-1, 2)
+            ex_dual, sr_dual = read_array(file, np.float64, n), read_array(file, np.float64, n_sr)
+
+            data = Instance(widths=widths, capacity=capacity)
+            data.set_widths(widths, ids)
+            graph = Graph(data.ids.tolist())
+            for k, h in edges.tolist():
+                graph.add_edges_mask(k, 1 << h)
+            yield {'data': data, 'graph': graph, 's': s, 'ex_dual': ex_dual.tolist(), 'sr_dual': sr_dual.tolist(),
+                   'engine': ENGINES[engine], 'rc': rc, 'time': elapsed}
+
+
+def replay(file_name, engines=ENGINES, backend=None, delta=5, verbose=False):
+    """
+    :param engines: 回放的定价方法
+    :return: {engine: {'calls', 'time', 'time_per_call', 'labels_created', 'mismatches', 'max_error'}}，
+             另有'reference': 记录时的定价方法的调用次数与时间
+    """
+    results = {engine: defaultdict(float) for engine in engines}
+    reference = defaultdict(float)
+    pricings = {}  # {(engine, s): Pricing}，与MasterModel相同，s相同的定价问题共用一个Pricing
+    for k, record in enumerate(read_trace(file_name)):
+        reference['calls'] += 1
+        reference['time'] += record['time']
+        expected = min(record['rc'], 0)
+        for engine in engines:
+            key = (engine, record['s'])
+            if key not in pricings:
+                pricings[key] = Pricing(record['s'], use_model=engine == 'model', backend=backend, delta=delta)
+            pricing = pricings[key]
+            start = time.perf_counter()
+            pricing.solve(record['ex_dual'], record['sr_dual'], record['data'], record['graph'])
+            elapsed = time.perf_counter() - start
+            error = abs(min(pricing.get_reduced_cost(), 0) - expected)
+            result = results[engine]
+            result['calls'] += 1
+            result['time'] += elapsed
+            result['labels_created'] += pricing.get_counters().get('labels_created', 0)
+            result['mismatches'] += error > ReducedEpsilon
+            result['max_error'] = max(result['max_error'], error)
+            if verbose and error > ReducedEpsilon:
+                print(f"call {k}: {engine} rc = {pricing.get_reduced_cost()}, reference ({record['engine']}) "
+                      f"rc = {record['rc']}")
+    summary = {}
+    for engine, result in results.items():
+        calls = int(result['calls'])
+        summary[engine] = {'calls': calls, 'time': result['time'],
+                           'time_per_call': result['time'] / calls if calls else 0.0,
+                           'labels_created': int(result['labels_created']), 'mismatches': int(result['mismatches']),
+                           'max_error': result['max_error']}
+    summary['reference'] = {'calls': int(reference['calls']), 'time': reference['time']}
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Record pricing problems of a solve and replay them on pricing engines")
+    commands = parser.add_subparsers(dest='command', required=True)
+    record = commands.add_parser('record', help="solve an instance and write every pricing problem to a trace")
+    record.add_argument('file', help="instance file, see reader")
+    record.add_argument('trace', help="output trace file")
+    record.add_argument('--pricing', default='labeling', choices=ENGINES, help="pricing engine of the solve")
+    record.add_argument('--time-limit', type=float, default=None)
+    record.add_argument('--backend', default=None, help="LP backend, see lpBackend.BACKENDS")
+    play = commands.add_parser('replay', help="re-run pricing engines on a trace")
+    play.add_argument('trace')
+    play.add_argument('--engines', nargs='+', default=list(ENGINES), choices=ENGINES)
+    play.add_argument('--delta', type=int, default=5, help="maximum number of columns returned by label setting")
+    play.add_argument('--backend', default=None, help="LP backend of the pricing model")
+    play.add_argument('--verbose', action='store_true', help="print every mismatch")
+    args = parser.parse_args(argv)
+
+    if args.command == 'record':
+        from searchTree import SearchTree
+
+        tree = SearchTree(Instance(args.file), verbose=False, pricing=args.pricing, time_limit=args.time_limit,
+                          backend=args.backend, pricing_trace=args.trace)
+        tree.solve()
+        print(f"value = {tree.incumbent.value}, {tree.pricing_trace.n_records} pricing problem(s) written to "
+              f"{args.trace}")
+        return 0
+
+    summary = replay(args.trace, args.engines, args.backend, args.delta, args.verbose)
+    reference = summary.pop('reference')
+    print(f"{reference['calls']} pricing problem(s), reference time = {reference['time']:.3f}s")
+    print("engine\tcalls\ttime(s)\ttime/call(ms)\tlabels\tmismatches\tmax error")
+    for engine, result in summary.items():
+        print(f"{engine}\t{result['calls']}\t{result['time']:.3f}\t{result['time_per_call'] * 1000:.3f}\t"
+              f"{result['labels_created']}\t{result['mismatches']}\t{result['max_error']:.2e}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
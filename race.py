@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 22:30
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 配置组合竞速：在多个进程中以不同配置求解同一个实例，进程之间共享最佳可行解的目标值，
+# 第一个证明最优性的配置获胜，其余进程在下一个节点或列生成迭代之前停止
+# 用法: python race.py data.txt --configs depth best no_cuts --time-limit 60
+import argparse
+import json
+import multiprocessing
+import queue
+import sys
+import time
+
+from instance import Instance
+from searchTree import SearchTree
+from solution import Solution
+
+# 默认的配置组合 {name: SearchTree的参数}
+PORTFOLIO = {
+    'depth': {'strategy': 'depth'},
+    'best': {'strategy': 'best'},
+    'no_cuts': {'add_cuts': False},
+    'model_pricing': {'pricing': 'model'},
+}
+
+
+def run_config(name, config, instance, time_limit, best, stop, results):
+    """
+    工作进程：best为共享的最佳可行解目标值(原实例)，stop为所有进程共享的停止事件
+    """
+    tree = None
+
+    def callback(record):
+        if record['event'] == 'incumbent':
+            with best.get_lock():
+                if record['value'] < best.value:
+                    best.value = record['value']
+                    results.put(('incumbent', name, record['value'], tree.restored_bins()))
+        elif tree.ub is not None and best.value - tree.n_fixed < tree.ub:
+            # 其他配置找到的更好的可行解只用于剪枝
+            tree.ub = best.value - tree.n_fixed
+            tree.incumbent = Solution(tree.ub, {}, None, None)
+
+    start = time.time()
+    tree = SearchTree(instance, verbose=False, time_limit=time_limit, callback=callback, cancel=stop, **config)
+    tree.solve()
+    proved = tree.lb >= tree.ub and not stop.is_set()
+    if proved:
+        stop.set()
+    # solve()结束后incumbent.bins已还原为原实例的箱子；来自其他配置的可行解只有目标值(bins为None)
+    value, bins = None, None
+    if tree.incumbent.bins is not None:
+        value, bins = tree.incumbent.value, [b.tolist() for b in tree.incumbent.bins]
+    results.put(('done', name, {'lb': tree.lb, 'ub': tree.ub, 'nodes': tree.n_nodes, 'proved': proved,
+                                'time': time.time() - start}, value, bins))
+
+
+def race(instance, configs=None, time_limit=None, verbose=True, **kwargs):
+    """
+    :param configs: {name: SearchTree的参数}，默认为PORTFOLIO
+    :param time_limit: 每个配置的时间限制(s)
+    :param kwargs: 所有配置共同的SearchTree参数，例如backend
+    :return: {'winner': 证明最优性的配置(没有则为None), 'value': ..., 'lb': ..., 'bins': [[item_id,...],...],
+              'time': ..., 'results': {name: {'lb', 'ub', 'nodes', 'proved', 'time'}}}
+    """
+    configs = configs if configs is not None else PORTFOLIO
+    start = time.time()
+    best = multiprocessing.Value('d', float('inf'))
+    stop = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=run_config, args=(name, {**kwargs, **config}, instance, time_limit,
+                                                                  best, stop, results), daemon=True)
+                 for name, config in configs.items()]
+    for process in processes:
+        process.start()
+
+    winner, bins, value, lb, finished = None, None, None, None, {}
+    while len(finished) < len(processes):
+        try:
+            message = results.get(timeout=1)
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes):  # 进程异常退出
+                break
+            continue
+        if message[0] == 'incumbent':
+            _, name, value, bins = message
+            if verbose:
+                print(f"{name}: incumbent = {value}, elapsed = {time.time() - start:.2f}s")
+        else:
+            _, name, result, done_value, done_bins = message
+            finished[name] = result
+            # 没有收到incumbent消息(例如约简固定了所有物品)时使用进程结束时的最佳可行解
+            if done_bins is not None and (value is None or done_value < value):
+                value, bins = done_value, done_bins
+            lb = result['lb'] if lb is None else max(lb, result['lb'])
+            if result['proved'] and winner is None:
+                winner = name
+                if verbose:
+                    print(f"{name}: optimal, elapsed = {time.time() - start:.2f}s")
+    for process in processes:
+        process.join(5)
+        if process.is_alive():
+            process.terminate()
+    return {'winner': winner, 'value': value, 'lb': lb, 'bins': bins, 'time': time.time() - start,
+            'results': finished}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Race several solver configurations on one 1D-BPP instance")
+    parser.add_argument('file', help="instance file, see reader")
+    parser.add_argument('--configs', nargs='+', default=list(PORTFOLIO),
+                        help=f"names in {sorted(PORTFOLIO)} or JSON objects of SearchTree kwargs")
+    parser.add_argument('--time-limit', type=float, default=None)
+    parser.add_argument('--backend', default=None, help="LP backend shared by all configurations")
+    args = parser.parse_args(argv)
+
+    configs = {name: PORTFOLIO[name] if name in PORTFOLIO else json.loads(name) for name in args.configs}
+    result = race(Instance(args.file), configs, args.time_limit, backend=args.backend)
+    print(f"winner = {result['winner']}, value = {result['value']}, lb = {result['lb']}, "
+          f"time = {result['time']:.2f}s")
+    for name, r in result['results'].items():
+        print(f"{name}\t{r}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
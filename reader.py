@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 17:00
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 多格式实例读取：本仓库的data.txt格式、BPPLIB/Scholl格式、OR-Library(binpack1~8)格式，
+# 支持.gz/.bz2/.xz压缩文件以及.zip/.tar(.gz/.bz2/.xz)归档
+# 尺寸一次性解析为NumPy数组，可选地(cache=True)以.npy文件缓存，再次读取时以内存映射方式打开
+#
+# data.txt:     capacity, n \n C \t n \n\n weight \n w_1 ... w_n
+# BPPLIB/Scholl: n \n C \n w_1 ... w_n，或者 m \n C \n w_1 d_1 ... w_m d_m (尺寸与数量)
+# OR-Library:   P \n name \n C n best \n w_1 ... w_n \n name \n ...
+import bz2
+import glob
+import gzip
+import hashlib
+import json
+import lzma
+import os
+import tarfile
+import zipfile
+
+try:
+    import numpy as np
+except ImportError:  # 没有numpy时返回列表，且不使用缓存
+    np = None
+
+CACHE_DIR = os.environ.get('BPP_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'bpp'))
+COMPRESSED = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+
+def to_array(tokens):
+    """
+    :param tokens: [str,...] 数值字符串
+    :return: 整数数组(没有numpy时为列表)
+    """
+    if np is None:
+        return [int(float(t)) if '.' in t else int(t) for t in tokens]
+    try:
+        return np.array(tokens, dtype=np.int64)
+    except ValueError:  # 形如"12.0"的尺寸
+        values = np.array(tokens, dtype=float)
+        if not np.all(values == np.floor(values)):
+            raise ValueError("Only integer widths are supported")
+        return values.astype(np.int64)
+
+
+def parse_text(text, name=""):
+    """
+    :param text: 文件内容
+    :param name: 实例名，OR-Library格式中使用文件内的实例名
+    :return: [(name, capacity, widths),...]
+    """
+    lines = text.split('\n', 2)
+    first = lines[0].split()
+    if not first:
+        return []
+    if not first[0].lstrip('-').isdigit():  # data.txt格式，首行为表头
+        tokens = [t for t in text.split() if t.isdigit()]
+        capacity, n = int(tokens[0]), int(tokens[1])
+        return [(name, capacity, to_array(tokens[2:2 + n]))]
+
+    second = lines[1].split() if len(lines) > 1 else []
+    if second and not second[0].isdigit():  # OR-Library，一个文件包含多个实例
+        tokens = text.split()
+        records, k = [], 1
+        for _ in range(int(tokens[0])):
+            capacity, n = int(float(tokens[k + 1])), int(tokens[k + 2])
+            records.append((tokens[k], capacity, to_array(tokens[k + 4:k + 4 + n])))
+            k += 4 + n
+        return records
+
+    tokens = text.split()
+    m, capacity = int(tokens[0]), int(float(tokens[1]))
+    body = tokens[2:]
+    if len(body) == 2 * m and len(lines) > 2 and len(lines[2].split('\n', 1)[0].split()) == 2:
+        pairs = to_array(body)  # 尺寸与数量成对给出
+        if np is None:
+            widths = [w for w, d in zip(pairs[::2], pairs[1::2]) for _ in range(d)]
+        else:
+            widths = np.repeat(pairs[::2], pairs[1::2])
+        return [(name, capacity, widths)]
+    return [(name, capacity, to_array(body[:m]))]
+
+
+def iter_members(file_name):
+    """
+    :return: generator of (name, text)，普通文件与压缩文件只有一个成员，归档文件按成员名排序
+    """
+    base = os.path.basename(file_name)
+    if zipfile.is_zipfile(file_name):
+        with zipfile.ZipFile(file_name) as archive:
+            for member in sorted(archive.namelist()):
+                if not member.endswith('/'):
+                    yield f"{base}/{member}", archive.read(member).decode()
+    elif tarfile.is_tarfile(file_name):
+        with tarfile.open(file_name) as archive:
+            members = sorted((m for m in archive.getmembers() if m.isfile()), key=lambda m: m.name)
+            for member in members:
+                yield f"{base}/{member.name}", archive.extractfile(member).read().decode()
+    else:
+        stem, ext = os.path.splitext(base)
+        opener = COMPRESSED.get(ext)
+        if opener is None:
+            stem, opener = base, open
+        with opener(file_name, 'rt') as file:
+            yield stem, file.read()
+
+
+def parse_file(file_name):
+    """
+    :return: [(name, capacity, widths),...]，不使用缓存
+    """
+    records = []
+    for name, text in iter_members(file_name):
+        records += parse_text(text, name)
+    return records
+
+
+def cache_key(file_name):
+    st = os.stat(file_name)
+    key = f"{os.path.abspath(file_name)}|{st.st_size}|{st.st_mtime_ns}"
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def write_cache(path, records):
+    """
+    所有实例的数据依次保存为 [C, n, w_1, ..., w_n, C, n, ...]，实例名保存在同名的.json文件中
+    """
+    parts = [np.zeros(0, dtype=np.int64)]
+    for _, capacity, widths in records:
+        parts += [np.array([capacity, len(widths)], dtype=np.int64), np.asarray(widths, dtype=np.int64)]
+    data = np.concatenate(parts)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp + '.npy', 'wb') as file:
+        np.save(file, data)
+    with open(tmp + '.json', 'w') as file:
+        json.dump([name for name, _, _ in records], file)
+    # 先写临时文件再重命名，多个进程同时读取同一文件时不会读到不完整的缓存
+    os.replace(tmp + '.json', path + '.json')
+    os.replace(tmp + '.npy', path + '.npy')
+
+
+def read_cache(path):
+    with open(path + '.json') as file:
+        names = json.load(file)
+    data = np.load(path + '.npy', mmap_mode='r')
+    records, k = [], 0
+    for name in names:
+        capacity, n = int(data[k]), int(data[k + 1])
+        records.append((name, capacity, data[k + 2:k + 2 + n]))
+        k += 2 + n
+    return records
+
+
+def read_file(file_name, cache=False, cache_dir=None):
+    """
+    :param file_name: 实例文件，可以是压缩文件或归档
+    :param cache: 是否使用二进制缓存，文件的路径、大小或修改时间变化后缓存失效
+    :param cache_dir: 缓存目录，默认为环境变量BPP_CACHE_DIR或~/.cache/bpp
+    :return: [(name, capacity, widths),...]，使用缓存时widths为只读的内存映射数组
+    """
+    if not cache or np is None:
+        return parse_file(file_name)
+    cache_dir = cache_dir if cache_dir is not None else CACHE_DIR
+    path = os.path.join(cache_dir, cache_key(file_name))
+    try:
+        return read_cache(path)
+    except (OSError, ValueError):
+        pass
+    records = parse_file(file_name)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        write_cache(path, records)
+    except OSError:  # 缓存目录不可写时直接返回解析结果
+        pass
+    return records
+
+
+def iter_files(source):
+    """
+    :param source: 文件、目录(递归)或glob模式
+    """
+    if os.path.isdir(source):
+        for root, _, files in sorted(os.walk(source)):
+            for name in sorted(files):
+                yield os.path.join(root, name)
+    elif os.path.isfile(source):
+        yield source
+    else:
+        yield from sorted(f for f in glob.glob(source, recursive=True) if os.path.isfile(f))
+
+
+def read_all(source, cache=False, cache_dir=None):
+    """
+    :return: generator of (name, capacity, widths)，读取source中所有文件的所有实例
+    """
+    for file_name in iter_files(source):
+        yield from read_file(file_name, cache, cache_dir)
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 20:10
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 节点列生成收敛后的reduced cost固定
+# 设节点的LP值为z，对偶值为(pi, sigma)，任一使用列j的整数解的目标值不小于 z + rc_j，
+# 目标值为整数，改进当前最佳可行解ub的解满足目标值 <= ub - 1，因此
+# 1.删除列: rc_j > ub - 1 - z 的列不会出现在该节点子树的改进解中，从RMP中删除
+# 2.固定物品对: 同时包含物品a,b的列的reduced cost下界为
+#   1 - pi_a - pi_b - FK(C - w_a - w_b)，FK为以pi为价值的分数背包上界，
+#   下界大于 ub - 1 - z 时a,b不可能装入同一个箱子，在冲突图中加边
+# sigma <= 0 (sr不等式为<=约束)，忽略sr项得到的仍是下界
+# 结论依赖定价问题的精确求解，只作用于该节点及其子节点
+import numpy as np
+
+from uti import ComparisonEpsilon
+
+
+def reduced_costs(rmp):
+    """
+    :return: {col_name: reduced cost}
+    """
+    duals = rmp.model.get_duals()
+    return {name: 1 - sum(duals[row] * v for row, v in rmp.model.get_col(name).items())
+            for name in rmp.model.col_names()}
+
+
+def fix_columns(node, gap):
+    """
+    删除reduced cost大于gap的列，只包含一个物品的列保证子节点RMP可行，不删除
+    :return: 删除的列数
+    """
+    rmp = node.rmp
+    solutions = node.get_solution()
+    removed = 0
+    for name, rc in reduced_costs(rmp).items():
+        if rc > gap + ComparisonEpsilon and solutions.get(name, 0) <= ComparisonEpsilon \
+                and len(rmp.model.get_col(name)) > 1:
+            rmp.model.remove_col(name)
+            removed += 1
+    return removed
+
+
+def fractional_knapsack(widths, values, residuals):
+    """
+    :param widths: 物品尺寸
+    :param values: 物品价值，只考虑价值为正的物品
+    :param residuals: 剩余容量数组
+    :return: 每个剩余容量对应的分数背包最优值
+    """
+    positive = values > ComparisonEpsilon
+    w, v = widths[positive].astype(float), values[positive]
+    order = np.argsort(-v / w, kind='stable')
+    w, v = w[order], v[order]
+    prefix_w = np.concatenate([[0.0], np.cumsum(w)])
+    prefix_v = np.concatenate([[0.0], np.cumsum(v)])
+    t = np.searchsorted(prefix_w, residuals, side='right') - 1  # 可以完整装入的物品数
+    ratio = np.concatenate([v / w, [0.0]])
+    return prefix_v[t] + (residuals - prefix_w[t]) * ratio[t]
+
+
+def fix_pairs(node, gap):
+    """
+    在冲突图中为不可能出现在改进解中同一箱子的物品对加边，并删除同时包含这两个物品的列
+    :return: 加入的边数
+    """
+    rmp = node.rmp
+    data, graph = rmp.data, rmp.graph
+    exact, _ = rmp.get_dual()
+    pi, widths = np.array(exact, dtype=float), data.widths
+    residual = data.capacity - widths[:, None] - widths[None, :]
+    # 同时包含a,b的列还可以装入其他物品(包括a,b本身，只会使上界变松)
+    bound = 1 - pi[:, None] - pi[None, :] - fractional_knapsack(widths, pi, np.maximum(residual, 0))
+    candidates = np.argwhere(np.triu((residual >= 0) & (bound > gap + ComparisonEpsilon), 1))
+    ids = data.ids.tolist()
+    added = 0
+    for a, b in candidates.tolist():
+        u, v = ids[a], ids[b]
+        if graph.has_edge(u, v):
+            continue
+        graph.add_edge(u, v)
+        for var_id in node.p.pop((u, v), ()):
+            rmp.removeVarById(var_id)
+        added += 1
+    return added
+
+
+def reduced_cost_fixing(node, ub, fix_pair=True):
+    """
+    :param node: 列生成已收敛的节点
+    :param ub: 当前最佳可行解的目标值(约简后的实例)
+    :param fix_pair: 是否固定物品对
+    :return: (删除的列数, 加入的冲突边数)
+    """
+    gap = ub - 1 - node.solution.value
+    if gap < -ComparisonEpsilon:  # 该节点不可能包含改进解
+        return 0, 0
+    removed = fix_columns(node, gap)
+    added = fix_pairs(node, gap) if fix_pair else 0
+    return removed, added
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 13:20
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 实例的预处理与约简(Martello-Toth reduction procedure, MTRP)
+# 固定被支配的箱子后，只需求解剩余物品构成的实例，再将固定的箱子加回结果
+from bisect import bisect_right
+
+from instance import Instance
+
+
+def has_larger_subset(a, j, cap, target):
+    """
+    除索引j以外的物品能否装出大于target且不超过cap的总尺寸，以python整数作为位集合求解子集和
+    :return: True if such a subset exists
+    """
+    mask = (1 << (cap + 1)) - 1
+    reach = 1
+    for i, v in enumerate(a):
+        if i == j or v > cap:
+            continue
+        reach = (reach | (reach << v)) & mask
+        if reach >> (target + 1):
+            return True
+    return False
+
+
+def mtrp(widths, capacity, subset_sum=True):
+    """
+    按尺寸从大到小考虑物品j，若{j}或{j, k}支配所有包含j的可行集合，则固定该箱子：
+    1.物品j无法与其他任一物品装入同一箱子，则{j}
+    2.k为能与j装入同一箱子的最大物品，若w_j + w_k = C，或j无法再装入两个物品，
+      或(subset_sum为True时)其余物品能与j装入的最大总尺寸不超过w_k，则{j, k}
+    :param widths: 物品尺寸
+    :param capacity:
+    :param subset_sum: 是否使用子集和检验条件2，复杂度为O(n * C / 64)
+    :return: fixed = [[index,...],...] 固定的箱子，free = [index,...] 剩余物品(按尺寸升序)
+    """
+    free = sorted(range(len(widths)), key=widths.__getitem__)
+    a = [widths[i] for i in free]
+    fixed = []
+    j = len(a) - 1
+    while j >= 0:
+        w = a[j]
+        smallest = [a[i] for i in range(min(3, len(a))) if i != j][:2]  # 除j以外最小的两个物品
+        if not smallest or w + smallest[0] > capacity:
+            fixed.append([free.pop(j)])
+            a.pop(j)
+            j -= 1
+            continue
+        k = bisect_right(a, capacity - w) - 1  # 能与j装入同一箱子的最大物品
+        if k == j:
+            k -= 1
+        dominated = w + a[k] == capacity or len(smallest) < 2 or w + smallest[0] + smallest[1] > capacity
+        if not dominated and subset_sum:
+            dominated = not has_larger_subset(a, j, capacity - w, a[k])
+        if dominated:
+            fixed.append([free[j], free[k]])
+            for i in (max(j, k), min(j, k)):
+                free.pop(i)
+                a.pop(i)
+            j -= 2 if k < j else 1
+            continue
+        j -= 1
+    return fixed, free
+
+
+class Reduction:
+    def __init__(self, instance, subset_sum=True):
+        self.instance = instance
+        self.subset_sum = subset_sum
+        self.fixed_bins = []  # [[item_id,...],...] 固定的箱子，item id为原实例中的编号
+        self.id_map = {}  # {item id in the reduced instance: item id in the original instance}
+        self.reduced = None  # 约简后的实例，item id重新编号为1..m
+
+    def reduce(self):
+        widths, ids = self.instance.widths.tolist(), self.instance.ids.tolist()
+        fixed, free = mtrp(widths, self.instance.capacity, self.subset_sum)
+        self.fixed_bins = [[ids[i] for i in b] for b in fixed]
+
+        free = sorted(free)  # 保持原实例中的顺序
+        self.id_map = {k: ids[i] for k, i in enumerate(free, start=1)}
+        self.reduced = Instance(widths=[widths[i] for i in free], capacity=self.instance.capacity)
+        return self.reduced
+
+    def restore(self, bins):
+        """
+        :param bins: [[item_id,...],...] 约简后实例的箱子
+        :return: 原实例的箱子，包括固定的箱子
+        """
+        return [[self.id_map[i] for i in b] for b in bins] + [list(b) for b in self.fixed_bins]
+
+
+if __name__ == '__main__':
+    pass
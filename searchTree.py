@@ -6,17 +6,29 @@
 # Description:
 import math
 
-from myQueue import MyQueue
+from nodeStore import NodeStore
 from bpNode import Node
-from masterModel import MasterModel
+from masterModel import MasterModel, ENUMERATIONS
 from solution import Solution
 from columnGeneration import ColumnGeneration as CG
-from uti import is_integer
-from instance import Item
+from uti import is_integer, ComparisonEpsilon
+from lowerBound import lower_bound
+from heuristic import first_fit_decreasing
+from reduction import Reduction
+from reducedCostFixing import reduced_cost_fixing
+from enumeration import solve_by_enumeration
+from nodePresolve import presolve, INFEASIBLE, PRUNED
+from volume import Volume
+from pricingTrace import TraceWriter
+from solverStats import Stats, NullStats
+from instance import Instance
+import checkpoint
 import copy
 import time
 
-from gurobipy import GRB
+import numpy as np
+
+NODE_ENTRY_BYTES = 64  # 估计节点大小时每个非零元或列序号占用的内存
 
 
 class Brancher:
@@ -38,28 +50,25 @@ class BinaryBranch(Brancher):
         :return:
         """
         x, y = None, None
-        items = node.rmp.data.items
+        data = node.rmp.data
+        ids = data.ids.tolist()
+        index = {item_id: k for k, item_id in enumerate(ids)}
         sols = {key: value for key, value in node.get_solution().items() if value > 0}
 
+        # 只考虑node.p中两个物品均未被合并的物品对，按物品索引的字典序遍历
+        pairs = sorted((index[i], index[j]) for i, j in node.p if i in index and j in index)
         min_value = float("inf")
-        for ind, item in enumerate(items):
-            for _ind, _item in enumerate(items):
-                if ind >= _ind:
-                    continue
-
-                if node.p.get((item.id, _item.id), None) is None:
-                    continue
-
-                miu = sum(sols.get(f"x[{p}]", 0) for p in node.p[item.id, _item.id])
-
-                if not is_integer(miu):
-                    if is_integer(miu - 0.5):  # miu == 0.5
-                        return item, _item
-                    if abs(miu - 0.5) < min_value:
-                        min_value = abs(miu - 0.5)
-                        x, y = item, _item
+        for ind, _ind in pairs:
+            miu = sum(sols.get(f"x[{p}]", 0) for p in node.p[ids[ind], ids[_ind]])
+
+            if not is_integer(miu):
+                if is_integer(miu - 0.5):  # miu == 0.5
+                    return data.get_item(ind), data.get_item(_ind)
+                if abs(miu - 0.5) < min_value:
+                    min_value = abs(miu - 0.5)
+                    x, y = ind, _ind
         assert x is not None and y is not None, f"{x=}\t{y=}"
-        return x, y
+        return data.get_item(x), data.get_item(y)
 
     def generate_branches(self, node):
         item1, item2 = self.find_items(node)  # 找到两个item
@@ -80,61 +89,52 @@ class BranchDecisions:
     def apply(self, node):
         new_node = copy.copy(node)
         if self.value == 1:  # item1和item2必须在同一pattern中
-            changed_index, changed_item = -1, None
-            items = node.rmp.data.items
-            # 1.在items集合中合并item1和item2
-            for i, item in enumerate(items):  # 默认合并到最靠前的item
-                if item == self.item1:
-                    changed_item = Item(id=item.id, width=item.width + self.item2.width)
-                    changed_index = i
-                if item == self.item2:
-                    new_node.rmp.data.n -= 1
-                    new_node.rmp.data.items = \
-                        items[:changed_index] + [changed_item] + items[changed_index + 1:i] + items[i + 1:]
-                    break
+            data = new_node.rmp.data
+            # 1.在物品数组中合并item1和item2，合并到item1(即最靠前的item)
+            data.merge(self.item1.id, self.item2.id)
             # 2.在冲突集合中删除包含item2的元组,并将所有连接到item2的边转移到item1中
+            # 与物品数组同步删除item2的索引，从而位集合的索引与data保持一致
             graph = new_node.rmp.graph
-            for connect_node in graph.neighbors(self.item2.id):  # 所有与item2连接的点
-                graph.has_edge(connect_node, self.item1.id)  # 转移边
-            graph.remove_node(self.item2.id)  # 删除节点item2以及连接的所有边
-            assert new_node.rmp.graph is graph
+            graph.merge(self.item1.id, self.item2.id)
+            assert graph.ids == data.ids.tolist()
 
             # 3.在rmp中删除item2对应的行以及所有只包含item1和item2其中一个的列,并更新node.q
             new_node.rmp.removeConstrById(self.item2.id)
-            for q in node.q[self.item1.id, self.item2.id]:
+            # 从根节点重建节点时，该物品对可能只出现在更深节点生成的列中
+            for q in node.q.get((self.item1.id, self.item2.id), ()):
                 # fixme:未更新q 考虑捕捉该函数异常
                 new_node.rmp.removeVarById(q)
 
             # 4.删除列（该列在合并后已经不可行的列）
             model = new_node.rmp.model
-            items = {item.id: item for item in new_node.rmp.data.items}
-            capacity = new_node.rmp.data.capacity
+            capacity = data.capacity
 
-            model.update()
+            constraints = new_node.rmp.constraints
+            width = {constraints[item_id]: w for item_id, w in zip(data.ids.tolist(), data.widths.tolist())}
+            merged_row = new_node.rmp.constraints[self.item1.id]
             del_columns = []
-            for v in model.getVars():
+            for name in model.col_names():
+                column = model.get_col(name)
                 # 该列包含了被合并的items
-                if model.getCoeff(new_node.rmp.constraints[self.item1.id], v) == 1.0:
-                    load = 0
-                    for item_id, constr in new_node.rmp.constraints.items():  # constr_id == item_id
-                        if model.getCoeff(constr, v) == 1.0:
-                            load += items[item_id].width
+                if column.get(merged_row, 0) == 1.0:
+                    load = sum(width[row] for row, v in column.items() if v == 1.0 and row in width)
                     if load > capacity:
-                        del_columns.append(v)
-            for column in del_columns:
-                model.remove(column)
+                        del_columns.append(name)
+            for name in del_columns:
+                model.remove_col(name)
 
         elif self.value == 0:
             # 1.添加冲突集合中的item1和item2
             new_node.rmp.graph.add_edge(self.item1.id, self.item2.id)
             # 2.删除rmp中同时包含item1和item2的列
-            for p in new_node.p[self.item1.id, self.item2.id]:
+            for p in new_node.p.get((self.item1.id, self.item2.id), ()):
                 # fixme:未更新p 考虑捕捉该函数异常
                 new_node.rmp.removeVarById(p)
         else:
             raise ValueError("")
 
         new_node.level = node.level + 1
+        new_node.decisions.append((self.item1.id, self.item2.id, self.value))
         return new_node
 
     def __repr__(self):
@@ -145,95 +145,499 @@ class BranchDecisions:
 class SearchTree:
     def __init__(self, instance, verbose=True, **kwargs):
         self.instance = instance
-        self.queue = MyQueue()  # 初始化列表，默认深度优先（depth-first）
+        # 初始化列表，默认深度优先（depth-first）
+        # memory_budget为驻留节点的估计大小上限(bytes)，超过后将节点写入spill_dir中的临时文件
+        self.queue = NodeStore(self.encode_node, self.decode_node, self.node_size,
+                               budget=kwargs.get('memory_budget', None), strategy=kwargs.get('strategy', 'depth'),
+                               spill_dir=kwargs.get('spill_dir', None))
+        self.root = None  # 根节点，从磁盘读回的节点由根节点重建
         self.incumbent = Solution()  # 初始化最优解
         self.verbose = verbose  # 是否打印相关参数
         self.n_nodes = 0  # 求解的总结点数目
+        self.time_limit = kwargs.get('time_limit', None)  # 求解时间限制(s)，达到后返回当前最佳可行解
 
         self.init_columns = kwargs.get('init_columns', None)
+        # 加入根节点RMP的初始列 [[item_id,...],...]，item id为原实例中的编号，例如相似实例的根节点列
+        self.warm_columns = kwargs.get('warm_columns', None)
+        # 初始可行解 [[item_id,...],...]，item id为原实例中的编号，例如修改前实例的最优解修复后得到的解
+        self.initial_bins = kwargs.get('initial_bins', None)
+        self.root_duals = None  # 根节点列生成结束时RMP的对偶值 {row_name: dual}
+        self.backend = kwargs.get('backend', None)  # LP后端，见lpBackend.BACKENDS
+        self.add_cuts = kwargs.get('add_cuts', True)  # RMP中是否加入sr不等式
+        self.sr_enumeration = ENUMERATIONS[kwargs.get('sr_enumeration', 'separate')]  # sr不等式的物品三元组
+        self.use_model = kwargs.get('pricing', 'labeling') == 'model'  # 定价问题的求解方式，'labeling'或'model'
+        self.label_delta = kwargs.get('label_delta', 5)  # label setting每次最多返回的列数
+        self.reduction = Reduction(instance) if kwargs.get('reduce', True) else None  # 实例约简
+        self.n_fixed = 0  # 约简阶段固定的箱子数目
+        # 分支前根据reduced cost删除列并固定物品对，见reducedCostFixing
+        self.rc_fixing = kwargs.get('rc_fixing', True)
+        # 根节点ceil(LP)与ub相差不超过enumerate_gap时，枚举reduced cost足够小的列并求解集合划分MIP，
+        # 列数超过enumerate_limit时回到分支，None表示不使用，见enumeration
+        self.enumerate_limit = kwargs.get('enumerate_limit', 20000)
+        self.enumerate_gap = kwargs.get('enumerate_gap', 1)
+        # 根节点列生成之前运行体积算法：下界达到上界时不求解LP，否则以其列作为初始列，见volume.Volume
+        self.volume = kwargs.get('volume', False)
+        # 统计信息，stats=False时关闭；trace为JSONL文件名，记录求解过程中的事件
+        # callback为function(record)，每个事件(节点、界、最佳可行解等)都会调用，见asyncSolver
+        self.stats = Stats(kwargs.get('trace', None), kwargs.get('callback', None)) \
+            if kwargs.get('stats', True) else NullStats()
+        # 定价问题的记录文件，见pricingTrace
+        self.pricing_trace = TraceWriter(kwargs['pricing_trace']) if kwargs.get('pricing_trace') else None
+        self.cancel = kwargs.get('cancel', None)  # threading.Event，被设置后在节点之间或列生成迭代之间停止搜索
+        # 断点文件，每隔checkpoint_interval秒以及搜索结束时写入，见checkpoint
+        self.checkpoint = kwargs.get('checkpoint', None)
+        self.checkpoint_interval = kwargs.get('checkpoint_interval', 600)
+        self.resume = kwargs.get('resume', None)  # checkpoint.read()的结果或断点文件名，从断点继续求解
+        if isinstance(self.resume, str):
+            self.resume = checkpoint.read(self.resume)
 
         self.lb = self.ub = None
 
+    @staticmethod
+    def add_heuristic_columns(node):
+        """
+        将first-fit decreasing得到的箱子作为初始列加入RMP
+        """
+        rmp = node.rmp
+        data = rmp.data
+        bins = first_fit_decreasing(data.widths.tolist(), data.capacity, data.order.tolist())
+        coe = [rmp.get_column_coe([1 if i in b else 0 for i in range(data.n)]) for b in bins]
+        node.update_param(coe)
+        rmp.add_col(coe)
+
     def init_solution(self, model):
         """
         初始化解，即设置初始解，从而在搜索过程中尽可能删除 劣解
         具体而言，设置self.ub 和 self.incumbent
         当前使用的方法为，将主问题MasterModel中的变量设置为 0-1变量，并求解该模型
         """
-        relaxed = model.model
-        relaxed.update()
+        mip = model.model.binary_copy()
+        mip.optimize()
 
-        model = relaxed.copy()
-        for v in model.getVars():
-            v.vtype = GRB.BINARY
-        model.optimize()
+        self.ub = round(mip.get_objVal())
+        solutions = mip.get_primals()
+        columns, bins = model.get_bins(solutions)  # 列名与RMP相同
+        self.incumbent = Solution(self.ub, solutions, bins, columns)
 
-        self.ub = round(model.objVal)
+    def get_lower_bound(self, data, use_l3=False):
+        # 组合下界，见lowerBound.lower_bound
+        with self.stats.timer('lower_bound'):
+            return lower_bound(data.widths.tolist(), data.capacity, use_l3=use_l3)
 
-        self.incumbent.value = self.ub
+    def record_bound(self):
+        self.stats.record_bound(self.lb + self.n_fixed, self.ub + self.n_fixed)
 
-    def solve(self):
-        start_time = time.time()
-        m = MasterModel(self.instance, init_columns=self.init_columns)  # 初始化限制主问题(restrict master problem, RMP)
+    @staticmethod
+    def get_columns(node):
+        """
+        :return: [(item_id,...),...] 节点RMP中的所有列，合并的物品被展开，item id升序
+        """
+        rmp = node.rmp
+        return [tuple(sorted(b.tolist())) for b in rmp.get_bins(dict.fromkeys(rmp.model.col_names(), 1))[1]]
+
+    @staticmethod
+    def add_columns(node, columns):
+        """
+        将以item id给出的列加入节点的RMP，跳过已有的列以及在该节点中不可行的列(只包含某个合并物品的一部分)
+        :return: 加入的列数
+        """
+        rmp, data = node.rmp, node.rmp.data
+        index = {}  # {原物品id: 节点中的物品索引}
+        for k in range(data.n):
+            for item_id in data.members(k):
+                index[item_id] = k
+        known = set(SearchTree.get_columns(node))
+        coe = []
+        for column in columns:
+            column = tuple(column)
+            if column in known:
+                continue
+            count = [0] * data.n
+            for item_id in column:
+                count[index[item_id]] += 1
+            if all(c == 0 or c == len(data.members(k)) for k, c in enumerate(count)):
+                coe.append(rmp.get_column_coe([int(c > 0) for c in count]))
+                known.add(column)
+        node.update_param(coe)
+        rmp.add_col(coe)
+        return len(coe)
+
+    def encode_node(self, node):
+        """
+        未求解节点的紧凑形式：从根节点开始的分支决策、父节点的LP值以及RMP中的列
+        """
+        return {'decisions': [list(d) for d in node.decisions],
+                'value': node.solution.value if node.solution is not None else None,
+                'columns': self.get_columns(node)}
+
+    def decode_node(self, entry):
+        """
+        从根节点依次应用分支决策重建节点，再加入节点原有的列
+        """
+        node = self.root
+        for id1, id2, value in entry['decisions']:
+            data = node.rmp.data
+            item1, item2 = data.get_item(data.index(id1)), data.get_item(data.index(id2))
+            node = BranchDecisions(item1, item2, value).apply(node)
+        if node is self.root:
+            node = copy.copy(node)
+        self.add_columns(node, entry.get('columns', ()))
+        node.solution = Solution(entry['value']) if entry['value'] is not None else None
+        return node
 
-        self.init_solution(m)
+    @staticmethod
+    def node_size(node):
+        """
+        节点占用内存的估计值(bytes)，主要为RMP的非零元以及p、q中的列序号
+        """
+        entries = sum(len(col[1]) for col in node.rmp.model.cols.values())
+        entries += sum(len(v) for v in node.p.values()) + sum(len(v) for v in node.q.values())
+        return NODE_ENTRY_BYTES * entries
 
-        node = Node(m)  # 初始化根节点
+    def checkpoint_state(self):
+        """
+        :return: 断点文件的内容，此时所有未求解的节点均在队列中
+        """
+        entries = self.queue.entries()
+        pool = {}  # 所有未求解节点的RMP中的列
+        for entry in entries:
+            pool.update(dict.fromkeys(entry['columns']))
+        # 由其他进程同步得到的最佳可行解只有目标值，没有装箱方案
+        bins = None if self.incumbent.bins is None else [b.tolist() for b in self.incumbent.bins]
+        return {
+            'version': checkpoint.VERSION,
+            'instance': {'name': self.instance.name, 'capacity': self.instance.capacity,
+                         'widths': self.instance.widths.tolist(), 'ids': self.instance.ids.tolist()},
+            'reduce': self.reduction is not None,
+            'n_nodes': self.n_nodes, 'lb': self.lb, 'ub': self.ub,
+            'incumbent': {'value': self.incumbent.value, 'bins': bins},
+            'queue': [{'decisions': entry['decisions'], 'value': entry['value']} for entry in entries],
+            'pool': [list(column) for column in pool],
+            'stats': self.stats.as_dict(),
+        }
+
+    def write_checkpoint(self):
+        with self.stats.timer('checkpoint'):
+            checkpoint.write(self.checkpoint_state(), self.checkpoint)
+        self.stats.event('checkpoint', open_nodes=len(self.queue))
+
+    def restore_checkpoint(self, root, state):
+        """
+        :param root: 根节点
+        :param state: 断点文件的内容
+        """
+        instance = state['instance']
+        if instance['capacity'] != self.instance.capacity or instance['widths'] != self.instance.widths.tolist():
+            raise ValueError("The checkpoint was written for a different instance")
+        # 1.列池中的列加入根节点的RMP
+        n_columns = self.add_columns(root, state['pool'])
+        # 2.最佳可行解、界与统计信息
+        incumbent = state['incumbent']
+        if incumbent['bins'] is None:
+            self.incumbent = Solution(incumbent['value'], {}, None, None)
+        else:
+            bins = [np.array(b, dtype=np.int64) for b in incumbent['bins']]
+            self.incumbent = Solution(incumbent['value'], {}, bins, [None] * len(bins))
+        self.lb, self.ub, self.n_nodes = state['lb'], state['ub'], state['n_nodes']
+        self.stats.load(state['stats'])
+        # 3.从根节点依次应用分支决策，重建所有未求解的节点
+        for entry in state['queue']:
+            self.queue.push(self.decode_node(entry))
+        self.stats.event('resume', open_nodes=len(self.queue), columns=n_columns)
+
+    def setup(self, push_root=True):
+        """
+        约简实例，建立根节点、初始可行解与组合下界
+        :param push_root: 是否将根节点放入队列，分布式求解时节点由coordinator分配
+        :return: False表示约简后没有剩余物品，无需搜索
+        """
+        instance = self.instance
+        if self.reduction is not None:
+            with self.stats.timer('reduction'):
+                instance = self.reduction.reduce()
+            self.n_fixed = len(self.reduction.fixed_bins)
+            if self.verbose:
+                print(f"reduction: {len(self.reduction.fixed_bins)} bin(s) fixed, "
+                      f"{self.instance.n} -> {instance.n} items")
+            if instance.n == 0:  # 所有物品均已固定
+                self.incumbent = Solution(0, {}, [], [])
+                self.lb = self.ub = 0
+                self.stats.event('incumbent', value=self.n_fixed)
+                return False
+
+        # 初始化限制主问题(restrict master problem, RMP)
+        m = MasterModel(instance, add_cuts=self.add_cuts, init_columns=self.init_columns, backend=self.backend,
+                        enumeration=self.sr_enumeration, use_model=self.use_model, label_delta=self.label_delta)
+
+        node = self.root = Node(m)  # 初始化根节点
+        with self.stats.timer('heuristic'):
+            self.add_heuristic_columns(node)
+            if self.warm_columns:
+                self.stats.add('warm_columns', self.add_columns(node, self.reduce_columns(self.warm_columns)))
+            if self.resume is None:
+                self.init_solution(m)
+                if self.initial_bins is not None:
+                    self.set_initial_solution(self.initial_bins)
+                self.stats.event('incumbent', value=self.ub + self.n_fixed)
+        if self.resume is not None:  # 从断点继续，根节点已经求解
+            self.restore_checkpoint(node, self.resume)
+        else:
+            self.lb = self.get_lower_bound(instance, use_l3=True)
+            if push_root:
+                self.queue.push(node)  # 节点入队列
+        self.record_bound()
         if self.verbose:
             print("creating RMP in root node: done")
-        self.queue.push(node)  # 节点入队列
+            print(f"lower bound = {self.lb}\tupper bound = {self.ub}")
+        return True
+
+    def solve(self):
+        start_time = time.time()
+        last_checkpoint = start_time
+        if not self.setup():
+            return self.restore_fixed_bins(start_time)
         if self.verbose:
             print(f"\nSearch strategy: {self.queue.strategy}-first")
         while not self.queue.empty():
             if self.lb is not None and self.ub is not None and abs(self.lb - self.ub) <= 1e-4:
                 break
+            if self.time_limit is not None and time.time() - start_time > self.time_limit:
+                if self.verbose:
+                    print(f"\nTime limit {self.time_limit}s reached")
+                break
+            if self.cancel is not None and self.cancel.is_set():
+                if self.verbose:
+                    print("\nCancelled")
+                break
+            if self.checkpoint is not None and time.time() - last_checkpoint >= self.checkpoint_interval:
+                self.write_checkpoint()
+                last_checkpoint = time.time()
 
-            node = self.queue.pop()  # 弹出节点
-            self.n_nodes += 1
-            if self.verbose:
-                print(f"\nThe {self.n_nodes}th iteration, level = {node.level}")
-
-            # 列生成求解该节点对应的RMP
-            # print(f"{node.rmp.data.n=}")
-            cg = CG(node)
-            node.solution = cg.solve()  # 返回列生成求解的结果
-            if self.n_nodes == 1:
-                self.lb = math.ceil(node.solution.value)
-
-            if node.solution is None:
-                continue
-            # node.rmp.model.write(f"rmp{self.n_nodes}.lp")
+            self.process(self.queue.pop(), start_time)  # 弹出节点
+            # assert self.queue.data[0].rmp.data.items is not self.queue.data[1].rmp.data.items
+        if self.checkpoint is not None:
+            self.write_checkpoint()
+        self.restore_fixed_bins(start_time)
 
-            # fathomed节点的两种情形
-            # 1.该节点最小值大于当前最佳可行解目标值
-            # print(self.incumbent.value, node.solution.value)
-            if self.incumbent.value is not None and \
-                    self.incumbent.value <= node.solution.value:
+    def process(self, node, start_time):
+        """
+        求解一个节点：列生成、剪枝、更新最佳可行解，或者分支并将子节点放入队列
+        """
+        self.n_nodes += 1
+        self.stats.add('nodes')
+        if self.verbose:
+            print(f"\nThe {self.n_nodes}th iteration, level = {node.level}")
+
+        if node.level == 0 and self.volume and node.solution is None:
+            if self.volume_bound(node, start_time):
+                return
+        # 列生成求解该节点对应的RMP
+        # print(f"{node.rmp.data.n=}")
+        deadline = None if self.time_limit is None else start_time + self.time_limit
+        cg = CG(node, stats=self.stats, cancel=self.cancel, trace=self.pricing_trace, deadline=deadline)
+        solution, node.solution = node.solution, cg.solve()  # 返回列生成求解的结果
+        if cg.interrupted:  # 取消求解或达到时间限制，节点放回队列，断点文件中仍包含该节点
+            node.solution = solution
+            self.queue.push(node)
+            self.n_nodes -= 1
+            self.stats.add('nodes', -1)
+            return
+        self.stats.event('node', id=self.n_nodes, level=node.level, value=node.solution.value,
+                         iterations=cg.iterations)
+        if node.level == 0:
+            self.lb = max(self.lb, math.ceil(node.solution.value - ComparisonEpsilon))
+            self.root_duals = node.rmp.model.get_duals()
+            self.record_bound()
+
+        if node.solution is None:
+            return
+        # node.rmp.model.write(f"rmp{self.n_nodes}.lp")
+
+        # fathomed节点的两种情形
+        # 1.该节点最小值大于当前最佳可行解目标值
+        # print(self.incumbent.value, node.solution.value)
+        if self.incumbent.value is not None and \
+                self.incumbent.value <= math.ceil(node.solution.value - ComparisonEpsilon):
+            if self.verbose:
+                print(f"The node is not promising with value being {node.solution.value}")
+            self.stats.add('nodes_pruned')
+            return
+        # 2.该节点是可行解
+        if node.solution.is_integer_solution():  # 如果是整数解，比较更新结果
+            node.solution.columns, node.solution.bins = node.rmp.get_bins(node.get_solution())
+            self.incumbent.update(node.solution)
+            self.ub = self.incumbent.value
+            self.stats.event('incumbent', value=self.ub + self.n_fixed)
+            self.record_bound()
+            if self.verbose:
+                print(f"\nFind a new feasible solution, value={node.solution.value}")
+                # print(node.rmp.data.items)
+                # node.rmp.model.write("test.lp")
+                # print(node.get_solution())
+            return
+        if node.level == 0 and self.enumerate_limit and self.incumbent.value is not None and \
+                self.incumbent.value - math.ceil(node.solution.value - ComparisonEpsilon) <= self.enumerate_gap:
+            if self.enumerate(node, start_time):
+                return
+        if self.verbose:
+            print(f"The node should be branched, and value={node.solution.value}")
+        if self.rc_fixing and self.incumbent.value is not None:
+            with self.stats.timer('reduced_cost_fixing'):
+                removed, added = reduced_cost_fixing(node, self.incumbent.value)
+            self.stats.add('columns_fixed', removed)
+            self.stats.add('pairs_fixed', added)
+        with self.stats.timer('branching'):
+            branches = BinaryBranch().branching(node)
+        for branch in branches:  # 结点分支定添加进入队列
+            with self.stats.timer('branching'):
+                child = branch.apply(node)
+            # 传播分支决策：不可行的子节点，以及组合下界不小于当前最佳可行解的子节点，无需求解
+            with self.stats.timer('presolve'):
+                status, _ = presolve(child, self.incumbent.value)
+            if status == INFEASIBLE:
                 if self.verbose:
-                    print(f"The node is not promising with value being {node.solution.value}")
+                    print(f"The child ({branch}) is infeasible")
+                self.stats.add('nodes_infeasible')
                 continue
-            # 2.该节点是可行解
-            if node.solution.is_integer_solution():  # 如果是整数解，比较更新结果
-                self.incumbent.update(node.solution)
-                self.ub = self.incumbent.value
+            if status == PRUNED:
                 if self.verbose:
-                    print(f"\nFind a new feasible solution, value={node.solution.value}")
-                    # print(node.rmp.data.items)
-                    # node.rmp.model.write("test.lp")
-                    # print(node.get_solution())
-
+                    print(f"The child ({branch}) is pruned by the combinatorial lower bound")
+                self.stats.add('nodes_pruned_lower_bound')
                 continue
+            self.queue.push(child)
+
+    def volume_bound(self, node, start_time):
+        """
+        :return: True表示体积算法的下界已证明当前最佳可行解最优，无需列生成
+        """
+        time_limit = None if self.time_limit is None else max(self.time_limit - (time.time() - start_time), 0)
+        volume = Volume(node, self.ub, self.stats, self.cancel, time_limit=time_limit)
+        with self.stats.timer('volume'):
+            bound = volume.solve()
+            n_columns = volume.seed()
+        self.lb = max(self.lb, math.ceil(bound - ComparisonEpsilon))
+        self.record_bound()
+        self.stats.event('volume', bound=bound, iterations=volume.iterations, columns=n_columns)
+        if self.verbose:
+            print(f"volume algorithm: bound = {bound}, {volume.iterations} iterations, {n_columns} columns added")
+        return self.lb >= self.ub
+
+    def enumerate(self, node, start_time):
+        """
+        :return: True表示枚举后的MIP已证明最优性，无需分支
+        """
+        time_limit = None if self.time_limit is None else max(self.time_limit - (time.time() - start_time), 0)
+        with self.stats.timer('enumeration'):
+            solved, n_columns, bins = solve_by_enumeration(node, self.incumbent.value, self.enumerate_limit,
+                                                           time_limit)
+        self.stats.add('enumerated_columns', n_columns)
+        self.stats.event('enumeration', columns=n_columns, solved=solved)
+        if not solved:
             if self.verbose:
-                print(f"The node should be branched, and value={node.solution.value}")
-            branches = BinaryBranch().branching(node)
-            for branch in branches:  # 结点分支定添加进入队列
-                child = branch.apply(node)
-                self.queue.push(child)
-            # assert self.queue.data[0].rmp.data.items is not self.queue.data[1].rmp.data.items
+                print(f"Enumeration stopped after {n_columns} columns, back to branching")
+            return False
+        if bins is not None:
+            self.incumbent.update(Solution(len(bins), {}, bins, [None] * len(bins)))
+            self.ub = self.incumbent.value
+            self.stats.event('incumbent', value=self.ub + self.n_fixed)
+        self.lb = self.ub
+        self.record_bound()
+        if self.verbose:
+            print(f"Enumerated {n_columns} columns, optimal value = {self.ub}")
+        return True
+
+    def reduce_columns(self, columns):
+        """
+        :param columns: [[item_id,...],...] 原实例中的列
+        :return: 约简后实例中的列，包含约简阶段已固定物品的列被跳过
+        """
+        if self.reduction is None:
+            return [sorted(c) for c in columns]
+        inverse = {item_id: k for k, item_id in self.reduction.id_map.items()}
+        return [sorted(inverse[i] for i in c) for c in columns if all(i in inverse for i in c)]
+
+    def set_initial_solution(self, bins):
+        """
+        以给定的可行解更新最佳可行解，约简阶段固定的物品从箱子中删除
+        :param bins: [[item_id,...],...] 原实例中的箱子
+        """
+        if self.reduction is not None:
+            free = set(self.reduction.id_map.values())
+            bins = [[i for i in b if i in free] for b in bins]
+        bins = [b for b in self.reduce_columns(bins) if b]
+        if self.ub is None or len(bins) < self.ub:
+            self.ub = len(bins)
+            self.incumbent = Solution(self.ub, {}, [np.array(b, dtype=np.int64) for b in bins], [None] * len(bins))
+
+    def root_columns(self, max_rc=None):
+        """
+        :param max_rc: None时返回根节点LP解中取正值的列，否则返回根节点RMP中按根节点对偶值计算的reduced cost
+                       不超过max_rc的列
+        :return: [[item_id,...],...] item id为原实例中的编号
+        """
+        root = self.root
+        if root is None or root.solution is None or not root.solution.solutions:
+            return []
+        if max_rc is None:
+            names = [name for name, v in root.solution.solutions.items()
+                     if v > ComparisonEpsilon and root.rmp.model.has_col(name)]
+        else:
+            duals = self.root_duals
+            names = [name for name in root.rmp.model.col_names()
+                     if 1 - sum(duals.get(row, 0) * v for row, v in root.rmp.model.get_col(name).items())
+                     <= max_rc + ComparisonEpsilon]
+        _, bins = root.rmp.get_bins(dict.fromkeys(names, 1))
+        id_map = self.reduction.id_map if self.reduction is not None else None
+        return [[id_map[i] for i in b.tolist()] if id_map is not None else b.tolist() for b in bins]
+
+    def restored_bins(self):
+        """
+        :return: 搜索过程中当前最佳可行解在原实例中的箱子 [[item_id,...],...]，包括约简阶段固定的箱子
+        """
+        bins = [b.tolist() for b in self.incumbent.bins]
+        return self.reduction.restore(bins) if self.reduction is not None else bins
+
+    def restore_fixed_bins(self, start_time):
+        # 目标值加上约简阶段固定的箱子数目，箱子中的item id还原为原实例中的编号
+        self.incumbent.value += self.n_fixed
+        if self.reduction is not None and self.incumbent.bins is not None:
+            self.incumbent.bins = [np.array(b, dtype=np.int64) for b in self.restored_bins()]
+            self.incumbent.columns = self.incumbent.columns + [None] * self.n_fixed
+        self.lb, self.ub = self.lb + self.n_fixed, self.ub + self.n_fixed
+        self.stats.record_bound(self.lb, self.ub)
+        # 节点存储的统计：写入磁盘与读回的节点数、写入的字节数以及驻留节点估计大小的峰值
+        spill = self.queue.get_stats()
+        for key in ('nodes_spilled', 'nodes_loaded', 'spilled_bytes'):
+            self.stats.add(key, spill[key])
+        if self.stats.enabled:
+            self.stats.counters['peak_resident_bytes'] = max(self.stats.counters['peak_resident_bytes'],
+                                                             spill['peak_resident_bytes'])
+        self.queue.close()
+        self.stats.close()
+        if self.pricing_trace is not None:
+            self.pricing_trace.close()
         end_time = time.time()
         if self.verbose:
             print(f"\nSolved {self.n_nodes} node(s) in {end_time - start_time}s\n"
                   f"objective value = {self.incumbent.value}")
+            if self.stats.enabled:
+                print(self.stats)
+
+
+def resume(file_name, verbose=True, **kwargs):
+    """
+    从断点文件恢复求解，实例从断点文件中读取，继续写入同一个断点文件
+    :param kwargs: 传给SearchTree的其他参数，例如time_limit
+    :return: 求解结束后的SearchTree
+    """
+    state = checkpoint.read(file_name)
+    instance = Instance(widths=state['instance']['widths'], capacity=state['instance']['capacity'],
+                        name=state['instance']['name'])
+    instance.set_widths(state['instance']['widths'], state['instance']['ids'])
+    kwargs.setdefault('checkpoint', file_name)
+    tree = SearchTree(instance, verbose=verbose, resume=state, reduce=state['reduce'], **kwargs)
+    tree.solve()
+    return tree
 
 
 if __name__ == '__main__':
@@ -8,10 +8,13 @@ from uti import is_integer, ComparisonEpsilon
 
 
 class Solution:
-    def __init__(self, value=None, solutions=None, model=None):
+    def __init__(self, value=None, solutions=None, bins=None, columns=None):
         self.value = value
         self.solutions = solutions
-        self.model = model
+        # 整数解中的箱子：bins = [np.ndarray,...] 每个箱子中原实例的item id，columns = [col_name,...] 对应的列
+        # 分数解不记录箱子
+        self.bins = bins
+        self.columns = columns
 
     def output_solution(self):
         pass
@@ -21,7 +24,7 @@ class Solution:
         if self.value is None or \
                 other.value < self.value + ComparisonEpsilon:
             self.value, self.solutions = other.value, other.solutions
-            self.model = other.model
+            self.bins, self.columns = other.bins, other.columns
 
     def is_integer_solution(self):
         for s in self.solutions.values():
@@ -30,7 +33,7 @@ class Solution:
         return True
 
     def __repr__(self):
-        return f"value={self.value}\nsolutions={self.solutions}"
+        return f"value={self.value}\nsolutions={self.solutions}\nbins={self.bins}"
 
 
 if __name__ == '__main__':
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 23:50
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 持久化的最优解缓存(SQLite)：以容量与排序后尺寸的哈希为键，尺寸多重集相同的实例(物品的排列)共享同一条记录
+# 记录中的箱子与根节点列以尺寸列表保存，命中时按尺寸重新分配当前实例的item id
+# 未命中时，容量相同、物品数最接近的若干条记录的根节点列作为初始列加入根节点RMP
+# 记录数超过上限时删除最久未使用的记录(LRU)，多个进程可以同时使用同一个缓存文件
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import defaultdict, Counter
+
+import numpy as np
+
+from reader import CACHE_DIR
+from searchTree import SearchTree
+from solution import Solution
+
+DEFAULT_FILE = os.path.join(CACHE_DIR, 'solutions.sqlite')
+
+
+def canonical_key(instance):
+    widths = np.sort(np.asarray(instance.widths, dtype=np.int64))
+    return hashlib.sha1(f"{instance.capacity}:".encode() + widths.astype('<i8').tobytes()).hexdigest()
+
+
+def to_widths(instance, columns):
+    """
+    :param columns: [[item_id,...],...]
+    :return: [[width,...],...] 每列的尺寸按降序排列
+    """
+    width = dict(zip(instance.ids.tolist(), instance.widths.tolist()))
+    return [sorted((width[i] for i in column), reverse=True) for column in columns]
+
+
+def to_ids(instance, patterns, disjoint=True):
+    """
+    :param patterns: [[width,...],...]
+    :param disjoint: True时不同的列使用不同的物品(箱子)，否则每列独立选择物品(初始列)
+    :return: [[item_id,...],...]，disjoint为False时跳过当前实例中物品不足的列
+    """
+    pool = defaultdict(list)  # {width: [item_id,...]}
+    for item_id, w in zip(instance.ids.tolist(), instance.widths.tolist()):
+        pool[w].append(item_id)
+    columns = []
+    if disjoint:
+        for pattern in patterns:
+            columns.append([pool[w].pop() for w in pattern])
+        return columns
+    for pattern in patterns:
+        count = Counter(pattern)
+        if all(len(pool[w]) >= c for w, c in count.items()):
+            columns.append([item_id for w, c in count.items() for item_id in pool[w][:c]])
+    return columns
+
+
+class SolutionCache:
+    def __init__(self, file_name=None, max_entries=10000, neighbors=3):
+        """
+        :param file_name: SQLite文件，默认为CACHE_DIR/solutions.sqlite
+        :param max_entries: 记录数上限
+        :param neighbors: 未命中时提供初始列的记录数
+        """
+        self.file_name = file_name if file_name is not None else DEFAULT_FILE
+        if os.path.dirname(self.file_name):
+            os.makedirs(os.path.dirname(self.file_name), exist_ok=True)
+        self.max_entries = max_entries
+        self.neighbors = neighbors
+        self.conn = sqlite3.connect(self.file_name, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, capacity INTEGER, "
+                          "n INTEGER, value INTEGER, bins TEXT, columns TEXT, used REAL)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS solutions_used ON solutions (used)")
+        self.conn.commit()
+        self.hits, self.misses = 0, 0
+
+    def get(self, instance):
+        """
+        :return: 命中时为Solution(bins为当前实例的item id)，否则为None
+        """
+        key = canonical_key(instance)
+        row = self.conn.execute("SELECT bins FROM solutions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self.conn:
+            self.conn.execute("UPDATE solutions SET used = ? WHERE key = ?", (time.time(), key))
+        bins = [np.array(b, dtype=np.int64) for b in to_ids(instance, json.loads(row[0]))]
+        return Solution(len(bins), {}, bins, [None] * len(bins))
+
+    def put(self, instance, bins, columns=()):
+        """
+        :param bins: 最优解的箱子 [[item_id,...],...]
+        :param columns: 根节点的列 [[item_id,...],...]
+        """
+        bins, columns = to_widths(instance, bins), to_widths(instance, columns)
+        columns = [list(c) for c in dict.fromkeys(tuple(c) for c in columns)]
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                              (canonical_key(instance), instance.capacity, instance.n, len(bins), json.dumps(bins),
+                               json.dumps(columns), time.time()))
+            self.conn.execute("DELETE FROM solutions WHERE key NOT IN "
+                              "(SELECT key FROM solutions ORDER BY used DESC LIMIT ?)", (self.max_entries,))
+
+    def warm_columns(self, instance):
+        """
+        :return: [[item_id,...],...] 相似实例(容量相同，物品数最接近)的根节点列中当前实例可以装出的列
+        """
+        rows = self.conn.execute("SELECT columns FROM solutions WHERE capacity = ? ORDER BY ABS(n - ?), used DESC "
+                                 "LIMIT ?", (instance.capacity, instance.n, self.neighbors)).fetchall()
+        patterns = [p for row in rows for p in json.loads(row[0])]
+        return to_ids(instance, patterns, disjoint=False)
+
+    def solve(self, instance, verbose=False, **kwargs):
+        """
+        命中时直接返回缓存的解，否则以相似实例的根节点列作为初始列求解，证明最优性后写入缓存
+        :param kwargs: 传给SearchTree的参数
+        :return: (Solution, tree)，命中时tree为None
+        """
+        solution = self.get(instance)
+        if solution is not None:
+            return solution, None
+        tree = SearchTree(instance, verbose=verbose, warm_columns=self.warm_columns(instance), **kwargs)
+        tree.solve()
+        if tree.incumbent.bins is not None and tree.lb >= tree.ub:
+            self.put(instance, [b.tolist() for b in tree.incumbent.bins], tree.root_columns())
+        return tree.incumbent, tree
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/19 15:05
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 求解过程的统计信息：各阶段计时、计数器、界的变化历史，可选地写入JSONL trace
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+import json
+import time
+
+
+class Stats:
+    """
+    timers = {name: seconds}, counters = {name: int}, series = {name: [value,...]}
+    history = [(elapsed, lb, ub),...] 下界与最佳可行解随时间的变化
+    """
+    enabled = True
+
+    def __init__(self, trace_file=None, callback=None):
+        self.start = time.perf_counter()
+        self.timers = defaultdict(float)
+        self.counters = defaultdict(int)
+        self.series = defaultdict(list)
+        self.history = []
+        self.trace = open(trace_file, 'w') if trace_file is not None else None
+        self.callback = callback  # function(record)，在求解线程中对每个事件调用
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    @contextmanager
+    def timer(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name] += time.perf_counter() - start
+
+    def add(self, name, value=1):
+        self.counters[name] += value
+
+    def append(self, name, value):
+        self.series[name].append(value)
+
+    def record_bound(self, lb, ub):
+        if self.history and self.history[-1][1:] == (lb, ub):
+            return
+        self.history.append((self.elapsed(), lb, ub))
+        self.event('bound', lb=lb, ub=ub)
+
+    def event(self, kind, **fields):
+        if self.trace is None and self.callback is None:
+            return
+        record = {'event': kind, 'time': self.elapsed(), **fields}
+        if self.trace is not None:
+            self.trace.write(json.dumps(record) + '\n')
+        if self.callback is not None:
+            self.callback(record)
+
+    def close(self):
+        if self.trace is not None:
+            self.trace.close()
+            self.trace = None
+
+    def as_dict(self):
+        return {'timers': dict(self.timers), 'counters': dict(self.counters), 'series': dict(self.series),
+                'history': list(self.history), 'elapsed': self.elapsed()}
+
+    def load(self, state):
+        """
+        从as_dict()的结果恢复，计时从保存时的累计时间继续
+        """
+        self.timers.update(state['timers'])
+        self.counters.update(state['counters'])
+        for name, values in state['series'].items():
+            self.series[name].extend(values)
+        self.history = [tuple(h) for h in state['history']]
+        self.start -= state.get('elapsed', 0)
+
+    def __repr__(self):
+        timers = ", ".join(f"{key}={value:.3f}s" for key, value in sorted(self.timers.items()))
+        counters = ", ".join(f"{key}={value}" for key, value in sorted(self.counters.items()))
+        return f"timers: {timers}\ncounters: {counters}"
+
+
+class NullStats(Stats):
+    """
+    关闭统计时使用，所有方法均为空操作
+    """
+    enabled = False
+    _null = nullcontext()
+
+    def __init__(self, trace_file=None, callback=None):
+        super().__init__()
+
+    def timer(self, name):
+        return self._null
+
+    def add(self, name, value=1):
+        pass
+
+    def append(self, name, value):
+        pass
+
+    def record_bound(self, lb, ub):
+        pass
+
+    def event(self, kind, **fields):
+        pass
+
+    def load(self, state):
+        pass
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 09:10
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 测试的公共函数：仓库根目录加入sys.path，随机小实例，暴力求解最优值以及检查装箱方案的可行性
+# 运行: python -m pytest -q
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def random_widths(seed, n_range=(8, 16), capacity_range=(20, 60)):
+    """
+    :return: (widths, capacity)，尺寸在[C/5, C/2]之间，每个箱子大约装2~4个物品
+    """
+    rng = random.Random(seed)
+    capacity = rng.randint(*capacity_range)
+    n = rng.randint(*n_range)
+    return [rng.randint(capacity // 5, capacity // 2) for _ in range(n)], capacity
+
+
+def brute_force(widths, capacity):
+    """
+    按尺寸递减依次将物品装入已有的箱子或新箱子(深度优先搜索)，只适用于很小的实例
+    :return: 最少箱子数
+    """
+    widths = sorted(widths, reverse=True)
+    best = [len(widths)]
+
+    def search(k, loads):
+        if len(loads) >= best[0]:
+            return
+        if k == len(widths):
+            best[0] = len(loads)
+            return
+        tried = set()
+        for i, load in enumerate(loads):
+            if load + widths[k] <= capacity and load not in tried:  # 装载量相同的箱子只尝试一次
+                tried.add(load)
+                loads[i] += widths[k]
+                search(k + 1, loads)
+                loads[i] -= widths[k]
+        loads.append(widths[k])
+        search(k + 1, loads)
+        loads.pop()
+
+    search(0, [])
+    return best[0]
+
+
+def check_bins(bins, widths, capacity, ids=None):
+    """
+    每个物品恰好装入一个箱子，且每个箱子不超过容量
+    :param bins: [[item_id,...],...]
+    :param ids: item id，默认为1..n
+    """
+    width = dict(zip(ids if ids is not None else range(1, len(widths) + 1), widths))
+    packed = sorted(i for b in bins for i in b)
+    assert packed == sorted(width)
+    for b in bins:
+        assert sum(width[i] for i in b) <= capacity
+
+
+if __name__ == '__main__':
+    pass
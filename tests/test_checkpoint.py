@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 11:05
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 断点文件：写入后读回内容不变，从断点恢复的求解与直接求解的最优值一致
+import gzip
+import json
+
+import pytest
+
+import checkpoint
+import searchTree
+from conftest import random_widths, check_bins
+from instance import Instance
+from searchTree import SearchTree
+from solution import Solution
+
+
+def test_write_read(tmp_path):
+    file_name = str(tmp_path / 'run.ckpt')
+    state = {'version': checkpoint.VERSION, 'queue': [{'decisions': [[1, 2, 0]], 'value': 3.5}]}
+    checkpoint.write(state, file_name)
+    assert checkpoint.read(file_name) == state
+    assert [p.name for p in tmp_path.iterdir()] == ['run.ckpt']  # 临时文件已重命名
+
+    with gzip.open(file_name, 'wt') as file:
+        json.dump({'version': checkpoint.VERSION + 1}, file)
+    with pytest.raises(ValueError):
+        checkpoint.read(file_name)
+
+
+@pytest.mark.parametrize('reduce', [True, False])
+@pytest.mark.parametrize('seed', range(4))
+def test_resume(tmp_path, seed, reduce):
+    widths, capacity = random_widths(seed, n_range=(12, 20))
+    file_name = str(tmp_path / 'run.ckpt')
+    tree = SearchTree(Instance(widths=widths, capacity=capacity), verbose=False, reduce=reduce,
+                      checkpoint=file_name)
+    tree.setup()  # 根节点尚未求解，断点文件中只有根节点
+    tree.write_checkpoint()
+    state = checkpoint.read(file_name)
+    assert state['instance']['widths'] == widths and state['reduce'] == reduce
+    assert len(state['queue']) == 1 and state['incumbent']['value'] == tree.ub
+
+    resumed = searchTree.resume(file_name, verbose=False)
+    expected = SearchTree(Instance(widths=widths, capacity=capacity), verbose=False)
+    expected.solve()
+    assert resumed.incumbent.value == resumed.lb == expected.incumbent.value
+    check_bins([b.tolist() for b in resumed.incumbent.bins], widths, capacity)
+    final = checkpoint.read(file_name)  # 求解结束时写入同一个断点文件
+    assert final['lb'] == final['ub']
+
+
+def test_incumbent_without_bins(tmp_path):
+    # 由其他进程同步得到的最佳可行解只有目标值
+    file_name = str(tmp_path / 'run.ckpt')
+    tree = SearchTree(Instance('data.txt'), verbose=False, checkpoint=file_name)
+    tree.setup()
+    tree.incumbent = Solution(tree.ub, {}, None, None)
+    tree.write_checkpoint()
+    assert checkpoint.read(file_name)['incumbent']['bins'] is None
+
+    resumed = searchTree.resume(file_name, verbose=False)
+    assert resumed.incumbent.value == resumed.lb == 18
+
+
+def test_different_instance(tmp_path):
+    file_name = str(tmp_path / 'run.ckpt')
+    tree = SearchTree(Instance(widths=[4, 5, 6], capacity=10), verbose=False, checkpoint=file_name, reduce=False)
+    tree.setup()
+    tree.write_checkpoint()
+    with pytest.raises(ValueError):
+        SearchTree(Instance(widths=[4, 5, 7], capacity=10), verbose=False, resume=file_name, reduce=False).solve()
+
+
+if __name__ == '__main__':
+    pass
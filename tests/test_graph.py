@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 10:35
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 位集合存储的冲突图：随机的加边、删点与合并操作后与边集合表示的结果一致
+import copy
+import random
+
+import pytest
+
+from graph import Graph
+from uti import iter_bits
+
+
+def edge_set(graph):
+    return {frozenset(e) for e in graph.get_all_edges()}
+
+
+def check(graph, nodes, edges):
+    # 与节点列表及边集合表示的图比较，并检查位集合与索引一致
+    assert graph.ids == nodes
+    assert graph.index == {i: k for k, i in enumerate(nodes)}
+    assert edge_set(graph) == edges
+    for k, i in enumerate(nodes):
+        assert {graph.ids[h] for h in iter_bits(graph.mask(k))} == {j for e in edges if i in e for j in e if j != i}
+        assert graph.neighbors(i) == {graph.ids[h] for h in iter_bits(graph.mask(k))}
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_operations(seed):
+    rng = random.Random(seed)
+    nodes = list(range(1, 21))
+    graph, edges = Graph(nodes), set()
+    nodes = list(nodes)
+    for _ in range(60):
+        op = rng.random()
+        if op < 0.6 or len(nodes) < 3:
+            u, v = rng.choice(nodes), rng.choice(nodes)
+            graph.add_edge(u, v)
+            if u != v:
+                edges.add(frozenset((u, v)))
+        elif op < 0.8:
+            v = rng.choice(nodes)
+            graph.remove_node(v)
+            nodes.remove(v)
+            edges = {e for e in edges if v not in e}
+        else:
+            u, v = rng.sample(nodes, 2)
+            graph.merge(u, v)
+            nodes.remove(v)
+            edges = {frozenset(u if i == v else i for i in e) for e in edges}
+            edges = {e for e in edges if len(e) == 2}
+        check(graph, nodes, edges)
+
+
+def test_add_edges_mask_and_copy():
+    graph = Graph([5, 6, 7, 8])
+    graph.add_edges_mask(0, 0b1011)  # 自环被忽略
+    assert edge_set(graph) == {frozenset((5, 6)), frozenset((5, 8))}
+    assert graph.has_edge(6, 5) and not graph.has_edge(6, 8) and not graph.has_edge(5, 9)
+    assert graph.has_node()
+
+    other = copy.copy(graph)
+    other.add_edge(6, 7)
+    other.remove_node(5)
+    assert not graph.has_edge(6, 7) and graph.has_edge(5, 6)
+    assert other.ids == [6, 7, 8] and other.has_edge(6, 7)
+    assert not Graph([1, 2]).has_node()
+
+
+def test_merge():
+    graph = Graph([1, 2, 3, 4])
+    graph.add_edges_from([(1, 2), (2, 3), (3, 4)])
+    graph.merge(1, 2)  # 1与2相邻时合并后不产生自环
+    assert graph.ids == [1, 3, 4]
+    assert edge_set(graph) == {frozenset((1, 3)), frozenset((3, 4))}
+    assert graph.mask(0) == 0b10
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 12:00
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 增量求解：修改物品后热启动的最优值与从头求解一致，item id保持不变
+import random
+
+import pytest
+
+from conftest import random_widths, check_bins
+from incremental import repair_columns, repair_bins, IncrementalSolver
+from instance import Instance
+from searchTree import SearchTree
+
+
+def optimum(widths, capacity):
+    tree = SearchTree(Instance(widths=widths, capacity=capacity), verbose=False)
+    tree.solve()
+    return tree.incumbent.value
+
+
+def check(solver, solution):
+    ids, widths = list(solver.widths), list(solver.widths.values())
+    check_bins([b.tolist() for b in solution.bins], widths, solver.capacity, ids)
+    assert solution.value == len(solution.bins) == optimum(widths, solver.capacity)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_update(seed):
+    rng = random.Random(seed)
+    widths, capacity = random_widths(seed, n_range=(14, 20))
+    solver = IncrementalSolver(Instance(widths=widths, capacity=capacity))
+    check(solver, solver.solve())
+    next_id = len(widths) + 1
+    for _ in range(3):
+        removed = rng.sample(list(solver.widths), 2)
+        changed = rng.choice([i for i in solver.widths if i not in removed])
+        added = {next_id: rng.randint(capacity // 5, capacity // 2), changed: rng.randint(1, capacity)}
+        next_id += 1
+        solution = solver.update(added=added, removed=removed)
+        assert set(removed).isdisjoint(solver.widths) and solver.widths[changed] == added[changed]
+        check(solver, solution)
+
+
+def test_repair():
+    widths = {1: 6, 2: 4, 3: 5, 5: 3, 6: 2}
+    # 去除重复的列、删除已不存在的物品4，跳过超过容量与空的列
+    assert repair_columns([[1, 2], [2, 1], [1, 4], [3, 1], [4]], widths, 10) == [[1, 2], [1]]
+    bins = repair_bins([[1, 2, 4], [3, 5, 6]], {**widths, 3: 8}, 10)  # 物品4已删除，物品3的尺寸变为8
+    check_bins(bins, [6, 4, 8, 3, 2], 10, [1, 2, 3, 5, 6])
+    assert len(bins) == 3
+
+
+def test_invalid_update():
+    solver = IncrementalSolver(Instance(widths=[4, 5, 6], capacity=10))
+    with pytest.raises(KeyError):
+        solver.update(removed=[7])
+    with pytest.raises(ValueError):
+        solver.update(added={4: 11})
+
+
+if __name__ == '__main__':
+    pass
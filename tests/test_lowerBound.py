@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 09:40
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 组合下界L1/L2/L_DFF/L3：不超过暴力求解的最优值，L2与按定义直接计算的结果一致
+import math
+
+import pytest
+
+from conftest import random_widths, brute_force
+from lowerBound import l1, l2, l_dff, l3, lower_bound
+
+
+def l2_by_definition(widths, capacity):
+    # Martello-Toth L2，对所有0 <= K <= C/2的整数K按定义计算
+    best = 0
+    for k in range(capacity // 2 + 1):
+        j1 = [w for w in widths if w > capacity - k]
+        j2 = [w for w in widths if capacity / 2 < w <= capacity - k]
+        j3 = [w for w in widths if k <= w <= capacity / 2]
+        residual = sum(j3) - (len(j2) * capacity - sum(j2))
+        best = max(best, len(j1) + len(j2) + max(0, math.ceil(residual / capacity)))
+    return best
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_bounds_are_valid(seed):
+    widths, capacity = random_widths(seed, n_range=(4, 11), capacity_range=(10, 40))
+    optimum = brute_force(widths, capacity)
+    bounds = [l1(widths, capacity), l2(widths, capacity), l_dff(widths, capacity), l3(widths, capacity)]
+    assert all(bound <= optimum for bound in bounds)
+    assert l1(widths, capacity) <= l2(widths, capacity) <= l3(widths, capacity)
+    assert lower_bound(widths, capacity, use_l3=True) == max(bounds)
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_l2_matches_definition(seed):
+    rng_widths, capacity = random_widths(seed, n_range=(5, 20), capacity_range=(10, 100))
+    widths = rng_widths + [capacity - w for w in rng_widths[:3]] + [capacity]  # 包含尺寸大于C/2的物品
+    assert l2(widths, capacity) == l2_by_definition(widths, capacity)
+
+
+def test_known_values():
+    # 三个物品都大于C/2，L1 = 2而最优值为3
+    assert l1([6, 6, 6], 10) == 2
+    assert l2([6, 6, 6], 10) == 3
+    # 每个箱子最多装两个尺寸为4的物品(K = 4时phi(4) = 1/2)，5个物品需要3个箱子
+    assert l_dff([4] * 5, 10) == 3
+    assert lower_bound([], 10) == 0
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 11:25
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 内存受限的节点存储：写入磁盘再读回的节点与不限制内存时的弹出顺序和内容一致
+import random
+from collections import namedtuple
+
+import pytest
+
+from nodeStore import NodeStore
+
+Value = namedtuple("Value", "value")
+
+
+class FakeNode:
+    def __init__(self, key, value):
+        self.key = key
+        self.solution = Value(value) if value is not None else None
+
+
+def encode(node):
+    return {'key': node.key, 'value': node.solution.value if node.solution is not None else None}
+
+
+def decode(entry):
+    return FakeNode(entry['key'], entry['value'])
+
+
+def make_store(budget, strategy):
+    return NodeStore(encode, decode, lambda node: 100, budget=budget, strategy=strategy)
+
+
+def random_operations(store, seed):
+    """
+    随机地push与pop节点
+    :return: 弹出节点的(key, value)序列
+    """
+    rng = random.Random(seed)
+    popped = []
+    for key in range(200):
+        store.push(FakeNode(key, rng.choice([None, rng.randint(0, 20) / 2])))
+        if rng.random() < 0.3:
+            node = store.pop()
+            popped.append((node.key, node.solution and node.solution.value))
+    while not store.empty():
+        node = store.pop()
+        popped.append((node.key, node.solution and node.solution.value))
+    return popped
+
+
+@pytest.mark.parametrize('strategy', ['depth', 'breadth', 'best'])
+@pytest.mark.parametrize('seed', range(3))
+def test_spill_and_reload(seed, strategy):
+    expected = random_operations(make_store(None, strategy), seed)
+    store = make_store(1000, strategy)  # 最多驻留10个节点
+    assert random_operations(store, seed) == expected
+    stats = store.get_stats()
+    assert stats['nodes_spilled'] > 0 and stats['nodes_loaded'] == stats['nodes_spilled']
+    assert stats['peak_resident_bytes'] <= 1100 and stats['resident_bytes'] == 0
+    assert len(expected) == 200
+    store.close()
+
+
+@pytest.mark.parametrize('strategy', ['depth', 'breadth', 'best'])
+def test_entries_and_take(strategy):
+    store, reference = make_store(300, strategy), make_store(None, strategy)
+    for key in range(10):
+        for s in (store, reference):
+            s.push(FakeNode(key, key % 4 / 2))
+    assert store.get_stats()['nodes_spilled'] == 7
+    assert store.entries() == reference.entries()
+    assert store.lower_bound() == reference.lower_bound() == 0
+    assert store.take(4) == reference.take(4)
+    assert len(store) == 6
+    assert [store.pop().key for _ in range(6)] == [reference.pop().key for _ in range(6)]
+    assert store.lower_bound() is None
+    store.close()
+
+
+if __name__ == '__main__':
+    pass
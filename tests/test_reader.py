@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 10:15
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 多格式实例读取：各文本格式、压缩文件、归档、目录与二进制缓存
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+import reader
+from instance import Instance, load_instances
+
+DATA_TXT = "capacity, n\r\n100\t4\r\n\r\nweight\r\n60\r\n50\r\n30\r\n20\r\n"
+BPPLIB = "5\n100\n60\n50\n30\n20\n20\n"
+BPPLIB_PAIRS = "3\n100\n60 1\n30 2\n20 3\n"
+OR_LIBRARY = " 2\n u120_00\n 150 3 2\n 100\n 80\n 70\n u120_01\n 150.0 2 1\n 42\n 99\n"
+
+
+def widths_of(records):
+    return [(name, capacity, list(widths)) for name, capacity, widths in records]
+
+
+def test_parse_formats():
+    assert widths_of(reader.parse_text(DATA_TXT, 'a')) == [('a', 100, [60, 50, 30, 20])]
+    assert widths_of(reader.parse_text(BPPLIB, 'b')) == [('b', 100, [60, 50, 30, 20, 20])]
+    assert widths_of(reader.parse_text(BPPLIB_PAIRS, 'c')) == [('c', 100, [60, 30, 30, 20, 20, 20])]
+    assert widths_of(reader.parse_text(OR_LIBRARY)) == [('u120_00', 150, [100, 80, 70]), ('u120_01', 150, [42, 99])]
+    assert reader.parse_text("") == []
+
+
+def test_float_widths():
+    assert widths_of(reader.parse_text("2\n10\n4.0\n6\n", 'd')) == [('d', 10, [4, 6])]
+    with pytest.raises(ValueError):
+        reader.parse_text("2\n10\n4.5\n6\n")
+
+
+@pytest.mark.parametrize('ext, opener', [('.gz', gzip.open), ('.bz2', bz2.open), ('.xz', lzma.open)])
+def test_compressed(tmp_path, ext, opener):
+    file_name = str(tmp_path / f"inst{ext}")
+    with opener(file_name, 'wt') as file:
+        file.write(BPPLIB)
+    assert widths_of(reader.read_file(file_name)) == [('inst', 100, [60, 50, 30, 20, 20])]
+
+
+def test_archives(tmp_path):
+    zip_name = str(tmp_path / 'set.zip')
+    with zipfile.ZipFile(zip_name, 'w') as archive:
+        archive.writestr('b.txt', BPPLIB_PAIRS)
+        archive.writestr('a.txt', BPPLIB)
+    assert [name for name, _, _ in reader.read_file(zip_name)] == ['set.zip/a.txt', 'set.zip/b.txt']
+
+    tar_name = str(tmp_path / 'set.tar.gz')
+    with tarfile.open(tar_name, 'w:gz') as archive:
+        data = OR_LIBRARY.encode()
+        info = tarfile.TarInfo('binpack1.txt')
+        info.size = len(data)
+        archive.addfile(info, io.BytesIO(data))
+    assert [name for name, _, _ in reader.read_file(tar_name)] == ['u120_00', 'u120_01']
+
+
+def test_read_all(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'b.txt').write_text(BPPLIB)
+    (tmp_path / 'a.txt').write_text(DATA_TXT)
+    names = [name for name, _, _ in reader.read_all(str(tmp_path))]
+    assert names == ['a.txt', 'b.txt']
+    assert [name for name, _, _ in reader.read_all(str(tmp_path / '**' / 'b.*'))] == ['b.txt']
+    instances = list(load_instances(str(tmp_path)))
+    assert [instance.n for instance in instances] == [4, 5]
+
+
+def test_cache(tmp_path, monkeypatch):
+    file_name = str(tmp_path / 'set.txt')
+    with open(file_name, 'w') as file:
+        file.write(OR_LIBRARY)
+    cache_dir = str(tmp_path / 'cache')
+    records = reader.read_file(file_name, cache=True, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 2  # .npy与.json
+    cached = reader.read_file(file_name, cache=True, cache_dir=cache_dir)
+    assert widths_of(cached) == widths_of(records)
+    assert not cached[0][2].flags.writeable  # 内存映射数组
+    # Instance复制尺寸，可以原地修改
+    monkeypatch.setattr(reader, 'CACHE_DIR', cache_dir)
+    instance = Instance(file_name, cache=True)
+    assert instance.name == 'u120_00'
+    instance.widths[0] += 1
+
+    with open(file_name, 'a') as file:  # 文件变化后缓存失效
+        file.write(' ')
+    os.utime(file_name, ns=(0, 0))
+    reader.read_file(file_name, cache=True, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 4
+
+
+def test_instance_from_file():
+    instance = Instance('data.txt')
+    assert (instance.capacity, instance.n) == (1000, 50)
+    assert instance.ids.tolist() == list(range(1, 51))
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 09:55
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# MTRP约简：固定的箱子加上剩余物品的最优值等于原实例的最优值，restore还原为原实例的可行解
+import pytest
+
+from conftest import random_widths, brute_force, check_bins
+from instance import Instance
+from reduction import mtrp, Reduction
+
+
+@pytest.mark.parametrize('subset_sum', [True, False])
+@pytest.mark.parametrize('seed', range(30))
+def test_mtrp_preserves_optimum(seed, subset_sum):
+    widths, capacity = random_widths(seed, n_range=(4, 10), capacity_range=(10, 40))
+    widths += [capacity - widths[0], capacity * 3 // 4]  # 恰好装满的一对与只能单独装箱的物品
+    fixed, free = mtrp(widths, capacity, subset_sum)
+    assert sorted([i for b in fixed for i in b] + free) == list(range(len(widths)))
+    assert all(sum(widths[i] for i in b) <= capacity for b in fixed)
+    assert [widths[i] for i in free] == sorted(widths[i] for i in free)
+    assert len(fixed) + brute_force([widths[i] for i in free], capacity) == brute_force(widths, capacity)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_restore(seed):
+    widths, capacity = random_widths(seed, n_range=(6, 12), capacity_range=(10, 40))
+    widths += [capacity - widths[0]]
+    ids = [10 * (k + 1) for k in range(len(widths))]
+    instance = Instance(widths=widths, capacity=capacity)
+    instance.set_widths(widths, ids)
+    reduction = Reduction(instance)
+    reduced = reduction.reduce()
+    assert reduced.ids.tolist() == list(range(1, reduced.n + 1))
+    assert sorted(reduction.id_map.values()) == sorted(set(ids) - {i for b in reduction.fixed_bins for i in b})
+    # 约简后实例每个物品单独装箱，还原后为原实例的可行解
+    bins = reduction.restore([[i] for i in reduced.ids.tolist()])
+    check_bins(bins, widths, capacity, ids)
+    assert len(bins) == reduced.n + len(reduction.fixed_bins)
+
+
+def test_fixed_bins():
+    # 9无法与其他物品装入同一箱子，7与3恰好装满，剩余的4、3、2可以装入同一箱子，不能固定
+    widths = [3, 9, 7, 4, 3, 2]
+    fixed, free = mtrp(widths, 10)
+    assert sorted(sorted(widths[i] for i in b) for b in fixed) == [[3, 7], [9]]
+    assert [widths[i] for i in free] == [2, 3, 4]
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 09:20
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 端到端测试：随机小实例上分支定价的最优值与arc-flow模型一致，装箱方案可行
+import pytest
+
+from arcFlow import ArcFlow
+from conftest import random_widths, brute_force, check_bins
+from instance import Instance
+from searchTree import SearchTree
+
+CONFIGS = [
+    {},
+    {'reduce': False, 'add_cuts': False, 'strategy': 'best'},
+    {'pricing': 'model', 'rc_fixing': False, 'enumerate_limit': None},
+]
+
+
+@pytest.mark.parametrize('config', CONFIGS)
+@pytest.mark.parametrize('seed', range(8))
+def test_optimum_matches_arc_flow(seed, config):
+    widths, capacity = random_widths(seed)
+    tree = SearchTree(Instance(widths=widths, capacity=capacity), verbose=False, **config)
+    tree.solve()
+    af = ArcFlow(Instance(widths=widths, capacity=capacity), verbose=False)
+    af.solve()
+
+    assert tree.incumbent.value == af.incumbent.value
+    assert tree.lb == tree.ub == tree.incumbent.value
+    assert len(tree.incumbent.bins) == tree.incumbent.value
+    check_bins([b.tolist() for b in tree.incumbent.bins], widths, capacity)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_arc_flow_matches_brute_force(seed):
+    widths, capacity = random_widths(seed, n_range=(6, 10))
+    af = ArcFlow(Instance(widths=widths, capacity=capacity), verbose=False)
+    af.solve()
+    assert af.incumbent.value == brute_force(widths, capacity)
+
+
+def test_data_file():
+    tree = SearchTree(Instance('data.txt'), verbose=False)
+    tree.solve()
+    assert tree.incumbent.value == 18
+    check_bins([b.tolist() for b in tree.incumbent.bins], tree.instance.widths.tolist(), tree.instance.capacity,
+               tree.instance.ids.tolist())
+
+
+if __name__ == '__main__':
+    pass
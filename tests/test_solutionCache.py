@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 11:40
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 最优解缓存：物品的排列命中同一条记录，箱子按尺寸分配当前实例的item id，相似实例得到初始列，LRU淘汰
+import random
+
+from conftest import random_widths, check_bins
+from instance import Instance
+from solutionCache import SolutionCache
+
+
+def permuted(widths, capacity, seed):
+    # 打乱物品顺序并使用不同的item id
+    rng = random.Random(seed)
+    widths = list(widths)
+    rng.shuffle(widths)
+    ids = rng.sample(range(100, 1000), len(widths))
+    instance = Instance(widths=widths, capacity=capacity)
+    instance.set_widths(widths, ids)
+    return instance, widths, ids
+
+
+def test_hit_after_solve(tmp_path):
+    widths, capacity = random_widths(0, n_range=(14, 14))
+    cache = SolutionCache(str(tmp_path / 'cache.sqlite'))
+    instance = Instance(widths=widths, capacity=capacity)
+    assert cache.get(instance) is None
+    solution, tree = cache.solve(instance)
+    assert tree is not None and len(cache) == 1
+
+    other, other_widths, ids = permuted(widths, capacity, 1)
+    hit, tree = cache.solve(other)
+    assert tree is None and hit.value == solution.value
+    check_bins([b.tolist() for b in hit.bins], other_widths, capacity, ids)
+    assert (cache.hits, cache.misses) == (1, 2)
+    cache.close()
+
+    cache = SolutionCache(str(tmp_path / 'cache.sqlite'))  # 记录保存在文件中
+    assert cache.get(instance).value == solution.value
+    cache.close()
+
+
+def test_warm_columns(tmp_path):
+    widths, capacity = random_widths(3, n_range=(16, 16), capacity_range=(40, 80))
+    cache = SolutionCache(str(tmp_path / 'cache.sqlite'))
+    _, tree = cache.solve(Instance(widths=widths, capacity=capacity))
+    assert tree.n_nodes == 1  # 根节点求解了LP，记录中保存根节点列
+    # 删除两个物品后未命中，相似实例的根节点列中能够装出的列作为初始列
+    instance, other_widths, ids = permuted(widths[:-2], capacity, 3)
+    assert cache.get(instance) is None
+    columns = cache.warm_columns(instance)
+    assert columns
+    width = dict(zip(ids, other_widths))
+    for column in columns:
+        assert len(set(column)) == len(column) and set(column) <= set(ids)
+        assert sum(width[i] for i in column) <= capacity
+    solution, tree = cache.solve(instance)
+    assert tree.stats.as_dict()['counters']['warm_columns'] > 0
+    check_bins([b.tolist() for b in solution.bins], other_widths, capacity, ids)
+    cache.close()
+
+
+def test_eviction(tmp_path):
+    cache = SolutionCache(str(tmp_path / 'cache.sqlite'), max_entries=2)
+    instances = [Instance(widths=[4, 5, 6 + k], capacity=10) for k in range(3)]
+    for instance in instances:
+        cache.put(instance, [[1], [2], [3]])
+    assert cache.get(instances[1]) is not None
+    cache.put(instances[2], [[1], [2], [3]])  # instances[0]最久未使用
+    assert len(cache) == 2
+    assert cache.get(instances[0]) is None
+    cache.close()
+
+
+if __name__ == '__main__':
+    pass
@@ -19,6 +19,17 @@ def is_integer(num):
     return False
 
 
+def iter_bits(mask):
+    """
+    :param mask: 以python整数表示的位集合
+    :return: generator of 所有为1的位的索引(升序)
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
 class Status(IntEnum):
     LOADED = 1
     OPTIMAL = 2
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Time : 2026/10/20 01:50
+# Author: Zheng Shaoxiang
+# @Email : zhengsx95@163.com
+# Description:
+# 体积算法(volume algorithm, Barahona & Anbil 2000)求解根节点的Lagrangian对偶，不使用LP求解器，定价问题作为oracle
+# 松弛覆盖约束 sum_p a_ip x_p >= 1 (对偶值pi >= 0)，箱子数不超过K(上界):
+#   L(pi) = sum(pi) + K * min(0, rc*)，rc* = min_p (1 - pi a_p)由定价问题精确求得
+# 同时计算Farley下界 sum(pi) / (1 - min(0, rc*))，(pi / (1 - min(0, rc*))为对偶可行解)，两者均为LP松弛的有效下界
+# 原始解近似为各次定价所得列的凸组合x_bar，以g = 1 - A x_bar为方向(次梯度的加权平均)，步长 s = lambda * (target - L) / ||g||^2
+# 节点没有冲突边时定价问题为0-1背包问题，以动态规划求解(容量较大时缩放尺寸，得到价值的上界)，否则使用节点的定价问题(label setting或模型)
+# 结束后x_bar中取正值的列(以及定价返回的其他列)加入RMP，作为精确列生成的初始列
+# 用法: python volume.py data.txt  (只计算上下界，不求解LP)
+import argparse
+import math
+import sys
+import time
+
+import numpy as np
+
+from heuristic import first_fit_decreasing
+from instance import Instance
+from solverStats import NullStats
+from uti import ComparisonEpsilon
+
+KNAPSACK_CELLS = 2 * 10 ** 6  # 动态规划回溯表的单元数上限
+
+
+def knapsack(values, widths, capacity, max_cells=KNAPSACK_CELLS):
+    """
+    0-1背包问题的动态规划，复杂度O(n * C)，每个物品一次向量运算
+    回溯表n * (C + 1)超过max_cells时，尺寸与容量除以s后向下取整：原问题的可行解在缩放后仍然可行，
+    所得价值为最大价值的上界(reduced cost的下界，Lagrangian与Farley下界仍然有效)；
+    装入的物品按原尺寸超过容量时，依次取出价值与尺寸之比最小的物品
+    :return: (最大价值，缩放时为上界, [index,...] 按原尺寸可行的装入物品)
+    """
+    n = len(widths)
+    scale = max(1, -(-n * (capacity + 1) // max_cells))
+    scaled, cap = widths // scale, capacity // scale
+    best = np.zeros(cap + 1)  # best[c]: 总尺寸不超过c时的最大价值
+    keep = np.zeros((n, cap + 1), dtype=bool)
+    for k, (v, w, sw) in enumerate(zip(values.tolist(), widths.tolist(), scaled.tolist())):
+        if v <= 0 or w > capacity:
+            continue
+        candidate = best[:cap + 1 - sw] + v
+        improve = candidate > best[sw:]
+        keep[k, sw:] = improve
+        best[sw:] = np.where(improve, candidate, best[sw:])
+    packed, c = [], cap
+    for k in range(n - 1, -1, -1):
+        if keep[k, c]:
+            packed.append(k)
+            c -= int(scaled[k])
+    packed = packed[::-1]
+    load = sum(int(widths[k]) for k in packed)
+    while load > capacity:
+        k = min(packed, key=lambda h: values[h] / widths[h])
+        packed.remove(k)
+        load -= int(widths[k])
+    return float(best[cap]), packed
+
+
+class Volume:
+    def __init__(self, node, ub=None, stats=None, cancel=None, max_iterations=1000, tolerance=0.001, window=100,
+                 alpha=0.1, step=0.1, target_gap=0.05, time_limit=None):
+        """
+        :param node: 节点，只使用其RMP的物品、冲突图与定价问题，不求解LP
+        :param ub: 箱子数的上界K，下界向上取整后达到ub时停止，默认为first-fit decreasing的箱子数
+        :param tolerance: 最近window次迭代中L(pi)的相对改进不超过tolerance时停止
+        :param alpha: 近似原始解中新列的权重
+        :param step: 初始的步长参数lambda
+        :param target_gap: 步长的目标值为当前最好的L(pi)乘以(1 + target_gap)
+        """
+        self.node = node
+        self.rmp = node.rmp
+        self.stats = stats if stats is not None else NullStats()
+        self.cancel = cancel
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.window = window
+        self.alpha = alpha
+        self.step = step
+        self.target_gap = target_gap
+        self.time_limit = time_limit
+        data = self.rmp.data
+        self.ub = ub if ub is not None else len(first_fit_decreasing(data.widths.tolist(), data.capacity,
+                                                                     data.order.tolist()))
+        self.iterations = 0
+        self.bound = 0  # 最好的有效下界
+        self.primal = None  # 近似原始解的目标值
+        self.columns = {}  # {tuple(coe): x_bar} 近似原始解
+        self.pool = {}  # {tuple(coe): None} 定价问题返回的所有列
+
+    def price(self, pi):
+        """
+        :return: (min(rc*, 0), 最优列的系数(label setting只返回reduced cost为负的列), 返回的所有列)
+        """
+        data = self.rmp.data
+        if not self.rmp.graph.has_node():  # 没有冲突边时定价问题为0-1背包问题，以动态规划求解
+            with self.stats.timer('pricing.knapsack'):
+                value, packed = knapsack(pi, data.widths, data.capacity)
+            rc = min(1 - value, 0)
+            if not packed:
+                return rc, None, []
+            exact = [0] * len(pi)
+            for k in packed:
+                exact[k] = 1
+            coe = self.rmp.get_column_coe(exact)
+            return rc, coe, [coe]
+        sr = [0.0] * (len(self.rmp.sr) if self.rmp.sr is not None else 0)
+        with self.stats.timer(f'pricing.{self.rmp.pricing.engine}'):
+            self.rmp.optimize_pricing(pi.tolist(), sr)
+        for key, value in self.rmp.pricing.get_counters().items():
+            self.stats.add(key, value)
+        coe = self.rmp.get_pricing_coe()
+        rc = min(self.rmp.get_reduced_cost(), 0)
+        return rc, (coe[0] if coe and rc < 0 else None), coe
+
+    def solve(self):
+        """
+        :return: 有效下界(LP松弛)
+        """
+        start = time.time()
+        data = self.rmp.data
+        n, K = data.n, self.ub
+        pi = 0.5 * data.widths / data.capacity
+        self.bound = float(data.widths.sum() / data.capacity)  # 连续松弛的L1
+        l_best, last = -math.inf, -math.inf
+        x_bar = None  # 覆盖量 A x_bar
+        lamb, n_red = self.step, 0
+        for self.iterations in range(1, self.max_iterations + 1):
+            if self.cancel is not None and self.cancel.is_set():
+                break
+            if self.time_limit is not None and time.time() - start > self.time_limit:
+                break
+            rc, best, coe = self.price(pi)
+            self.pool.update(dict.fromkeys(tuple(c) for c in coe))
+            value = pi.sum() + K * rc
+            self.bound = max(self.bound, value, pi.sum() / (1 - rc))
+
+            # 原始解: 箱子数为K的最优列(rc < 0)或空解，与x_bar凸组合
+            x = np.zeros(n)
+            weight = 1 if x_bar is None else self.alpha
+            self.columns = {c: (1 - weight) * v for c, v in self.columns.items()}
+            if best is not None and rc < 0:
+                x = K * np.array(best[:n], dtype=float)
+                self.columns[tuple(best)] = self.columns.get(tuple(best), 0) + weight * K
+            x_bar = x if x_bar is None else weight * x + (1 - weight) * x_bar
+
+            # 步长参数: 连续多次L(pi)未改进时减半
+            if value > l_best:
+                l_best, n_red = value, 0
+            else:
+                n_red += 1
+                if n_red >= 10:
+                    lamb, n_red = lamb / 2, 0
+            if math.ceil(self.bound - ComparisonEpsilon) >= self.ub or lamb < 1e-4:
+                break
+            if self.iterations % self.window == 0:  # 最近window次迭代L(pi)的相对改进小于tolerance时停止
+                if l_best - last <= self.tolerance * abs(l_best):
+                    break
+                last = l_best
+            g = 1 - x_bar
+            norm = float(g @ g)
+            if norm <= ComparisonEpsilon:
+                break
+            target = max(l_best, 1) * (1 + self.target_gap)
+            pi = np.maximum(pi + lamb * (target - value) / norm * g, 0)
+        self.primal = sum(self.columns.values())
+        self.stats.add('volume_iterations', self.iterations)
+        return self.bound
+
+    def seed(self, min_value=ComparisonEpsilon):
+        """
+        将近似原始解中取正值的列以及定价返回的列加入节点的RMP
+        :return: 加入的列数
+        """
+        coe = [list(c) for c in dict.fromkeys(
+            [c for c, v in self.columns.items() if v > min_value] + list(self.pool))]
+        if coe:
+            self.node.update_param(coe)
+            self.rmp.add_col(coe)
+        return len(coe)
+
+
+def estimate(instance, tolerance=0.001, max_iterations=1000, verbose=False, **kwargs):
+    """
+    快速估计：约简与初始可行解之后，只在根节点运行体积算法，不求解LP
+    :param kwargs: 传给SearchTree的参数
+    :return: {'lb': 有效下界, 'ub': 可行解的箱子数, 'lp': 根节点LP下界的估计值, 'iterations', 'time'}
+    """
+    from searchTree import SearchTree
+
+    start = time.time()
+    tree = SearchTree(instance, verbose=verbose, **kwargs)
+    if not tree.setup(push_root=False):
+        n = tree.n_fixed  # 所有物品均已固定
+        return {'lb': n, 'ub': n, 'lp': n, 'iterations': 0, 'time': time.time() - start}
+    volume = Volume(tree.root, tree.ub, tree.stats, tolerance=tolerance, max_iterations=max_iterations)
+    bound = volume.solve()
+    lb = max(tree.lb, math.ceil(bound - ComparisonEpsilon))
+    return {'lb': lb + tree.n_fixed, 'ub': tree.ub + tree.n_fixed, 'lp': float(bound) + tree.n_fixed,
+            'iterations': volume.iterations, 'time': time.time() - start}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Quick lower and upper bounds without solving any LP")
+    parser.add_argument('file', help="instance file, see reader")
+    parser.add_argument('--tolerance', type=float, default=0.001)
+    parser.add_argument('--max-iterations', type=int, default=1000)
+    parser.add_argument('--backend', default=None, help="LP backend of the initial heuristic, see lpBackend.BACKENDS")
+    args = parser.parse_args(argv)
+
+    result = estimate(Instance(args.file), args.tolerance, args.max_iterations, backend=args.backend)
+    print(f"lower bound = {result['lb']}, upper bound = {result['ub']}, LP estimate = {result['lp']:.4f}, "
+          f"iterations = {result['iterations']}, time = {result['time']:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())